@@ -0,0 +1,46 @@
+"""
+Compares the failure path cost of the raising `requires_*` mode with the non-raising `check_*` mode.
+
+Usage: python benchmarks/bench_check_mode.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.condition import Condition
+from src.errors.argument_error import ArgumentError
+
+
+NUMBER = 200000
+
+
+def raising_failure():
+    try:
+        Condition.requires_num(150, 'value').is_greater_than(0).is_less_than(100)
+    except ArgumentError:
+        pass
+
+
+def check_failure():
+    Condition.check_num(150, 'value').is_greater_than(0).is_less_than(100).result()
+
+
+def raising_success():
+    Condition.requires_num(50, 'value').is_greater_than(0).is_less_than(100)
+
+
+def check_success():
+    Condition.check_num(50, 'value').is_greater_than(0).is_less_than(100).result()
+
+
+if __name__ == '__main__':
+    for name, function in [
+        ('raising, failure', raising_failure),
+        ('check,   failure', check_failure),
+        ('raising, success', raising_success),
+        ('check,   success', check_success)
+    ]:
+        seconds = min(timeit.repeat(function, number=NUMBER, repeat=5))
+        print(f'{name}: {seconds / NUMBER * 1e9:8.1f} ns per chain')
@@ -0,0 +1,43 @@
+"""
+Compares the one-shot functions of `fast` with the equivalent fluent chains, on passing values.
+
+Usage: python benchmarks/bench_fast.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import fast
+from src.condition import Condition
+
+
+NUMBER = 1000000
+
+
+def fluent_in_range():
+    Condition.requires_num(50, 'value').is_in_range(0, 100)
+
+
+def fast_in_range():
+    fast.require_in_range(50, 0, 100, 'value')
+
+
+def fluent_not_null_or_whitespace():
+    Condition.requires_str('value', 'value').is_not_null_or_whitespace()
+
+
+def fast_not_null_or_whitespace():
+    fast.require_not_null_or_whitespace('value', 'value')
+
+
+if __name__ == '__main__':
+    for name, function in [
+        ('fluent is_in_range', fluent_in_range),
+        ('fast require_in_range', fast_in_range),
+        ('fluent is_not_null_or_whitespace', fluent_not_null_or_whitespace),
+        ('fast require_not_null_or_whitespace', fast_not_null_or_whitespace)
+    ]:
+        seconds = min(timeit.repeat(function, number=NUMBER, repeat=5))
+        print(f'{name:<35}: {seconds / NUMBER * 1e9:6.1f} ns per call')
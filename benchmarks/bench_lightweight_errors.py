@@ -0,0 +1,119 @@
+"""
+Compares the cost of raising and catching a failed condition, the memory retained by each kept error, the
+objects each discarded error leaves to the cycle collector and whether its traceback pins the failing value,
+with full and lightweight errors.
+
+Lightweight errors are asserted to keep only the caller and the failed condition on their traceback, which Python
+always records, plus the internal failure frame before Python 3.11, and to pin no value through it. Raising and
+catching costs about the same in both modes, as building the error dominates; the savings are in retained memory.
+
+Usage: python benchmarks/bench_lightweight_errors.py
+"""
+import gc
+import os
+import sys
+import timeit
+import traceback
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.condition import Condition
+from src.errors.argument_error import ArgumentError
+
+
+NUMBER = 50000
+COUNT = 10000
+
+
+def fail() -> ArgumentError:
+    try:
+        Condition.requires_num(150, 'age').is_in_range(0, 100)
+    except ArgumentError as error:
+        return error
+
+
+def handled_fail() -> ArgumentError:
+    try:
+        {}['missing']
+    except KeyError:
+        return fail()
+
+
+def retained_bytes() -> float:
+    errors = [None] * COUNT
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    for index in range(COUNT):
+        errors[index] = handled_fail()
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / COUNT
+
+
+def cyclic_objects() -> float:
+    gc.collect()
+    gc.disable()
+
+    for _ in range(COUNT):
+        handled_fail()
+
+    collected = gc.collect()
+    gc.enable()
+
+    return collected / COUNT
+
+
+def pinned_bytes() -> int:
+    value = 'x' * 10_000_000
+
+    try:
+        Condition.requires_str(value, 'name').is_shorter_than(10)
+    except ArgumentError as error:
+        frames = [frame for frame, _ in traceback.walk_tb(error.__traceback__)][1:]
+
+    locals_ = [local for frame in frames for local in frame.f_locals.values()]
+    pinned = any(local is value or getattr(local, 'value', None) is value for local in locals_)
+
+    return len(value) if pinned else 0
+
+
+def traceback_depth(error: ArgumentError) -> int:
+    depth = 0
+    traceback = error.__traceback__
+
+    while traceback is not None:
+        depth += 1
+        traceback = traceback.tb_next
+
+    return depth
+
+
+if __name__ == '__main__':
+    for name, lightweight in [('full       ', False), ('lightweight', True)]:
+        Condition.use_lightweight_errors(lightweight)
+
+        duration = min(timeit.repeat(fail, number=NUMBER, repeat=5))
+
+        memory = retained_bytes()
+        cyclic = cyclic_objects()
+        depth = traceback_depth(fail())
+        pinned = pinned_bytes()
+
+        print(
+            f'{name}: {duration / NUMBER * 1e9:6.0f} ns per raise and catch, '
+            f'{memory:6.0f} bytes retained per error, '
+            f'{depth} traceback entries, '
+            f'{pinned} bytes pinned by the traceback, '
+            f'{cyclic:.0f} objects left to the cycle collector per discarded error'
+        )
+
+        if lightweight:
+            assert depth == (2 if sys.version_info >= (3, 11) else 3)
+            assert pinned == 0
+
+    Condition.use_lightweight_errors(False)
@@ -0,0 +1,73 @@
+"""
+Measures the bytes allocated per validator and per error with tracemalloc, comparing the `__slots__` layout
+with an equivalent `__dict__` layout.
+
+Usage: python benchmarks/bench_memory.py
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.errors.argument_out_of_range_error import ArgumentOutOfRangeError
+from src.validators.number_validator import NumberValidator
+
+
+COUNT = 100000
+
+
+class DictValidator:
+    """
+    Validator with a per-instance `__dict__`, laid out as before the `__slots__` change.
+    """
+
+    def __init__(self, value, argument_name):
+        self.value = value
+        self.argument_name = argument_name
+
+
+class DictArgumentOutOfRangeError(Exception):
+    """
+    Out of range error with a per-instance `__dict__`, laid out as before the `__slots__` change.
+    """
+
+    def __init__(self, message, value, argument_name, equal_to=None, min_value=None, max_value=None, message_args=None):
+        super().__init__()
+        self.value = value
+        self.argument_name = argument_name
+        self.message_template = message
+        self.message_args = message_args
+        self._message = None
+        self.equal_to = equal_to
+        self.min_value = min_value
+        self.max_value = max_value
+
+
+def bytes_per_instance(factory) -> float:
+    instances = [None] * COUNT
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    for index in range(COUNT):
+        instances[index] = factory(index)
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / COUNT
+
+
+def error(error_type, index):
+    return error_type('{argument_name} out of range', index, 'value', min_value=0, max_value=10, message_args={})
+
+
+if __name__ == '__main__':
+    for name, factory in [
+        ('NumberValidator, __dict__        ', lambda index: DictValidator(index, 'value')),
+        ('NumberValidator, __slots__       ', lambda index: NumberValidator(index, 'value')),
+        ('ArgumentOutOfRangeError, __dict__ ', lambda index: error(DictArgumentOutOfRangeError, index)),
+        ('ArgumentOutOfRangeError, __slots__', lambda index: error(ArgumentOutOfRangeError, index))
+    ]:
+        print(f'{name}: {bytes_per_instance(factory):6.1f} bytes per instance')
@@ -0,0 +1,53 @@
+"""
+Compares a switched off `ensures_num` chain with a bare function call and with the switched on chain.
+
+A switched off entry point is not free: it is a Python call which allocates a no-op validator holding the value, so
+`get_value()` still works. Measured here it costs about 270-290 ns against 80 ns for a bare call and 630-730 ns for
+the switched on entry point, and every skipped condition of a chain adds about 100 ns.
+
+Usage: python benchmarks/bench_noop.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.condition import Condition
+
+
+NUMBER = 1000000
+
+
+def bare(value, argument_name):
+    return value
+
+
+def bare_call():
+    bare(50, 'value')
+
+
+def ensures():
+    Condition.ensures_num(50, 'value')
+
+
+def ensures_chain():
+    Condition.ensures_num(50, 'value').is_greater_than(0)
+
+
+if __name__ == '__main__':
+    results = [('bare function call        ', bare_call)]
+
+    Condition.enable('ensures')
+    results.append(('enabled ensures_num       ', ensures))
+    results.append(('enabled ensures_num chain ', ensures_chain))
+
+    for name, function in results:
+        seconds = min(timeit.repeat(function, number=NUMBER, repeat=5))
+        print(f'{name}: {seconds / NUMBER * 1e9:6.1f} ns per call')
+
+    Condition.disable('ensures')
+
+    for name, function in [('disabled ensures_num      ', ensures), ('disabled ensures_num chain', ensures_chain)]:
+        seconds = min(timeit.repeat(function, number=NUMBER, repeat=5))
+        print(f'{name}: {seconds / NUMBER * 1e9:6.1f} ns per call')
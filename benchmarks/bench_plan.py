@@ -0,0 +1,32 @@
+"""
+Compares a fluent `requires_num` chain with the equivalent compiled validation plan.
+
+Usage: python benchmarks/bench_plan.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.condition import Condition
+
+
+NUMBER = 500000
+
+
+plan = Condition.plan_num('value').is_greater_than(0).is_less_than(100).compile()
+
+
+def fluent():
+    Condition.requires_num(50, 'value').is_greater_than(0).is_less_than(100)
+
+
+def compiled():
+    plan(50)
+
+
+if __name__ == '__main__':
+    for name, function in [('fluent  ', fluent), ('compiled', compiled)]:
+        seconds = min(timeit.repeat(function, number=NUMBER, repeat=5))
+        print(f'{name}: {seconds / NUMBER * 1e9:8.1f} ns per call')
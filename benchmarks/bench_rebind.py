@@ -0,0 +1,39 @@
+"""
+Compares validating a stream of values with a new validator per value, a pooled validator and a rebound validator.
+
+Usage: python benchmarks/bench_rebind.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.condition import Condition
+
+
+VALUES = list(range(100)) * 100
+
+
+validator = Condition.requires_num(0, 'value')
+
+
+def created():
+    for value in VALUES:
+        Condition.requires_num(value, 'value').is_in_range(0, 100)
+
+
+def pooled():
+    for value in VALUES:
+        Condition.pooled_num(value, 'value').is_in_range(0, 100)
+
+
+def rebound():
+    for value in VALUES:
+        validator.rebind(value).is_in_range(0, 100)
+
+
+if __name__ == '__main__':
+    for name, function in [('created', created), ('pooled ', pooled), ('rebound', rebound)]:
+        seconds = min(timeit.repeat(function, number=10, repeat=5)) / 10
+        print(f'{name}: {seconds / len(VALUES) * 1e9:6.1f} ns per value')
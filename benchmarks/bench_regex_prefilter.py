@@ -0,0 +1,33 @@
+"""
+Compares running a cached pattern on values it cannot match, with and without the literal prefilter of
+`RegexHelper.is_match`, which rejects them before the regex engine is entered.
+
+Usage: python benchmarks/bench_regex_prefilter.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.helpers.regex_helper import RegexHelper
+
+
+NUMBER = 200000
+
+
+CASES = [
+    ('prefix    ', r'^INV-\d{8}$', 'ORD-12345678'),
+    ('substring ', r'.*@example\.com$', 'someone.with.a.long.name@example.org'),
+    ('long value', r'[\w.]*@example\.com$', 'a.' * 1000 + '@example.org'),
+    ('match     ', r'^INV-\d{8}$', 'INV-12345678')
+]
+
+
+if __name__ == '__main__':
+    for name, pattern, value in CASES:
+        unfiltered = min(timeit.repeat(lambda: RegexHelper.compile(pattern).match(value) is not None, number=NUMBER, repeat=5))
+        prefiltered = min(timeit.repeat(lambda: RegexHelper.is_match(pattern, value), number=NUMBER, repeat=5))
+        print(f'{name}: unfiltered {unfiltered / NUMBER * 1e9:8.1f} ns, prefiltered {prefiltered / NUMBER * 1e9:8.1f} ns per call')
+
+    print(RegexHelper.prefilter_info())
@@ -7,11 +7,15 @@ setup(
         'conditions_py',
         'conditions_py.errors',
         'conditions_py.helpers',
+        'conditions_py.plans',
         'conditions_py.validators',
     ],
     package_dir={
         'conditions_py': 'src'
     },
+    extras_require={
+        'numpy': ['numpy']
+    },
     url='https://github.com/GenesisCoast/conditions-py',
     license='MIT',
     author='Harry Sanderson',
@@ -1,9 +1,31 @@
-from typing import TypeVar, Generic
+import os
+import sys
+from functools import wraps
+from typing import Callable, Iterable, Pattern, TypeVar, Generic, Union
+from .helpers.affix_trie import AffixTrie
+from .helpers.aho_corasick import AhoCorasick
+from .helpers.regex_set import RegexSet
+from .helpers.set_index import SetIndex
+from .helpers.value_capture import ValueCapture
 from .validators.validator import Validator
 from .validators.string_validator import StringValidator
+from .validators.string_batch_validator import StringBatchValidator
 from .validators.object_validator import ObjectValidator
 from .validators.number_validator import NumberValidator
+from .validators.number_array_validator import NumberArrayValidator
 from .validators.boolean_validator import BooleanValidator
+from .validators.check_validator import BooleanCheckValidator
+from .validators.check_validator import NumberCheckValidator
+from .validators.check_validator import ObjectCheckValidator
+from .validators.check_validator import StringCheckValidator
+from .validators.noop_validator import NoopValidator
+from .validators.error_collector import ErrorCollector
+from .validators.validator_pool import ValidatorPool
+from .plans.validation_plan import ValidationPlan
+from .plans.plan_conditions import BOOLEAN_CONDITIONS
+from .plans.plan_conditions import NUMBER_CONDITIONS
+from .plans.plan_conditions import OBJECT_CONDITIONS
+from .plans.plan_conditions import STRING_CONDITIONS
 
 
 number = TypeVar('number', int, float)
@@ -15,6 +37,24 @@ class Condition:
     """
 
 
+    DISABLE_ENVIRONMENT_VARIABLE = 'CONDITIONS_PY_DISABLE'
+
+
+    SWITCHABLE_ENTRY_POINTS = {
+        'requires': ('requires_obj', 'requires_num', 'requires_bool', 'requires_str'),
+        'ensures': ('ensures_obj', 'ensures_num', 'ensures_bool', 'ensures_str')
+    }
+
+
+    _disabled = {}
+
+
+    _module_overrides = {}
+
+
+    _factories = {}
+
+
     @staticmethod
     def requires_obj(value: object, argument_name: str) -> ObjectValidator:
         """
@@ -76,4 +116,358 @@ class Condition:
         """
         Initializes the conditions framework using the `string` validator.
         """
-        return StringValidator(value, argument_name)
\ No newline at end of file
+        return StringValidator(value, argument_name)
+
+
+    @staticmethod
+    def requires_num_array(value: object, argument_name: str) -> NumberArrayValidator:
+        """
+        Initializes the conditions framework using the `number` validator for NumPy arrays, which checks every element.
+        """
+        return NumberArrayValidator(value, argument_name)
+
+
+    @staticmethod
+    def ensures_num_array(value: object, argument_name: str) -> NumberArrayValidator:
+        """
+        Initializes the conditions framework using the `number` validator for NumPy arrays, which checks every element.
+        """
+        return NumberArrayValidator(value, argument_name)
+
+
+    @staticmethod
+    def requires_str_batch(values: object, argument_name: str) -> StringBatchValidator:
+        """
+        Initializes the conditions framework using the `string` validator for a sequence of values,
+        which records a failure bitmap per condition instead of stopping at the first invalid value.
+        """
+        return StringBatchValidator(values, argument_name)
+
+
+    @staticmethod
+    def ensures_str_batch(values: object, argument_name: str) -> StringBatchValidator:
+        """
+        Initializes the conditions framework using the `string` validator for a sequence of values,
+        which records a failure bitmap per condition instead of stopping at the first invalid value.
+        """
+        return StringBatchValidator(values, argument_name)
+
+
+    @staticmethod
+    def check_obj(value: object, argument_name: str) -> ObjectCheckValidator:
+        """
+        Initializes the conditions framework using the `object` validator in non-raising check mode.
+        End the chain with `result()` to get the `CheckResult`.
+        """
+        return ObjectCheckValidator(value, argument_name)
+
+
+    @staticmethod
+    def check_num(value: number, argument_name: str) -> NumberCheckValidator:
+        """
+        Initializes the conditions framework using the `number (float, int)` validator in non-raising check mode.
+        End the chain with `result()` to get the `CheckResult`.
+        """
+        return NumberCheckValidator(value, argument_name)
+
+
+    @staticmethod
+    def check_bool(value: bool, argument_name: str) -> BooleanCheckValidator:
+        """
+        Initializes the conditions framework using the `boolean` validator in non-raising check mode.
+        End the chain with `result()` to get the `CheckResult`.
+        """
+        return BooleanCheckValidator(value, argument_name)
+
+
+    @staticmethod
+    def check_str(value: object, argument_name: str) -> StringCheckValidator:
+        """
+        Initializes the conditions framework using the `string` validator in non-raising check mode.
+        End the chain with `result()` to get the `CheckResult`.
+        """
+        return StringCheckValidator(value, argument_name)
+
+
+    @staticmethod
+    def plan_obj(argument_name: str) -> ValidationPlan:
+        """
+        Starts a validation plan for the `object` validator. Chain the conditions, then call `compile()`.
+        """
+        return ValidationPlan(ObjectValidator, argument_name, OBJECT_CONDITIONS)
+
+
+    @staticmethod
+    def plan_num(argument_name: str) -> ValidationPlan:
+        """
+        Starts a validation plan for the `number (float, int)` validator. Chain the conditions, then call `compile()`.
+        """
+        return ValidationPlan(NumberValidator, argument_name, NUMBER_CONDITIONS)
+
+
+    @staticmethod
+    def plan_bool(argument_name: str) -> ValidationPlan:
+        """
+        Starts a validation plan for the `boolean` validator. Chain the conditions, then call `compile()`.
+        """
+        return ValidationPlan(BooleanValidator, argument_name, BOOLEAN_CONDITIONS)
+
+
+    @staticmethod
+    def plan_str(argument_name: str) -> ValidationPlan:
+        """
+        Starts a validation plan for the `string` validator. Chain the conditions, then call `compile()`.
+        """
+        return ValidationPlan(StringValidator, argument_name, STRING_CONDITIONS)
+
+
+    @staticmethod
+    def pooled_obj(value: object, argument_name: str) -> ObjectValidator:
+        """
+        Returns the object validator pooled by the current thread, rebound to the `value` and `argument_name`.
+        The validator is reused by the next call on the thread, so it must not be kept.
+        """
+        return ValidatorPool.get(ObjectValidator, value, argument_name)
+
+
+    @staticmethod
+    def pooled_num(value: number, argument_name: str) -> NumberValidator:
+        """
+        Returns the number validator pooled by the current thread, rebound to the `value` and `argument_name`.
+        The validator is reused by the next call on the thread, so it must not be kept.
+        """
+        return ValidatorPool.get(NumberValidator, value, argument_name)
+
+
+    @staticmethod
+    def pooled_bool(value: bool, argument_name: str) -> BooleanValidator:
+        """
+        Returns the boolean validator pooled by the current thread, rebound to the `value` and `argument_name`.
+        The validator is reused by the next call on the thread, so it must not be kept.
+        """
+        return ValidatorPool.get(BooleanValidator, value, argument_name)
+
+
+    @staticmethod
+    def pooled_str(value: object, argument_name: str) -> StringValidator:
+        """
+        Returns the string validator pooled by the current thread, rebound to the `value` and `argument_name`.
+        The validator is reused by the next call on the thread, so it must not be kept.
+        """
+        return ValidatorPool.get(StringValidator, value, argument_name)
+
+
+    @staticmethod
+    def collect() -> ErrorCollector:
+        """
+        Returns a validation scope, used as `with Condition.collect() as errors:`, in which failing chains record
+        their error instead of raising it. The scope raises a single `ArgumentErrorGroup` holding every error on exit.
+        """
+        return ErrorCollector()
+
+
+    @staticmethod
+    def use_lightweight_errors(enabled: bool = True):
+        """
+        Switches the lightweight error mode on or off for every validator. In lightweight mode a failed condition
+        raises its error without chaining it to an exception being handled, and with a traceback which no longer
+        holds the failing value, which makes keeping errors cheaper, while raising costs about the same. The
+        traceback holds the caller and the failed condition, which Python always records, and the internal failure
+        frame before Python 3.11. The failed validator lets go of its value, so `get_value()` returns `None` on it.
+        """
+        Validator.lightweight_errors = enabled
+
+
+    @staticmethod
+    def capture_values(policy: str = 'full', max_length: int = ValueCapture.DEFAULT_MAX_LENGTH):
+        """
+        Sets how much of a failing value the errors keep in their `value` attribute and message: the `full` value,
+        a representation `truncated` at `max_length` characters, only its `type` and length, or a `weakref` to it.
+        Under every policy but `full`, a validator whose condition failed lets go of its value, so the traceback of the
+        error does not keep the value alive either.
+        """
+        ValueCapture.configure(policy, max_length)
+
+
+    @staticmethod
+    def index(values: Iterable) -> SetIndex:
+        """
+        Builds a reusable membership index over `values`, for the `is_in_set()` and `is_not_in_set()` conditions.
+        """
+        return SetIndex(values)
+
+
+    @staticmethod
+    def automaton(needles: Iterable[str]) -> AhoCorasick:
+        """
+        Builds a reusable Aho-Corasick automaton over `needles`, for the `contains_any()` and `does_not_contain_any()` conditions.
+        """
+        return AhoCorasick(needles)
+
+
+    @staticmethod
+    def prefix_trie(prefixes: Iterable[str]) -> AffixTrie:
+        """
+        Builds a reusable prefix trie over `prefixes`, for the `starts_with_any()` and `does_not_start_with_any()` conditions.
+        """
+        return AffixTrie(prefixes)
+
+
+    @staticmethod
+    def suffix_trie(suffixes: Iterable[str]) -> AffixTrie:
+        """
+        Builds a reusable suffix trie over `suffixes`, for the `ends_with_any()` and `does_not_end_with_any()` conditions.
+        """
+        return AffixTrie(suffixes, suffix=True)
+
+
+    @staticmethod
+    def regex_set(patterns: Iterable[Union[str, Pattern]]) -> RegexSet:
+        """
+        Builds a reusable set of patterns, for the `matches_any_regex()` and `matches_none_regex()` conditions.
+        """
+        return RegexSet(patterns)
+
+
+    @staticmethod
+    def disable(kind: str = 'ensures', module: str = None):
+        """
+        Switches off the `requires`, `ensures` or `all` entry points, either globally or for the `module` and its submodules.
+        Switched off entry points return a no-op validator whose conditions all pass, and which still returns the value.
+        """
+        Condition._switch(kind, module, True)
+
+
+    @staticmethod
+    def enable(kind: str = 'ensures', module: str = None):
+        """
+        Switches the `requires`, `ensures` or `all` entry points back on, either globally or for the `module` and its submodules.
+        """
+        Condition._switch(kind, module, False)
+
+
+    @staticmethod
+    def is_disabled(kind: str, module: str = None) -> bool:
+        """
+        Returns whether the `requires` or `ensures` entry points are switched off, globally or for the `module`.
+        """
+        overrides = Condition._module_overrides[kind]
+
+        while module:
+            if module in overrides:
+                return overrides[module]
+
+            module = module.rpartition('.')[0]
+
+        return Condition._disabled[kind]
+
+
+    @staticmethod
+    def reset_switches():
+        """
+        Removes every module switch and restores the global switches to their defaults. The `ensures` entry points
+        are switched off when Python runs with `-O`, and the `CONDITIONS_PY_DISABLE` environment variable can list
+        `requires`, `ensures`, `all` or `none` to override that.
+        """
+        setting = os.environ.get(Condition.DISABLE_ENVIRONMENT_VARIABLE, '').strip().lower()
+        switched_off = {item.strip() for item in setting.split(',')}
+
+        for kind in Condition.SWITCHABLE_ENTRY_POINTS:
+            if setting:
+                Condition._disabled[kind] = kind in switched_off or 'all' in switched_off
+            else:
+                Condition._disabled[kind] = kind == 'ensures' and not __debug__
+
+            Condition._module_overrides[kind] = {}
+            Condition._install(kind)
+
+
+    @staticmethod
+    def _switch(kind: str, module: str, disabled: bool):
+        """
+        Records the switch for the `kind` of entry points and rebinds them.
+        """
+        kinds = tuple(Condition.SWITCHABLE_ENTRY_POINTS) if kind == 'all' else (kind,)
+
+        for switched_kind in kinds:
+            if switched_kind not in Condition.SWITCHABLE_ENTRY_POINTS:
+                raise ValueError(f'The kind of entry points should be `requires`, `ensures` or `all`, but was `{switched_kind}`')
+
+            if module is None:
+                Condition._disabled[switched_kind] = disabled
+            else:
+                Condition._module_overrides[switched_kind][module] = disabled
+
+            Condition._install(switched_kind)
+
+
+    @staticmethod
+    def _install(kind: str):
+        """
+        Rebinds the `kind` of entry points, so a switched off entry point costs a single call and no lookups.
+        The caller module is only inspected while module switches exist.
+        """
+        disabled = Condition._disabled[kind]
+        overrides = Condition._module_overrides[kind]
+
+        for name in Condition.SWITCHABLE_ENTRY_POINTS[kind]:
+            factory = Condition._factories[name]
+
+            if overrides:
+                entry_point = _module_entry_point(factory, disabled, overrides)
+            elif disabled:
+                entry_point = _noop_entry_point(factory)
+            else:
+                entry_point = factory
+
+            setattr(Condition, name, staticmethod(entry_point))
+
+
+def _noop_entry_point(factory: Callable) -> Callable:
+    """
+    Returns an entry point which skips creating the validator and returns a no-op validator holding only the value.
+    The no-op validator is allocated without running its `__init__()`, which saves a Python call on every call.
+    """
+    allocate = object.__new__
+
+    @wraps(factory)
+    def entry_point(value: object, argument_name: str) -> object:
+        validator = allocate(NoopValidator)
+        validator.value = value
+
+        return validator
+
+    return entry_point
+
+
+def _module_entry_point(factory: Callable, disabled: bool, overrides: dict) -> Callable:
+    """
+    Returns an entry point which looks up the switch of the calling module, or its closest package.
+    """
+    @wraps(factory)
+    def entry_point(value: object, argument_name: str) -> object:
+        module = sys._getframe(1).f_globals.get('__name__', '')
+        module_disabled = disabled
+
+        while module:
+            if module in overrides:
+                module_disabled = overrides[module]
+                break
+
+            module = module.rpartition('.')[0]
+
+        if module_disabled:
+            return NoopValidator(value)
+
+        return factory(value, argument_name)
+
+    return entry_point
+
+
+for kind, names in Condition.SWITCHABLE_ENTRY_POINTS.items():
+    for name in names:
+        Condition._factories[name] = vars(Condition)[name].__func__
+
+del kind, names, name
+
+Condition.reset_switches()
@@ -1,4 +1,6 @@
 from .argument_error import ArgumentError
 from .argument_null_error import ArgumentNullError
 from .argument_out_of_range_error import ArgumentOutOfRangeError
-from .argument_pattern_error import ArgumentPatternError
\ No newline at end of file
+from .argument_pattern_error import ArgumentPatternError
+from .argument_pattern_timeout_error import ArgumentPatternTimeoutError
+from .argument_error_group import ArgumentErrorGroup
@@ -1,13 +1,92 @@
+from ..helpers.value_capture import ValueCapture
+
+
 class ArgumentError(Exception):
     """
-
+    Raised when an argument does not satisfy a condition.
     """
 
-    def __init__(self, message, value, argument_name):
+
+    __slots__ = (
+        '_value',
+        'argument_name',
+        'message_template',
+        'message_args',
+        '_message'
+    )
+
+
+    def __init__(self, message: str, value: object, argument_name: str, message_args: dict = None):
+        """
+        Initializes the error with the `message`, `value` and `argument_name`.
+        When `message_args` is supplied, `message` is a `str.format()` template which is only rendered
+        once the message is accessed, using the error attributes and `message_args` as fields.
+        How much of the `value` is kept depends on the `ValueCapture` policy.
+        """
+        super().__init__()
+
+        self._value = value if ValueCapture.policy == 'full' else ValueCapture.capture(value)
+        self.argument_name = argument_name
+        self.message_template = message
+        self.message_args = message_args
+        self._message = message if message_args is None else None
+
+
+    @property
+    def value(self) -> object:
+        """
+        Returns the value which failed the condition, as kept under the `ValueCapture` policy.
         """
+        return ValueCapture.resolve(self._value)
 
+
+    @value.setter
+    def value(self, value: object):
+        self._value = ValueCapture.capture(value)
+
+
+    @property
+    def message(self) -> str:
+        """
+        Returns the error message, rendering the message template on first access.
+        """
+        if self._message is None:
+            self._message = self.message_template.format_map(self._message_fields())
+
+        return self._message
+
+
+    @property
+    def args(self) -> tuple:
+        """
+        Returns the exception arguments, which consist of the rendered message.
+        """
+        return (self.message,)
+
+
+    @args.setter
+    def args(self, args: tuple):
+        self.message_template = args[0] if args else ''
+        self.message_args = None
+        self._message = self.message_template
+
+
+    def __str__(self) -> str:
+        return str(self.message)
+
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.message!r})'
+
+
+    def _message_fields(self) -> dict:
+        """
+        Returns the fields available to the message template.
         """
-        super().__init__(message)
+        fields = {
+            'value': ValueCapture.message_value(self._value),
+            'argument_name': self.argument_name
+        }
+        fields.update(self.message_args)
 
-        self.value = value
-        self.argument_name = argument_name
\ No newline at end of file
+        return fields
@@ -0,0 +1,56 @@
+from typing import Sequence
+from .argument_error import ArgumentError
+
+try:
+    BaseErrorGroup = ExceptionGroup
+except NameError:
+    class BaseErrorGroup(Exception):
+        """
+        Stand-in for `ExceptionGroup` on Python versions before 3.11.
+        """
+
+
+        def __init__(self, message: str, exceptions: Sequence[Exception]):
+            super().__init__(message, tuple(exceptions))
+            self.message = message
+            self.exceptions = tuple(exceptions)
+
+
+        def __str__(self) -> str:
+            return f'{self.message} ({len(self.exceptions)} sub-exceptions)'
+
+
+        def split(self, condition) -> tuple:
+            """
+            Returns the group of the exceptions matching `condition`, an exception type or a predicate, and the group
+            of the other exceptions, like `ExceptionGroup.split()`. Either is `None` when it would be empty.
+            """
+            if isinstance(condition, type) or isinstance(condition, tuple):
+                types = condition
+                condition = lambda exception: isinstance(exception, types)
+
+            matched = [exception for exception in self.exceptions if condition(exception)]
+            rest = [exception for exception in self.exceptions if not condition(exception)]
+
+            return (
+                self.derive(matched) if matched else None,
+                self.derive(rest) if rest else None
+            )
+
+
+        def derive(self, exceptions: Sequence[Exception]) -> 'BaseErrorGroup':
+            return BaseErrorGroup(self.message, exceptions)
+
+
+class ArgumentErrorGroup(BaseErrorGroup):
+    """
+    Raised when a collecting validation scope exits with failed conditions, holding every `ArgumentError` in `exceptions`.
+    It is an `ExceptionGroup` where available, so the failures can be handled with `except*`.
+    """
+
+
+    def derive(self, exceptions: Sequence[ArgumentError]) -> 'ArgumentErrorGroup':
+        """
+        Returns a group with the same message holding the `exceptions`, used when `except*` splits the group.
+        """
+        return ArgumentErrorGroup(self.message, exceptions)
@@ -7,21 +7,26 @@ object_class = TypeVar('object_class', object, type)
 
 class ArgumentNullError(ArgumentError):
     """
-
+    Raised when an argument is, or is not, `None` (Null) contrary to a condition.
     """
 
 
+    __slots__ = ()
+
+
     def __init__(
         self,
         message: str,
         value: object_class,
-        argument_name: str
+        argument_name: str,
+        message_args: dict = None
     ):
         """
-
+        Initializes the error with the `message`, `value` and `argument_name`.
         """
         super().__init__(
             message,
             value,
-            argument_name
-        )
\ No newline at end of file
+            argument_name,
+            message_args
+        )
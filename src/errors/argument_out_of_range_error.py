@@ -2,10 +2,17 @@ from .argument_error import ArgumentError
 
 class ArgumentOutOfRangeError(ArgumentError):
     """
-
+    Raised when a numeric argument falls outside of the range allowed by a condition.
     """
 
 
+    __slots__ = (
+        'equal_to',
+        'min_value',
+        'max_value'
+    )
+
+
     def __init__(
         self,
         message: str,
@@ -13,16 +20,30 @@ class ArgumentOutOfRangeError(ArgumentError):
         argument_name: str,
         equal_to: int = None,
         min_value: int = None,
-        max_value: int = None
+        max_value: int = None,
+        message_args: dict = None
     ):
         """
-
+        Initializes the error with the `message`, `value`, `argument_name` and the violated bounds.
         """
         super().__init__(
             message,
             value,
-            argument_name
+            argument_name,
+            message_args
         )
         self.equal_to = equal_to
         self.min_value = min_value
-        self.max_value = max_value
\ No newline at end of file
+        self.max_value = max_value
+
+
+    def _message_fields(self) -> dict:
+        """
+        Returns the fields available to the message template, including the violated bounds.
+        """
+        fields = super()._message_fields()
+        fields.setdefault('equal_to', self.equal_to)
+        fields.setdefault('min_value', self.min_value)
+        fields.setdefault('max_value', self.max_value)
+
+        return fields
@@ -2,23 +2,40 @@ from .argument_error import ArgumentError
 
 class ArgumentPatternError(ArgumentError):
     """
-
+    Raised when a string argument does, or does not, match a regex pattern contrary to a condition.
     """
 
 
+    __slots__ = (
+        'pattern',
+    )
+
+
     def __init__(
         self,
         message: str,
         value: str,
         argument_name: str,
-        pattern: str
+        pattern: str,
+        message_args: dict = None
     ):
         """
-
+        Initializes the error with the `message`, `value`, `argument_name` and `pattern`.
         """
         super().__init__(
             message,
             value,
-            argument_name
+            argument_name,
+            message_args
         )
-        self.pattern = pattern
\ No newline at end of file
+        self.pattern = pattern
+
+
+    def _message_fields(self) -> dict:
+        """
+        Returns the fields available to the message template, including the source of the pattern.
+        """
+        fields = super()._message_fields()
+        fields.setdefault('pattern', getattr(self.pattern, 'pattern', self.pattern))
+
+        return fields
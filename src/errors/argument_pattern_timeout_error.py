@@ -0,0 +1,43 @@
+from .argument_pattern_error import ArgumentPatternError
+
+class ArgumentPatternTimeoutError(ArgumentPatternError):
+    """
+    Raised when a string argument could not be matched against a regex pattern within the time budget of a guarded match.
+    """
+
+
+    __slots__ = (
+        'timeout',
+    )
+
+
+    def __init__(
+        self,
+        message: str,
+        value: str,
+        argument_name: str,
+        pattern: str,
+        timeout: float,
+        message_args: dict = None
+    ):
+        """
+        Initializes the error with the `message`, `value`, `argument_name`, `pattern` and `timeout`.
+        """
+        super().__init__(
+            message,
+            value,
+            argument_name,
+            pattern,
+            message_args
+        )
+        self.timeout = timeout
+
+
+    def _message_fields(self) -> dict:
+        """
+        Returns the fields available to the message template, including the timeout.
+        """
+        fields = super()._message_fields()
+        fields.setdefault('timeout', self.timeout)
+
+        return fields
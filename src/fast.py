@@ -0,0 +1,257 @@
+"""
+One-shot conditions as plain functions, for hot paths where a single condition is checked per value.
+
+Each function checks the same condition as the validator method it is named after and returns the value when it
+passes, without creating a validator. When it fails, the validator method is run to raise the very same error, so
+messages, error types and collecting scopes behave as they do on the fluent path. The functions are not switched off
+by `Condition.disable()`, which only applies to the entry points.
+"""
+from typing import Pattern, TypeVar, Union
+from .helpers.regex_helper import RegexHelper
+from .validators.number_validator import NumberValidator
+from .validators.string_validator import StringValidator
+
+
+number = TypeVar('number', int, float)
+
+
+def require_in_range(value: number, min_value: number, max_value: number, argument_name: str) -> number:
+    """
+    Checks whether the `value` is between `min_value` and `max_value` (including those values), like
+    `NumberValidator.is_in_range()`. An exception is thrown otherwise.
+    """
+    if value < min_value or value > max_value:
+        NumberValidator(value, argument_name).is_in_range(min_value, max_value)
+
+    return value
+
+
+def require_not_in_range(value: number, min_value: number, max_value: number, argument_name: str) -> number:
+    """
+    Checks whether the `value` is not between `min_value` and `max_value` (including those values), like
+    `NumberValidator.is_not_in_range()`. An exception is thrown otherwise.
+    """
+    if value >= min_value and value <= max_value:
+        NumberValidator(value, argument_name).is_not_in_range(min_value, max_value)
+
+    return value
+
+
+def require_greater_than(value: number, min_value: number, argument_name: str) -> number:
+    """
+    Checks whether the `value` is greater than `min_value`, like `NumberValidator.is_greater_than()`.
+    An exception is thrown otherwise.
+    """
+    if value <= min_value:
+        NumberValidator(value, argument_name).is_greater_than(min_value)
+
+    return value
+
+
+def require_greater_or_equal(value: number, min_value: number, argument_name: str) -> number:
+    """
+    Checks whether the `value` is greater or equal to `min_value`, like `NumberValidator.is_greater_or_equal()`.
+    An exception is thrown otherwise.
+    """
+    if value < min_value:
+        NumberValidator(value, argument_name).is_greater_or_equal(min_value)
+
+    return value
+
+
+def require_less_than(value: number, max_value: number, argument_name: str) -> number:
+    """
+    Checks whether the `value` is less than `max_value`, like `NumberValidator.is_less_than()`.
+    An exception is thrown otherwise.
+    """
+    if value >= max_value:
+        NumberValidator(value, argument_name).is_less_than(max_value)
+
+    return value
+
+
+def require_less_or_equal(value: number, max_value: number, argument_name: str) -> number:
+    """
+    Checks whether the `value` is less or equal to `max_value`, like `NumberValidator.is_less_or_equal()`.
+    An exception is thrown otherwise.
+    """
+    if value > max_value:
+        NumberValidator(value, argument_name).is_less_or_equal(max_value)
+
+    return value
+
+
+def require_equal_to(value: number, expected: number, argument_name: str) -> number:
+    """
+    Checks whether the `value` is equal to `expected`, like `NumberValidator.is_equal_to()`.
+    An exception is thrown otherwise.
+    """
+    if value != expected:
+        NumberValidator(value, argument_name).is_equal_to(expected)
+
+    return value
+
+
+def require_not_equal_to(value: number, expected: number, argument_name: str) -> number:
+    """
+    Checks whether the `value` is not equal to `expected`, like `NumberValidator.is_not_equal_to()`.
+    An exception is thrown otherwise.
+    """
+    if value == expected:
+        NumberValidator(value, argument_name).is_not_equal_to(expected)
+
+    return value
+
+
+def require_positive(value: number, argument_name: str) -> number:
+    """
+    Checks whether the `value` is positive (or 0), like `NumberValidator.is_positive()`.
+    An exception is thrown otherwise.
+    """
+    if value < 0:
+        NumberValidator(value, argument_name).is_positive()
+
+    return value
+
+
+def require_negative(value: number, argument_name: str) -> number:
+    """
+    Checks whether the `value` is negative, like `NumberValidator.is_negative()`.
+    An exception is thrown otherwise.
+    """
+    if value >= 0:
+        NumberValidator(value, argument_name).is_negative()
+
+    return value
+
+
+def require_not_null(value: str, argument_name: str) -> str:
+    """
+    Checks whether the `value` is not none (null), like `StringValidator.is_not_null()`.
+    An exception is thrown otherwise.
+    """
+    if value is None:
+        StringValidator(value, argument_name).is_not_null()
+
+    return value
+
+
+def require_not_null_or_empty(value: str, argument_name: str) -> str:
+    """
+    Checks whether the `value` is not none (null) nor an empty string, like `StringValidator.is_not_null_or_empty()`.
+    An exception is thrown otherwise.
+    """
+    if value is None or value == '':
+        StringValidator(value, argument_name).is_not_null_or_empty()
+
+    return value
+
+
+def require_not_null_or_whitespace(value: str, argument_name: str) -> str:
+    """
+    Checks whether the `value` is not none (null), not empty, and does not consist only of white-space characters,
+    like `StringValidator.is_not_null_or_whitespace()`. An exception is thrown otherwise.
+    """
+    if value is None or value == '' or str(value).isspace():
+        StringValidator(value, argument_name).is_not_null_or_whitespace()
+
+    return value
+
+
+def require_shorter_than(value: str, max_length: int, argument_name: str) -> str:
+    """
+    Checks whether the `value` is shorter than `max_length`, like `StringValidator.is_shorter_than()`.
+    An exception is thrown otherwise.
+    """
+    if len(value) >= max_length:
+        StringValidator(value, argument_name).is_shorter_than(max_length)
+
+    return value
+
+
+def require_shorter_or_equal(value: str, max_length: int, argument_name: str) -> str:
+    """
+    Checks whether the `value` is shorter or equal in length to `max_length`, like
+    `StringValidator.is_shorter_or_equal()`. An exception is thrown otherwise.
+    """
+    if len(value) > max_length:
+        StringValidator(value, argument_name).is_shorter_or_equal(max_length)
+
+    return value
+
+
+def require_longer_than(value: str, min_length: int, argument_name: str) -> str:
+    """
+    Checks whether the `value` is longer than `min_length`, like `StringValidator.is_longer_than()`.
+    An exception is thrown otherwise.
+    """
+    if len(value) <= min_length:
+        StringValidator(value, argument_name).is_longer_than(min_length)
+
+    return value
+
+
+def require_longer_or_equal(value: str, min_length: int, argument_name: str) -> str:
+    """
+    Checks whether the `value` is longer or equal in length to `min_length`, like
+    `StringValidator.is_longer_or_equal()`. An exception is thrown otherwise.
+    """
+    if len(value) < min_length:
+        StringValidator(value, argument_name).is_longer_or_equal(min_length)
+
+    return value
+
+
+def require_length(value: str, length: int, argument_name: str) -> str:
+    """
+    Checks whether the `value` has a length of `length`, like `StringValidator.has_length()`.
+    An exception is thrown otherwise.
+    """
+    if len(value) != length:
+        StringValidator(value, argument_name).has_length(length)
+
+    return value
+
+
+def require_starts_with(value: str, prefix: str, argument_name: str) -> str:
+    """
+    Checks whether the `value` starts with `prefix`, like `StringValidator.starts_with()`.
+    An exception is thrown otherwise.
+    """
+    if not str(value).startswith(prefix):
+        StringValidator(value, argument_name).starts_with(prefix)
+
+    return value
+
+
+def require_ends_with(value: str, suffix: str, argument_name: str) -> str:
+    """
+    Checks whether the `value` ends with `suffix`, like `StringValidator.ends_with()`.
+    An exception is thrown otherwise.
+    """
+    if not str(value).endswith(suffix):
+        StringValidator(value, argument_name).ends_with(suffix)
+
+    return value
+
+
+def require_contains(value: str, expected: str, argument_name: str) -> str:
+    """
+    Checks whether the `value` contains `expected`, like `StringValidator.contains()`.
+    An exception is thrown otherwise.
+    """
+    if expected not in value:
+        StringValidator(value, argument_name).contains(expected)
+
+    return value
+
+
+def require_regex_match(value: str, pattern: Union[str, Pattern], argument_name: str) -> str:
+    """
+    Checks whether the `value` matches the `pattern`, like `StringValidator.is_regex_match()`.
+    An exception is thrown otherwise.
+    """
+    if not RegexHelper.is_match(pattern, value):
+        StringValidator(value, argument_name).is_regex_match(pattern)
+
+    return value
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+from .lru_cache import LruCache
+
+
+class AffixTrie:
+    """
+    Prebuilt trie of prefixes, or of reversed suffixes, which finds a matching affix in O(len(value))
+    regardless of the number of affixes.
+    """
+
+
+    __slots__ = (
+        'affixes',
+        'suffix',
+        '_root'
+    )
+
+
+    DEFAULT_CACHE_SIZE = 32
+
+
+    _cache = LruCache(DEFAULT_CACHE_SIZE)
+
+
+    def __init__(self, affixes: Iterable[str], suffix: bool = False):
+        """
+        Builds the trie for the `affixes`, matching them at the end of values if `suffix` is set or at the start otherwise.
+        """
+        self.affixes = tuple(dict.fromkeys(affixes))
+        self.suffix = suffix
+        self._root = {}
+
+        for affix in self.affixes:
+            node = self._root
+
+            for character in (reversed(affix) if suffix else affix):
+                node = node.setdefault(character, {})
+
+            # The empty string is never a single character, so it marks the nodes which complete an affix.
+            node.setdefault('', affix)
+
+
+    def __len__(self) -> int:
+        return len(self.affixes)
+
+
+    def __repr__(self) -> str:
+        return f'AffixTrie({len(self.affixes)} {"suffixes" if self.suffix else "prefixes"})'
+
+
+    def find(self, value: str) -> Optional[str]:
+        """
+        Returns the shortest affix which the `value` starts (or ends) with, or `None` if there is none.
+        """
+        node = self._root
+
+        if '' in node:
+            return node['']
+
+        for character in (reversed(value) if self.suffix else value):
+            node = node.get(character)
+
+            if node is None:
+                return None
+
+            if '' in node:
+                return node['']
+
+        return None
+
+
+    @staticmethod
+    def of(affixes: Iterable[str], suffix: bool = False) -> AffixTrie:
+        """
+        Returns a trie for `affixes`. Tries are returned as they are, while tuples and frozensets are built once and
+        cached by identity. Lists and sets are cached along with a copy of their affixes, and built again once they
+        were modified, which costs a comparison of the affixes on every call.
+        """
+        if isinstance(affixes, AffixTrie):
+            if affixes.suffix != suffix:
+                raise ValueError(f'The trie should match {"suffixes" if suffix else "prefixes"}, but it matches {"suffixes" if affixes.suffix else "prefixes"}')
+
+            return affixes
+
+        if not isinstance(affixes, (list, tuple, set, frozenset)):
+            return AffixTrie(affixes, suffix)
+
+        return AffixTrie._cache.get_or_create_by_identity(
+            affixes,
+            lambda collection: AffixTrie(collection, suffix),
+            suffix
+        )
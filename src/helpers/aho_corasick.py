@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Optional, Tuple
+from .lru_cache import LruCache
+
+
+class AhoCorasick:
+    """
+    Prebuilt Aho-Corasick automaton which finds any of many needles in a single scan of the haystack.
+    """
+
+
+    __slots__ = (
+        'needles',
+        '_matches_empty',
+        '_transitions',
+        '_failures',
+        '_outputs'
+    )
+
+
+    DEFAULT_CACHE_SIZE = 32
+
+
+    _cache = LruCache(DEFAULT_CACHE_SIZE)
+
+
+    def __init__(self, needles: Iterable[str]):
+        """
+        Builds the automaton for the `needles`. An empty needle matches every haystack at offset 0.
+        """
+        self.needles = tuple(dict.fromkeys(needles))
+        self._matches_empty = '' in self.needles
+        self._transitions = [{}]
+        self._failures = [0]
+        self._outputs = [None]
+
+        for needle in self.needles:
+            if not needle:
+                continue
+
+            state = 0
+
+            for character in needle:
+                next_state = self._transitions[state].get(character)
+
+                if next_state is None:
+                    next_state = len(self._transitions)
+                    self._transitions[state][character] = next_state
+                    self._transitions.append({})
+                    self._failures.append(0)
+                    self._outputs.append(None)
+
+                state = next_state
+
+            if self._outputs[state] is None:
+                self._outputs[state] = needle
+
+        self._link()
+
+
+    def __len__(self) -> int:
+        return len(self.needles)
+
+
+    def __repr__(self) -> str:
+        return f'AhoCorasick({len(self.needles)} needles)'
+
+
+    def find(self, haystack: str) -> Optional[Tuple[str, int]]:
+        """
+        Returns the first needle found in the `haystack` and its offset, or `None` if it does not contain any needle.
+        The first needle is the one which ends first, preferring the longest needle ending at that position.
+        """
+        if self._matches_empty:
+            return ('', 0)
+
+        transitions = self._transitions
+        failures = self._failures
+        outputs = self._outputs
+        state = 0
+
+        for position, character in enumerate(haystack):
+            while state and character not in transitions[state]:
+                state = failures[state]
+
+            state = transitions[state].get(character, 0)
+            needle = outputs[state]
+
+            if needle is not None:
+                return (needle, position - len(needle) + 1)
+
+        return None
+
+
+    @staticmethod
+    def of(needles: Iterable[str]) -> AhoCorasick:
+        """
+        Returns an automaton for `needles`. Automatons are returned as they are, while tuples and frozensets are
+        built once and cached by identity. Lists and sets are cached along with a copy of their needles, and built
+        again once they were modified, which costs a comparison of the needles on every call.
+        """
+        if isinstance(needles, AhoCorasick):
+            return needles
+
+        if not isinstance(needles, (list, tuple, set, frozenset)):
+            return AhoCorasick(needles)
+
+        return AhoCorasick._cache.get_or_create_by_identity(needles, AhoCorasick)
+
+
+    def _link(self):
+        """
+        Computes the failure link of every state breadth-first, and inherits the output of the failure state
+        for states which do not complete a needle themselves.
+        """
+        queue = deque(self._transitions[0].values())
+
+        while queue:
+            state = queue.popleft()
+
+            for character, next_state in self._transitions[state].items():
+                queue.append(next_state)
+
+                failure = self._failures[state]
+
+                while failure and character not in self._transitions[failure]:
+                    failure = self._failures[failure]
+
+                failure = self._transitions[failure].get(character, 0)
+                self._failures[next_state] = failure if failure != next_state else 0
+
+                if self._outputs[next_state] is None:
+                    self._outputs[next_state] = self._outputs[failure]
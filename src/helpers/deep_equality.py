@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import dataclasses
+from collections import namedtuple
+from collections.abc import Mapping, Sequence, Set
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from typing import Optional, Tuple
+from weakref import WeakKeyDictionary
+
+try:
+    from functools import cached_property
+except ImportError:
+    cached_property = None
+
+
+Difference = namedtuple('Difference', ['path', 'reason', 'actual', 'expected'])
+
+
+MISSING = object()
+
+
+class DeepEquality:
+    """
+    Compares two object graphs structurally with an explicit stack, reporting the path of the first difference.
+    Objects are compared by their state (`__dict__`, `__slots__` or dataclass fields) rather than their class,
+    mappings by key, sequences by position, and everything else with `==`. Objects whose class defines its own
+    `__eq__()`, other than dataclasses, are compared with it, since their state may hold caches which `==` ignores.
+    """
+
+
+    LEAF_TYPES = (str, bytes, bytearray, int, float, complex, type(None), Decimal, Fraction, Enum, type)
+
+
+    _KINDS = {
+        dict: 'mapping',
+        list: 'sequence',
+        tuple: 'sequence',
+        set: 'set',
+        frozenset: 'set'
+    }
+    _BUILTIN_EQ = frozenset((object.__eq__, dict.__eq__, list.__eq__, tuple.__eq__))
+    _slots = WeakKeyDictionary()
+    _cached = WeakKeyDictionary()
+
+
+    @staticmethod
+    def find_difference(actual: object, expected: object, root: str = 'value') -> Optional[Difference]:
+        """
+        Returns the first difference between `actual` and `expected`, with its path starting at `root`,
+        or `None` if they are structurally equal. Identical objects are equal without being walked, and a pair of
+        objects which is reached again through a cycle is assumed equal, so cyclic graphs terminate.
+        """
+        stack = [(actual, expected, root)]
+        visited = set()
+
+        while stack:
+            actual, expected, path = stack.pop()
+
+            if actual is expected:
+                continue
+
+            kind = DeepEquality._kind(actual)
+
+            if kind != DeepEquality._kind(expected) or not DeepEquality._same_container(actual, expected, kind):
+                if (kind == 'leaf' or DeepEquality._kind(expected) == 'leaf') and actual == expected:
+                    continue
+
+                return Difference(path, 'kind', actual, expected)
+
+            if kind == 'leaf' or kind == 'set':
+                if actual != expected:
+                    return Difference(path, 'value', actual, expected)
+
+                continue
+
+            pair = (id(actual), id(expected))
+
+            if pair in visited:
+                continue
+
+            visited.add(pair)
+
+            if kind == 'sequence':
+                if len(actual) != len(expected):
+                    return Difference(path, 'length', len(actual), len(expected))
+
+                stack.extend(
+                    (actual[index], expected[index], f'{path}[{index}]')
+                    for index in reversed(range(len(actual)))
+                )
+                continue
+
+            if kind == 'mapping':
+                actual_items, expected_items = actual, expected
+                child_path = '{0}[{1!r}]'
+            else:
+                actual_items, expected_items = DeepEquality._state(actual), DeepEquality._state(expected)
+                child_path = '{0}.{1}'
+
+                if actual_items is None or expected_items is None:
+                    if actual != expected:
+                        return Difference(path, 'value', actual, expected)
+
+                    continue
+
+            for key in actual_items:
+                if key not in expected_items:
+                    return Difference(child_path.format(path, key), 'unexpected', actual_items[key], MISSING)
+
+            children = []
+
+            for key in expected_items:
+                if key not in actual_items:
+                    return Difference(child_path.format(path, key), 'missing', MISSING, expected_items[key])
+
+                children.append((actual_items[key], expected_items[key], child_path.format(path, key)))
+
+            stack.extend(reversed(children))
+
+        return None
+
+
+    @staticmethod
+    def _kind(value: object) -> str:
+        """
+        Returns how `value` is compared: as a `leaf`, `set`, `sequence`, `mapping` or `object`.
+        """
+        kind = DeepEquality._KINDS.get(type(value))
+
+        if kind is not None:
+            return kind
+
+        if isinstance(value, DeepEquality.LEAF_TYPES) or DeepEquality._has_own_eq(type(value)):
+            return 'leaf'
+
+        if isinstance(value, Mapping):
+            return 'mapping'
+
+        if isinstance(value, Set):
+            return 'set'
+
+        if isinstance(value, Sequence):
+            return 'sequence'
+
+        return 'object'
+
+
+    @staticmethod
+    def _has_own_eq(cls: type) -> bool:
+        """
+        Returns whether `cls` defines its own `__eq__()`, rather than inheriting it from `object` or a builtin container.
+        Dataclasses generate theirs from their fields, so they are still compared by state.
+        """
+        return getattr(cls, '__eq__', object.__eq__) not in DeepEquality._BUILTIN_EQ and not dataclasses.is_dataclass(cls)
+
+
+    @staticmethod
+    def _same_container(actual: object, expected: object, kind: str) -> bool:
+        """
+        Returns whether two sequences or mappings can equal each other with `==`: lists only equal lists and tuples
+        only equal tuples, and other containers only equal containers of their own type.
+        """
+        if kind != 'sequence' and kind != 'mapping' or type(actual) is type(expected):
+            return True
+
+        for base in ((list, tuple) if kind == 'sequence' else (dict,)):
+            if isinstance(actual, base) and isinstance(expected, base):
+                return True
+
+        return False
+
+
+    @staticmethod
+    def _state(value: object) -> Optional[dict]:
+        """
+        Returns the attributes of `value` by name, or `None` if it has neither a `__dict__` nor `__slots__`.
+        Dataclasses only contribute the fields which take part in comparisons, and values cached by a
+        `cached_property` are left out, as they depend on whether the property was read.
+        """
+        if dataclasses.is_dataclass(value):
+            return {
+                field.name: getattr(value, field.name, MISSING)
+                for field in dataclasses.fields(value)
+                if field.compare
+            }
+
+        attributes = getattr(value, '__dict__', None)
+        slots = DeepEquality._slot_names(type(value))
+        cached = DeepEquality._cached_names(type(value))
+
+        if cached and attributes is not None:
+            attributes = {name: attribute for name, attribute in attributes.items() if name not in cached}
+
+        if not slots:
+            return attributes
+
+        state = dict(attributes) if attributes is not None else {}
+
+        for name in slots:
+            attribute = getattr(value, name, MISSING)
+
+            if attribute is not MISSING:
+                state[name] = attribute
+
+        return state
+
+
+    @staticmethod
+    def _slot_names(cls: type) -> Tuple[str, ...]:
+        """
+        Returns the names of the slots declared by `cls` and its bases, cached per class.
+        """
+        names = DeepEquality._slots.get(cls)
+
+        if names is None:
+            names = []
+
+            for base in reversed(cls.__mro__):
+                slots = base.__dict__.get('__slots__', ())
+
+                for name in ((slots,) if isinstance(slots, str) else slots):
+                    if name in ('__dict__', '__weakref__'):
+                        continue
+
+                    if name.startswith('__') and not name.endswith('__'):
+                        name = f"_{base.__name__.lstrip('_')}{name}"
+
+                    names.append(name)
+
+            names = DeepEquality._slots[cls] = tuple(dict.fromkeys(names))
+
+        return names
+
+
+    @staticmethod
+    def _cached_names(cls: type) -> frozenset:
+        """
+        Returns the names of the `cached_property` attributes of `cls` and its bases, cached per class.
+        There are none before Python 3.8, which introduced `cached_property`.
+        """
+        if cached_property is None:
+            return frozenset()
+
+        names = DeepEquality._cached.get(cls)
+
+        if names is None:
+            names = DeepEquality._cached[cls] = frozenset(
+                name
+                for base in cls.__mro__
+                for name, attribute in vars(base).items()
+                if isinstance(attribute, cached_property)
+            )
+
+        return names
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+
+class FailureBitmap:
+    """
+    Compact record of which values in a batch failed a condition, using one bit per value.
+    """
+
+
+    __slots__ = (
+        'bits',
+        'length'
+    )
+
+
+    def __init__(self, length: int, bits: bytearray = None):
+        """
+        Initializes the bitmap for `length` values, either empty or from the packed `bits`.
+        """
+        self.length = length
+        self.bits = bits if bits is not None else bytearray((length + 7) >> 3)
+
+
+    def __len__(self) -> int:
+        return self.length
+
+
+    def __getitem__(self, index: int) -> bool:
+        if not 0 <= index < self.length:
+            raise IndexError(f'The index `{index}` is out of the range `0-{self.length - 1}`')
+
+        return bool(self.bits[index >> 3] >> (index & 7) & 1)
+
+
+    def __or__(self, other: FailureBitmap) -> FailureBitmap:
+        combined = int.from_bytes(self.bits, 'little') | int.from_bytes(other.bits, 'little')
+
+        return FailureBitmap(self.length, bytearray(combined.to_bytes(len(self.bits), 'little')))
+
+
+    def __repr__(self) -> str:
+        return f'FailureBitmap(length={self.length}, failures={self.count()})'
+
+
+    def set(self, index: int):
+        """
+        Marks the value at `index` as failed.
+        """
+        self.bits[index >> 3] |= 1 << (index & 7)
+
+
+    def any(self) -> bool:
+        """
+        Returns whether any value failed.
+        """
+        return self.bits.count(0) != len(self.bits)
+
+
+    def count(self) -> int:
+        """
+        Returns the number of failed values.
+        """
+        return bin(int.from_bytes(self.bits, 'little')).count('1')
+
+
+    def indices(self) -> Iterator[int]:
+        """
+        Yields the indices of the failed values in ascending order.
+        """
+        for byte_index, byte in enumerate(self.bits):
+            if byte:
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        yield (byte_index << 3) + bit
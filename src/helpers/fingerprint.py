@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import Optional
+from .deep_equality import DeepEquality
+from .lru_cache import LruCache
+
+
+class Fingerprint:
+    """
+    Computes a structural hash of an object graph which agrees with `DeepEquality`: structurally equal graphs always
+    have equal fingerprints, so differing fingerprints prove a difference without comparing the graphs.
+    Fingerprints are built from `hash()`, which is randomized for strings, so they are only stable within one process.
+    """
+
+
+    DEFAULT_CACHE_SIZE = 64
+
+
+    _LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+    _cache = LruCache(DEFAULT_CACHE_SIZE)
+
+
+    @staticmethod
+    def compute(value: object) -> Optional[int]:
+        """
+        Returns the fingerprint of `value`, or `None` if the graph cannot be fingerprinted because it contains a cycle
+        or an unhashable value which has no attributes. The graph is walked with an explicit stack, and shared
+        containers are only hashed once.
+        """
+        try:
+            return Fingerprint._compute(value)
+        except (TypeError, ValueError):
+            return None
+
+
+    @staticmethod
+    def of(value: object) -> Optional[int]:
+        """
+        Returns the fingerprint of the reference `value`, computed once and cached by identity.
+        The reference must not be modified after its first fingerprint, like a snapshot.
+        """
+        key = id(value)
+        entry = Fingerprint._cache.get(key)
+
+        if entry is not None and entry[0] is value:
+            return entry[1]
+
+        fingerprint = Fingerprint.compute(value)
+        Fingerprint._cache.put(key, (value, fingerprint))
+
+        return fingerprint
+
+
+    @staticmethod
+    def clear_cache():
+        """
+        Removes every cached reference fingerprint.
+        """
+        Fingerprint._cache.clear()
+
+
+    @staticmethod
+    def _compute(root: object) -> int:
+        """
+        Hashes the graph in post-order: a container is pushed again behind its children, and combines their hashes
+        from the `hashes` stack once they have all been hashed. Leaves are hashed in place rather than pushed, and bytes
+        are tagged since ASCII strings hash like them. Mappings and objects combine their entries in a frozenset,
+        as their order does not take part in comparisons, and sets hash their elements like they compare them.
+        Raises a `ValueError` on cycles.
+        """
+        leaf_types = Fingerprint._LEAF_TYPES
+        stack = [(root, None, None)]
+        hashes = []
+        memo = {}
+        on_path = set()
+
+        while stack:
+            value, kind, keys = stack.pop()
+
+            if kind is not None:
+                count = len(keys)
+                parts = hashes[len(hashes) - count:] if count else []
+                del hashes[len(hashes) - count:]
+
+                if kind == 'sequence' or kind == 'tuple':
+                    fingerprint = hash(('t' if kind == 'tuple' else 'l', *parts))
+                else:
+                    fingerprint = hash((kind, frozenset(zip(keys, parts))))
+
+                memo[id(value)] = fingerprint
+                on_path.discard(id(value))
+                hashes.append(fingerprint)
+                continue
+
+            if type(value) in leaf_types:
+                hashes.append(hash(value))
+                continue
+
+            key = id(value)
+
+            if key in memo:
+                hashes.append(memo[key])
+                continue
+
+            kind = DeepEquality._kind(value)
+
+            if kind == 'leaf':
+                hashes.append(hash(('b', bytes(value))) if isinstance(value, (bytes, bytearray)) else hash(value))
+                continue
+
+            if kind == 'set':
+                hashes.append(hash(('s', frozenset(value))))
+                continue
+
+            if kind == 'object':
+                state = DeepEquality._state(value)
+
+                if state is None:
+                    hashes.append(hash(('h', value)))
+                    continue
+
+                items = state.items()
+            elif kind == 'mapping':
+                items = value.items()
+            else:
+                items = None
+
+            if key in on_path:
+                raise ValueError('The object graph contains a cycle')
+
+            on_path.add(key)
+
+            if items is None:
+                children = value
+                keys = range(len(value))
+            else:
+                keys, children = zip(*items) if items else ((), ())
+
+            stack.append((value, 'tuple' if isinstance(value, tuple) else kind, keys))
+
+            for child in reversed(children):
+                stack.append((child, None, None))
+
+        return hashes[0]
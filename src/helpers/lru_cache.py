@@ -0,0 +1,143 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import Callable, Hashable
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'max_size', 'current_size'])
+
+
+class LruCache:
+    """
+    Bounded, thread-safe mapping which evicts the least recently used entry once `max_size` is exceeded.
+    """
+
+
+    def __init__(self, max_size: int = 128):
+        """
+        Initializes an empty cache holding at most `max_size` entries.
+        """
+        if max_size < 0:
+            raise ValueError(f'The cache size should be positive (or 0), but was `{max_size}`')
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        """
+        Returns the entry stored for `key` and marks it as most recently used, or `default` if it is missing.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+
+    def put(self, key: Hashable, value: object) -> object:
+        """
+        Stores `value` under `key`, evicting the least recently used entries if the cache is full.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+        return value
+
+
+    def get_or_create(self, key: Hashable, factory: Callable[[Hashable], object]) -> object:
+        """
+        Returns the entry stored for `key`, creating it with `factory(key)` on a miss.
+        The factory runs outside of the lock, so it may be invoked twice for the same key under contention.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        return self.put(key, factory(key))
+
+
+    def get_or_create_by_identity(self, collection: object, factory: Callable[[object], object], variant: Hashable = None) -> object:
+        """
+        Returns the entry built from the tuple, frozenset, list or set `collection`, creating it with `factory` on a miss.
+        Entries are keyed by identity and `variant`, and keep the collection alive so its identity is not reused.
+        Tuples and frozensets cannot change, while lists and sets are built from a copy which is kept with the entry,
+        and built again once the collection no longer equals it, so modifying them in place is seen on the next call.
+        """
+        key = (id(collection), variant)
+        entry = self.get(key)
+        immutable = isinstance(collection, (tuple, frozenset))
+
+        if entry is not None and entry[0] is collection and (immutable or entry[1] == collection):
+            return entry[2]
+
+        snapshot = None if immutable else collection.copy()
+        value = factory(collection if immutable else snapshot)
+        self.put(key, (collection, snapshot, value))
+
+        return value
+
+
+    def resize(self, max_size: int):
+        """
+        Changes the maximum number of entries, evicting the least recently used entries if required.
+        """
+        if max_size < 0:
+            raise ValueError(f'The cache size should be positive (or 0), but was `{max_size}`')
+
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+
+    def clear(self):
+        """
+        Removes every entry and resets the hit, miss and eviction counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+    def info(self) -> CacheInfo:
+        """
+        Returns a snapshot of the cache counters.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.max_size, len(self._entries))
+
+
+    def _evict(self):
+        """
+        Drops the least recently used entries until the cache fits in `max_size`. Must be called with the lock held.
+        """
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import re
+import threading
+import time
+import weakref
+from typing import Pattern
+
+
+def _serve(connection):
+    """
+    Signals that the worker is ready, then answers match requests sent over the `connection` until the parent
+    closes it.
+    """
+    connection.send(True)
+
+    while True:
+        try:
+            pattern, flags, string = connection.recv()
+        except EOFError:
+            return
+
+        connection.send(re.compile(pattern, flags).match(string) is not None)
+
+
+def _kill(process, connection):
+    """
+    Closes the `connection` to the worker `process` and kills it.
+    """
+    connection.close()
+    process.kill()
+    process.join()
+
+
+class RegexGuard:
+    """
+    Runs regex matches in a worker process which is killed once a match exceeds its time budget.
+    The regex engine cannot be interrupted from another thread, so a separate process is the only portable way
+    to bound a match. The worker is started on first use, and a worker which timed out is kept if it finishes the
+    match before the next one, or replaced otherwise.
+
+    Workers are started with the `forkserver` method where available and `spawn` otherwise, as forking the
+    multi-threaded processes which use a guard per thread can deadlock.
+    """
+
+
+    __slots__ = (
+        '_process',
+        '_connection',
+        '_finalizer',
+        '_pending',
+        '_lock',
+        '__weakref__'
+    )
+
+
+    _context = multiprocessing.get_context(
+        'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    )
+    _local = threading.local()
+    _guards = weakref.WeakSet()
+    _guards_lock = threading.Lock()
+
+
+    def __init__(self):
+        """
+        Initializes the guard without starting its worker process.
+        """
+        self._process = None
+        self._connection = None
+        self._finalizer = None
+        self._pending = False
+        self._lock = threading.Lock()
+
+
+    def is_match(self, compiled: Pattern, string: str, timeout: float) -> bool:
+        """
+        Returns whether the `compiled` pattern matches the start of the `string`, running it in the worker process.
+        Raises a `TimeoutError` if the match does not finish within `timeout` seconds of the call. Time spent waiting
+        for another thread using the same guard counts, while starting the worker does not, as the budget only
+        starts once the worker reported it is ready.
+        """
+        deadline = time.monotonic() + timeout
+
+        if not self._lock.acquire(timeout=timeout):
+            raise TimeoutError(f'The pattern `{compiled.pattern}` did not finish matching within `{timeout}` seconds')
+
+        try:
+            remaining = deadline - time.monotonic()
+            connection = self._start()
+            connection.send((compiled.pattern, compiled.flags, string))
+
+            if not connection.poll(max(remaining, 0)):
+                self._pending = True
+                raise TimeoutError(f'The pattern `{compiled.pattern}` did not finish matching within `{timeout}` seconds')
+
+            return connection.recv()
+        finally:
+            self._lock.release()
+
+
+    def close(self):
+        """
+        Stops the worker process, if it is running.
+        """
+        with self._lock:
+            self._stop()
+
+
+    @staticmethod
+    def shared() -> RegexGuard:
+        """
+        Returns the guard shared by every caller on the current thread. Each thread has its own guard and worker
+        process, so a slow match only delays the thread running it. The worker of a guard is killed once its thread
+        ends, and every guard still alive is closed at exit.
+        """
+        try:
+            return RegexGuard._local.guard
+        except AttributeError:
+            pass
+
+        guard = RegexGuard._local.guard = RegexGuard()
+
+        with RegexGuard._guards_lock:
+            RegexGuard._guards.add(guard)
+
+        return guard
+
+
+    @staticmethod
+    def close_all():
+        """
+        Stops the worker processes of every guard returned by `shared()`.
+        """
+        with RegexGuard._guards_lock:
+            guards = list(RegexGuard._guards)
+
+        for guard in guards:
+            guard.close()
+
+
+    def _start(self):
+        """
+        Returns the connection to a worker process which is ready for a match. A worker still running a match which
+        timed out is kept if it has finished meanwhile, and killed otherwise. A new worker is started if required,
+        waiting until it reports it is ready. Must be called with the lock held.
+        """
+        if self._pending:
+            self._pending = False
+
+            if self._connection.poll():
+                self._connection.recv()
+            else:
+                self._stop()
+
+        if self._process is None or not self._process.is_alive():
+            self._stop()
+            connection, child_connection = RegexGuard._context.Pipe()
+            process = RegexGuard._context.Process(target=_serve, args=(child_connection,), daemon=True)
+            process.start()
+            child_connection.close()
+            self._process = process
+            self._connection = connection
+            self._finalizer = weakref.finalize(self, _kill, process, connection)
+
+            try:
+                connection.recv()
+            except EOFError:
+                self._stop()
+                raise RuntimeError('The worker process of the regex guard exited before it was ready')
+
+        return self._connection
+
+
+    def _stop(self):
+        """
+        Kills the worker process and closes the connection to it. Must be called with the lock held.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+
+        self._process = None
+        self._connection = None
+        self._finalizer = None
+        self._pending = False
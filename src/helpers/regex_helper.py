@@ -1,16 +1,240 @@
 import re
+from collections import namedtuple
+from typing import List, Pattern, Tuple, Union
+from .lru_cache import CacheInfo, LruCache
+from .regex_guard import RegexGuard
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+
+PATTERN_TYPE = type(re.compile(''))
+PrefilterInfo = namedtuple('PrefilterInfo', ['checks', 'rejections'])
+
+
+_prefilter_counts = [0, 0]
+
 
 class RegexHelper:
     """
     Defines regex helper methods.
     """
 
+
+    DEFAULT_CACHE_SIZE = 512
+    GUARDED_TIMEOUT = 0.5
+    GUARDED_INPUT_LENGTH = 4096
+
+
+    _cache = LruCache(DEFAULT_CACHE_SIZE)
+    _compiled_cache = LruCache(DEFAULT_CACHE_SIZE)
+
+
+    @staticmethod
+    def compile(pattern: Union[str, Pattern]) -> Pattern:
+        """
+        Returns the compiled form of `pattern`, using the compiled pattern cache.
+        Pre-compiled patterns are returned as they are.
+        """
+        if isinstance(pattern, PATTERN_TYPE):
+            return pattern
+
+        return RegexHelper._cache.get_or_create(pattern, RegexHelper._analyze)[0]
+
+
     @staticmethod
-    def is_match(pattern: str, string: str) -> bool:
+    def is_match(pattern: Union[str, Pattern], string: str) -> bool:
         """
         Returns `True` or `False` if a regex match has been found in the string.
+        Strings which lack the literal prefix or the required substring of the pattern are rejected without running it.
         """
-        if re.match(pattern, string) is not None:
-            return True
+        if isinstance(pattern, PATTERN_TYPE):
+            compiled, prefix, substring, _ = RegexHelper._compiled_cache.get_or_create(pattern, RegexHelper._analyze)
         else:
-            return False
\ No newline at end of file
+            compiled, prefix, substring, _ = RegexHelper._cache.get_or_create(pattern, RegexHelper._analyze)
+
+        if (prefix or substring) and isinstance(string, str):
+            _prefilter_counts[0] += 1
+
+            if not string.startswith(prefix) or substring not in string:
+                _prefilter_counts[1] += 1
+                return False
+
+        return compiled.match(string) is not None
+
+
+    @staticmethod
+    def is_match_guarded(pattern: Union[str, Pattern], string: str, timeout: float = None) -> bool:
+        """
+        Returns `True` or `False` if a regex match has been found in the string, like `is_match()`.
+        Patterns flagged by `is_vulnerable()` and strings longer than `GUARDED_INPUT_LENGTH` are matched in a worker
+        process, and a `TimeoutError` is raised if the match takes longer than `timeout` or `GUARDED_TIMEOUT` seconds.
+        """
+        compiled, prefix, substring, vulnerable = RegexHelper._entry(pattern)
+
+        if not isinstance(string, str) or (not vulnerable and len(string) <= RegexHelper.GUARDED_INPUT_LENGTH):
+            return RegexHelper.is_match(compiled, string)
+
+        if not string.startswith(prefix) or substring not in string:
+            return False
+
+        return RegexGuard.shared().is_match(compiled, string, RegexHelper.GUARDED_TIMEOUT if timeout is None else timeout)
+
+
+    @staticmethod
+    def is_vulnerable(pattern: Union[str, Pattern]) -> bool:
+        """
+        Returns whether `pattern` nests a repeated expression inside another one, like `(a+)+`,
+        which can backtrack catastrophically on strings that almost match.
+        """
+        return RegexHelper._entry(pattern)[3]
+
+
+    @staticmethod
+    def literal_prefix(pattern: Union[str, Pattern]) -> str:
+        """
+        Returns the literal text which every match of `pattern` starts with, or an empty string if there is none.
+        Case-insensitive and bytes patterns never report a prefix.
+        """
+        return RegexHelper._entry(pattern)[1]
+
+
+    @staticmethod
+    def required_literals(pattern: Union[str, Pattern]) -> Tuple[str, str]:
+        """
+        Returns the literal prefix of `pattern` and the longest other literal text every match contains.
+        Either is an empty string if the pattern has none.
+        """
+        return RegexHelper._entry(pattern)[1:3]
+
+
+    @staticmethod
+    def set_cache_size(max_size: int):
+        """
+        Changes the number of compiled patterns kept in the cache, evicting the least recently used ones if required.
+        """
+        RegexHelper._cache.resize(max_size)
+        RegexHelper._compiled_cache.resize(max_size)
+
+
+    @staticmethod
+    def clear_cache():
+        """
+        Removes every compiled pattern from the cache and resets its counters, including the prefilter counters.
+        """
+        RegexHelper._cache.clear()
+        RegexHelper._compiled_cache.clear()
+        _prefilter_counts[:] = [0, 0]
+
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """
+        Returns the hit, miss and eviction counters of the compiled pattern cache.
+        """
+        return RegexHelper._cache.info()
+
+
+    @staticmethod
+    def prefilter_info() -> PrefilterInfo:
+        """
+        Returns how many matches had a literal prefilter, and how many of those were rejected by it.
+        The counters are not locked, so they are approximate when patterns are matched from several threads.
+        """
+        return PrefilterInfo(*_prefilter_counts)
+
+
+    @staticmethod
+    def _entry(pattern: Union[str, Pattern]) -> Tuple[Pattern, str, str, bool]:
+        """
+        Returns the compiled `pattern` with its literal prefix, its required substring and whether it is vulnerable.
+        Pre-compiled patterns are analyzed once and kept apart from the compiled pattern cache.
+        """
+        if isinstance(pattern, PATTERN_TYPE):
+            return RegexHelper._compiled_cache.get_or_create(pattern, RegexHelper._analyze)
+
+        return RegexHelper._cache.get_or_create(pattern, RegexHelper._analyze)
+
+
+    @staticmethod
+    def _analyze(pattern: Union[str, Pattern]) -> Tuple[Pattern, str, str, bool]:
+        """
+        Compiles the `pattern` and parses it for the literal text it starts with, the longest literal text
+        every match must contain and nested repeats. The substring is left empty when the prefix already contains it.
+        """
+        compiled = re.compile(pattern)
+
+        try:
+            parsed = sre_parse.parse(compiled.pattern, compiled.flags)
+        except Exception:
+            return (compiled, '', '', False)
+
+        vulnerable = RegexHelper._has_nested_repeat(parsed)
+
+        if not isinstance(compiled.pattern, str) or compiled.flags & re.IGNORECASE:
+            return (compiled, '', '', vulnerable)
+
+        runs = [[]]
+        RegexHelper._collect_runs(parsed, runs)
+
+        prefix = ''.join(runs[0])
+        substring = max((''.join(run) for run in runs), key=len)
+
+        return (compiled, prefix, '' if substring in prefix else substring, vulnerable)
+
+
+    @staticmethod
+    def _has_nested_repeat(parsed: list) -> bool:
+        """
+        Returns whether the `parsed` pattern contains an expression repeated more than once inside another such
+        expression, walking it with an explicit stack. Possessive repeats and atomic groups never backtrack,
+        so they are not searched.
+        """
+        stack = [(parsed, False)]
+
+        while stack:
+            subpattern, repeated = stack.pop()
+
+            for op, argument in subpattern:
+                if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+                    if argument[1] > 1:
+                        if repeated:
+                            return True
+
+                        stack.append((argument[2], True))
+                    else:
+                        stack.append((argument[2], repeated))
+                elif op is sre_parse.SUBPATTERN:
+                    stack.append((argument[3], repeated))
+                elif op is sre_parse.BRANCH:
+                    stack.extend((branch, repeated) for branch in argument[1])
+                elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+                    stack.append((argument[1], repeated))
+                elif op is sre_parse.GROUPREF_EXISTS:
+                    stack.extend((branch, repeated) for branch in argument[1:] if branch is not None)
+
+        return False
+
+
+    @staticmethod
+    def _collect_runs(parsed: list, runs: List[list]):
+        """
+        Appends the literal characters of the `parsed` sub-pattern to the last run in `runs`,
+        starting a new run wherever something other than a required literal appears.
+        The first run is the literal prefix, as a leading start-of-string anchor does not break it.
+        """
+        for op, argument in parsed:
+            if op is sre_parse.LITERAL:
+                runs[-1].append(chr(argument))
+            elif op is sre_parse.AT and len(runs) == 1 and not runs[0] and argument in (sre_parse.AT_BEGINNING, sre_parse.AT_BEGINNING_STRING):
+                continue
+            elif op is sre_parse.SUBPATTERN and not argument[1] & re.IGNORECASE:
+                RegexHelper._collect_runs(argument[3], runs)
+            elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and argument[0] >= 1:
+                runs.append([])
+                RegexHelper._collect_runs(argument[2], runs)
+                runs.append([])
+            else:
+                runs.append([])
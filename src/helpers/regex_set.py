@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable, List, Optional, Pattern, Union
+from .lru_cache import LruCache
+from .regex_helper import RegexHelper
+
+
+class RegexSet:
+    """
+    Prebuilt set of patterns which finds the patterns matching a value without running every pattern in turn.
+    Small sets are compiled into one alternation with a named group per pattern, while large sets are bucketed by the
+    first character of their literal prefix so only the patterns which can match are run.
+    """
+
+
+    __slots__ = (
+        'patterns',
+        '_compiled',
+        '_combined',
+        '_groups',
+        '_buckets',
+        '_unprefixed'
+    )
+
+
+    DEFAULT_CACHE_SIZE = 32
+    MAX_COMBINED_SIZE = 64
+
+
+    _COMBINABLE_FLAGS = re.UNICODE | re.IGNORECASE | re.MULTILINE | re.DOTALL
+    _GROUP_REFERENCE = re.compile(r'\\[1-9]|\(\?\(')
+    _LEADING_FLAGS = re.compile(r'^(?:\(\?[imsu]+\))+')
+    _cache = LruCache(DEFAULT_CACHE_SIZE)
+
+
+    def __init__(self, patterns: Iterable[Union[str, Pattern]]):
+        """
+        Builds the set for the `patterns`, combining them into a single alternation where they allow it.
+        An empty set is never combined, as the empty alternation would match every string.
+        """
+        self.patterns = tuple(dict.fromkeys(patterns))
+        self._compiled = tuple(RegexHelper.compile(pattern) for pattern in self.patterns)
+        self._combined = None
+        self._groups = None
+        self._buckets = None
+        self._unprefixed = None
+
+        if 0 < len(self._compiled) <= RegexSet.MAX_COMBINED_SIZE and all(map(RegexSet._is_combinable, self._compiled)):
+            self._combine()
+
+        if self._combined is None:
+            self._bucket()
+
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+
+    def __repr__(self) -> str:
+        return f'RegexSet({len(self.patterns)} patterns)'
+
+
+    @property
+    def is_combined(self) -> bool:
+        """
+        Returns whether the patterns are matched through a single combined alternation.
+        """
+        return self._combined is not None
+
+
+    def find(self, string: str) -> Optional[Union[str, Pattern]]:
+        """
+        Returns the first of the patterns, in the order they were given, which matches the start of the `string`,
+        or `None` if none of them match.
+        """
+        if self._combined is not None:
+            match = self._combined.match(string)
+
+            return None if match is None else self.patterns[self._groups[match.lastgroup]]
+
+        for index in self._candidates(string):
+            if self._compiled[index].match(string) is not None:
+                return self.patterns[index]
+
+        return None
+
+
+    def matches(self, string: str) -> List[Union[str, Pattern]]:
+        """
+        Returns every pattern which matches the start of the `string`, in the order they were given.
+        """
+        if self._combined is not None and self._combined.match(string) is None:
+            return []
+
+        indices = range(len(self._compiled)) if self._buckets is None else self._candidates(string)
+
+        return [self.patterns[index] for index in indices if self._compiled[index].match(string) is not None]
+
+
+    @staticmethod
+    def of(patterns: Iterable[Union[str, Pattern]]) -> RegexSet:
+        """
+        Returns a pattern set for `patterns`. Sets are returned as they are, while tuples and frozensets are built
+        once and cached by identity. Lists and sets are cached along with a copy of their patterns, and built again
+        once they were modified, which costs a comparison of the patterns on every call.
+        """
+        if isinstance(patterns, RegexSet):
+            return patterns
+
+        if not isinstance(patterns, (list, tuple, set, frozenset)):
+            return RegexSet(patterns)
+
+        return RegexSet._cache.get_or_create_by_identity(patterns, RegexSet)
+
+
+    def _candidates(self, string: str) -> tuple:
+        """
+        Returns the indices of the patterns whose literal prefix the `string` starts with.
+        """
+        return tuple(
+            index
+            for index, prefix in self._buckets.get(string[:1], self._unprefixed)
+            if string.startswith(prefix)
+        )
+
+
+    def _combine(self):
+        """
+        Compiles the patterns into one alternation, wrapping each in a named group which records the pattern index.
+        Leading inline flags are moved into a scoped group, since global flags are only allowed at the very start.
+        Falls back to the buckets if the combined pattern does not compile.
+        """
+        alternatives = []
+        groups = {}
+
+        for index, compiled in enumerate(self._compiled):
+            name = f'_p{index}'
+            flags = ''.join(
+                letter
+                for flag, letter in ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+                if compiled.flags & flag
+            )
+            body = RegexSet._LEADING_FLAGS.sub('', compiled.pattern)
+            body = f'(?{flags}:{body})' if flags else body
+            alternatives.append(f'(?P<{name}>{body})')
+            groups[name] = index
+
+        try:
+            self._combined = re.compile('|'.join(alternatives))
+        except re.error:
+            return
+
+        self._groups = groups
+
+
+    def _bucket(self):
+        """
+        Groups the pattern indices by the first character of their literal prefix.
+        Patterns without a prefix are candidates for every string, so they are merged into each bucket.
+        """
+        prefixed = {}
+        unprefixed = []
+
+        for index, compiled in enumerate(self._compiled):
+            prefix = RegexHelper.literal_prefix(compiled)
+
+            if prefix:
+                prefixed.setdefault(prefix[0], []).append((index, prefix))
+            else:
+                unprefixed.append((index, ''))
+
+        self._unprefixed = tuple(unprefixed)
+        self._buckets = {
+            character: tuple(sorted(bucket + unprefixed))
+            for character, bucket in prefixed.items()
+        }
+
+
+    @staticmethod
+    def _is_combinable(compiled: Pattern) -> bool:
+        """
+        Returns whether the `compiled` pattern keeps its meaning inside a combined alternation. Named groups could
+        collide, group references would point at the wrong group once the groups are renumbered, and global flags
+        other than `i`, `m` and `s` cannot be scoped to a single alternative.
+        Text which merely looks like a group reference is treated as one, which only costs the combination.
+        """
+        return (
+            isinstance(compiled.pattern, str)
+            and not compiled.groupindex
+            and not compiled.flags & ~RegexSet._COMBINABLE_FLAGS
+            and not (compiled.groups and RegexSet._GROUP_REFERENCE.search(compiled.pattern))
+        )
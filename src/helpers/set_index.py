@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+from .lru_cache import LruCache
+
+
+class SetIndex:
+    """
+    Prebuilt membership index over a collection of values, backed by a `frozenset` so every lookup is O(1).
+    Case-insensitive lookups use a casefolded `frozenset`, which is built on first use.
+    """
+
+
+    __slots__ = (
+        'items',
+        '_casefolded'
+    )
+
+
+    DEFAULT_CACHE_SIZE = 64
+
+
+    MIN_INDEXED_SIZE = 8
+
+
+    _cache = LruCache(DEFAULT_CACHE_SIZE)
+    _snapshots = LruCache(DEFAULT_CACHE_SIZE)
+
+
+    def __init__(self, values: Iterable):
+        """
+        Initializes the index with the `values`, which must be hashable.
+        """
+        self.items = frozenset(values)
+        self._casefolded = None
+
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            return value in self.items
+        except TypeError:
+            return False
+
+
+    def __iter__(self) -> Iterator:
+        return iter(self.items)
+
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+    def __repr__(self) -> str:
+        return f'SetIndex({len(self.items)} values)'
+
+
+    @property
+    def casefolded(self) -> frozenset:
+        """
+        Returns the casefolded string values of the index, building them on first access.
+        """
+        if self._casefolded is None:
+            self._casefolded = frozenset(SetIndex.casefold(item) for item in self.items if isinstance(item, str))
+
+        return self._casefolded
+
+
+    def contains_case_insensitive(self, value: str) -> bool:
+        """
+        Returns whether the index contains the `value`, ignoring case using `str.casefold()` semantics.
+        Values which are in the index as they are skip the casefolding.
+        """
+        return value in self.items or SetIndex.casefold(value) in self.casefolded
+
+
+    @staticmethod
+    def casefold(value: str) -> str:
+        """
+        Returns the casefolded `value`, using the cheaper `str.lower()` for ASCII-only values where both are equal.
+        """
+        return value.lower() if value.isascii() else value.casefold()
+
+
+    @staticmethod
+    def of(values: Iterable, min_size: int = None) -> object:
+        """
+        Returns a container with O(1) membership for `values`. Indexes are returned as they are, while tuples and
+        frozensets are indexed once and cached by identity, as they cannot change afterwards. Mutable collections are
+        returned as they are, since a cached index would not see them being modified in place; build a `SetIndex`
+        with `Condition.index()` to index them explicitly.
+        Unhashable collections, and collections smaller than `min_size` (`MIN_INDEXED_SIZE` by default),
+        are returned as they are.
+        """
+        if min_size is None:
+            min_size = SetIndex.MIN_INDEXED_SIZE
+
+        if not isinstance(values, (tuple, frozenset)) or len(values) < min_size:
+            return values
+
+        try:
+            return SetIndex._cache.get_or_create_by_identity(values, SetIndex)
+        except TypeError:
+            return values
+
+
+    @staticmethod
+    def of_mutable(values: Iterable) -> object:
+        """
+        Returns an index of the list or set `values`, cached by identity along with a copy of their contents.
+        The index is only reused while the contents still equal the copy, so modifying the collection in place is
+        seen on the next call. Comparing the contents is O(n), but much cheaper than building the index again.
+        Other collections are returned as they are. Throws a `TypeError` if the values are unhashable.
+        """
+        if not isinstance(values, (list, set)):
+            return values
+
+        key = id(values)
+        entry = SetIndex._snapshots.get(key)
+
+        if entry is not None and entry[0] is values and entry[1] == values:
+            return entry[2]
+
+        snapshot = values.copy()
+        index = SetIndex(snapshot)
+        SetIndex._snapshots.put(key, (values, snapshot, index))
+
+        return index
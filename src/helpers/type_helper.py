@@ -0,0 +1,145 @@
+from abc import ABCMeta, get_cache_token
+from inspect import isclass
+from typing import FrozenSet, Optional, Tuple
+
+
+class TypeHelper:
+    """
+    Defines type checking helper methods.
+    """
+
+
+    MAX_CACHE_SIZE = 1024
+
+
+    _verdicts = {}
+    _name_sets = {}
+    _token = get_cache_token()
+
+
+    @staticmethod
+    def first_instance_of(value: object, types: Tuple[type, ...]) -> Optional[int]:
+        """
+        Returns the index of the first of the `types` which `value` is an instance of, or -1 if it is none of them.
+        Returns `None` if `types` is empty or contains anything other than a class, leaving the caller to report it.
+
+        Verdicts are cached per class of `value` and `types`, so repeated checks take a single dict lookup.
+        The cache is cleared whenever an ABC registers a subclass, the same point at which `ABCMeta` drops its own
+        negative cache. Values whose `__class__` differs from their type are never cached.
+        """
+        cls = type(value)
+
+        if TypeHelper._token != get_cache_token():
+            TypeHelper.clear_cache()
+
+        if value.__class__ is not cls:
+            return TypeHelper._first_instance_of(value, types)[0]
+
+        key = (cls, types)
+
+        try:
+            return TypeHelper._verdicts[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return TypeHelper._first_instance_of(value, types)[0]
+
+        index, cacheable = TypeHelper._first_instance_of(value, types)
+
+        if cacheable:
+            if len(TypeHelper._verdicts) >= TypeHelper.MAX_CACHE_SIZE:
+                TypeHelper._verdicts.clear()
+
+            TypeHelper._verdicts[key] = index
+
+        return index
+
+
+    @staticmethod
+    def name_set(classes: Tuple[type, ...], qualified: bool = False) -> Optional[FrozenSet[str]]:
+        """
+        Returns the names of the `classes`, or their fully qualified names if `qualified` is set, cached per tuple.
+        Returns `None` if any of them is a metaclass, meaning a class rather than an initialized object was passed.
+        """
+        key = (classes, qualified)
+
+        try:
+            return TypeHelper._name_sets[key]
+        except KeyError:
+            pass
+
+        if any(issubclass(cls, type) for cls in classes):
+            return None
+
+        names = frozenset(TypeHelper.type_name(cls, qualified) for cls in classes)
+
+        if len(TypeHelper._name_sets) >= TypeHelper.MAX_CACHE_SIZE:
+            TypeHelper._name_sets.clear()
+
+        TypeHelper._name_sets[key] = names
+
+        return names
+
+
+    @staticmethod
+    def type_name(cls: type, qualified: bool = False) -> str:
+        """
+        Returns the `__name__` of `cls`, or `__module__.__qualname__` if `qualified` is set.
+        """
+        if qualified:
+            return f'{cls.__module__}.{cls.__qualname__}'
+
+        return cls.__name__
+
+
+    @staticmethod
+    def clear_cache():
+        """
+        Removes every cached type check verdict and name set.
+        """
+        TypeHelper._verdicts.clear()
+        TypeHelper._name_sets.clear()
+        TypeHelper._token = get_cache_token()
+
+
+    @staticmethod
+    def _first_instance_of(value: object, types: Tuple[type, ...]) -> Tuple[Optional[int], bool]:
+        """
+        Returns the index of the first of the `types` which `value` is an instance of, and whether that verdict
+        depends only on the class of `value` so it can be cached.
+        """
+        if not types or not all(isclass(type_) for type_ in types):
+            return None, False
+
+        cacheable = True
+
+        for index, type_ in enumerate(types):
+            verdict = isinstance(value, type_)
+            cacheable = cacheable and TypeHelper._is_class_based(value, type_, verdict)
+
+            if verdict:
+                return index, cacheable
+
+        return -1, cacheable
+
+
+    @staticmethod
+    def _is_class_based(value: object, type_: type, verdict: bool) -> bool:
+        """
+        Returns whether the `verdict` of `isinstance(value, type_)` holds for every instance of the class of `value`.
+        Plain classes and ABCs only look at the class. Runtime protocols look at the instance, which may provide members
+        its class lacks, so only positive verdicts which `issubclass()` confirms are trusted. It refuses to answer for
+        protocols with data members. Any other `__instancecheck__` is assumed to depend on the instance.
+        """
+        instance_check = type(type_).__instancecheck__
+
+        if instance_check is type.__instancecheck__ or instance_check is ABCMeta.__instancecheck__:
+            return True
+
+        if getattr(type_, '_is_protocol', False):
+            try:
+                return verdict and issubclass(type(value), type_)
+            except TypeError:
+                return False
+
+        return False
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import reprlib
+import weakref
+
+
+class WeakValue(weakref.ref):
+    """
+    Weak reference to a captured value, along with a bounded representation of it for messages.
+    """
+
+
+    __slots__ = (
+        'summary',
+    )
+
+
+class _BoundedRepr(reprlib.Repr):
+    """
+    Representation which only renders the part of a value it shows.
+    """
+
+
+    def repr_bytes(self, value: bytes, level: int) -> str:
+        return repr(value[:self.maxstring + 1])
+
+
+    def repr_bytearray(self, value: bytearray, level: int) -> str:
+        return repr(value[:self.maxstring + 1])
+
+
+    def repr_int(self, value: int, level: int) -> str:
+        if value.bit_length() > self.maxlong * 4:
+            return ValueCapture.describe(value)
+
+        return super().repr_int(value, level)
+
+
+    def repr_instance(self, value: object, level: int) -> str:
+        try:
+            len(value)
+        except TypeError:
+            return super().repr_instance(value, level)
+
+        return ValueCapture.describe(value)
+
+
+class ValueCapture:
+    """
+    Controls how much of the failing value an error keeps, for both its `value` attribute and its message.
+
+    - `full` keeps the value itself.
+    - `truncated` keeps a representation of the value which is cut at `max_length` characters.
+    - `type` keeps only the type of the value and its length, so no content is kept at all.
+    - `weakref` keeps a weak reference to the value, with a truncated representation for messages.
+      Values which cannot be weakly referenced are truncated instead.
+
+    Under every policy other than `full`, a validator which raised lets go of the value as well, as the frames on the
+    traceback of its error reference it, so the error does not keep the value alive through its traceback either.
+    """
+
+
+    POLICIES = ('full', 'truncated', 'type', 'weakref')
+    DEFAULT_MAX_LENGTH = 80
+
+
+    policy = 'full'
+    max_length = DEFAULT_MAX_LENGTH
+
+
+    _repr = _BoundedRepr()
+
+
+    @staticmethod
+    def configure(policy: str = 'full', max_length: int = DEFAULT_MAX_LENGTH):
+        """
+        Sets the capture `policy` for every error created afterwards, and the `max_length` of truncated values.
+        """
+        if policy not in ValueCapture.POLICIES:
+            raise ValueError(
+                f'The value capture policy should be `full`, `truncated`, `type` or `weakref`, but was `{policy}`'
+            )
+
+        if max_length < 4:
+            raise ValueError(f'The maximum length of captured values should be at least `4`, but was `{max_length}`')
+
+        ValueCapture.policy = policy
+        ValueCapture.max_length = max_length
+        ValueCapture._repr.maxstring = max_length
+        ValueCapture._repr.maxlong = max_length
+        ValueCapture._repr.maxother = max_length
+
+
+    @staticmethod
+    def capture(value: object) -> object:
+        """
+        Returns what an error keeps of the `value` under the current policy.
+        """
+        policy = ValueCapture.policy
+
+        if policy == 'full':
+            return value
+
+        if policy == 'type':
+            return ValueCapture.describe(value)
+
+        if policy == 'weakref':
+            try:
+                captured = WeakValue(value)
+            except TypeError:
+                return ValueCapture.truncate(value)
+
+            captured.summary = ValueCapture.truncate(value)
+
+            return captured
+
+        return ValueCapture.truncate(value)
+
+
+    @staticmethod
+    def resolve(captured: object) -> object:
+        """
+        Returns the value kept by an error, or `None` if it was weakly referenced and has since been collected.
+        """
+        if type(captured) is WeakValue:
+            return captured()
+
+        return captured
+
+
+    @staticmethod
+    def message_value(captured: object) -> object:
+        """
+        Returns what the message of an error shows for the value it kept.
+        """
+        if type(captured) is WeakValue:
+            return captured.summary
+
+        return captured
+
+
+    @staticmethod
+    def truncate(value: object) -> str:
+        """
+        Returns the representation of `value`, cut at `max_length` characters. Strings, bytes, integers and the
+        builtin containers are abbreviated while the representation is built, so they are never rendered in full.
+        Other values with a length, which could be arbitrarily large, are described like `describe()` instead, and
+        the remaining values are rendered in full before being cut.
+        """
+        text = ValueCapture._repr.repr(value)
+
+        if len(text) > ValueCapture.max_length:
+            text = text[:ValueCapture.max_length - 3] + '...'
+
+        return text
+
+
+    @staticmethod
+    def describe(value: object) -> str:
+        """
+        Returns the type name of `value`, along with its length if it has one.
+        """
+        try:
+            return f'<{type(value).__name__} of length {len(value)}>'
+        except TypeError:
+            return f'<{type(value).__name__}>'
+
+
+ValueCapture.configure()
@@ -0,0 +1 @@
+from .validation_plan import ValidationPlan
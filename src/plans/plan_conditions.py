@@ -0,0 +1,60 @@
+"""
+Failure predicates of the conditions which a `ValidationPlan` inlines into its compiled function.
+
+Each predicate is a Python expression over `value` which is true when the condition fails, with `{0}`, `{1}`, ...
+standing in for the arguments of the condition. Conditions without a predicate are replayed on a validator.
+"""
+
+
+NUMBER_CONDITIONS = {
+    'is_in_range': 'value < {0} or value > {1}',
+    'is_not_in_range': 'value >= {0} and value <= {1}',
+    'is_greater_than': 'value <= {0}',
+    'is_greater_or_equal': 'value < {0}',
+    'is_less_than': 'value >= {0}',
+    'is_less_or_equal': 'value > {0}',
+    'is_equal_to': 'value != {0}',
+    'is_not_equal_to': 'value == {0}',
+    'is_positive': 'value < 0',
+    'is_negative': 'value >= 0'
+}
+
+
+BOOLEAN_CONDITIONS = {
+    'is_true': 'not value == True',
+    'is_false': 'not value == False'
+}
+
+
+OBJECT_CONDITIONS = {
+    'is_null': 'value is not None',
+    'is_not_null': 'value is None'
+}
+
+
+STRING_CONDITIONS = {
+    'is_null': 'value is not None',
+    'is_not_null': 'value is None',
+    'is_null_or_empty': "value is not None and value != ''",
+    'is_not_null_or_empty': "value is None or value == ''",
+    'is_null_or_whitespace': "value is not None and value != '' and not str(value).isspace()",
+    'is_not_null_or_whitespace': "value is None or value == '' or str(value).isspace()",
+    'is_shorter_than': 'len(value) >= {0}',
+    'is_shorter_or_equal': 'len(value) > {0}',
+    'is_longer_than': 'len(value) <= {0}',
+    'is_longer_or_equal': 'len(value) < {0}',
+    'has_length': 'len(value) != {0}',
+    'does_not_have_length': 'len(value) == {0}',
+    'equals': 'value != {0}',
+    'does_not_equal': 'value == {0}',
+    'starts_with': 'not str(value).startswith({0})',
+    'does_not_start_with': 'str(value).startswith({0})',
+    'ends_with': 'not str(value).endswith({0})',
+    'does_not_end_with': 'str(value).endswith({0})',
+    'contains': '{0} not in value',
+    'does_not_contain': '{0} in value',
+    'is_regex_match': 'not is_match({0}, value)',
+    'is_not_regex_match': 'is_match({0}, value)',
+    'is_in_set': 'not value in index_of({0})',
+    'is_not_in_set': 'value in index_of({0})'
+}
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, List, Sequence
+from ..errors.argument_error import ArgumentError
+from ..validators.error_collector import ErrorCollector
+from ..validators.noop_validator import NoopValidator
+from ..helpers.regex_helper import RegexHelper
+from ..helpers.set_index import SetIndex
+
+
+class ValidationPlan:
+    """
+    Records a chain of conditions once and compiles it into a single specialized function,
+    which validates a value without allocating a validator.
+    """
+
+
+    LITERAL_TYPES = (bool, int, str, type(None))
+
+
+    def __init__(self, validator_type: type, argument_name: str, conditions: dict):
+        """
+        Initializes an empty plan for the `validator_type`, using the inlinable failure predicates in `conditions`.
+        """
+        self.validator_type = validator_type
+        self.argument_name = argument_name
+        self.conditions = conditions
+        self.steps = []
+
+
+    def __getattr__(self, name: str) -> Callable[..., ValidationPlan]:
+        """
+        Resolves the conditions of the validator to functions which record a step in the plan.
+        """
+        if name.startswith('_') or name == 'get_value' or not callable(getattr(self.validator_type, name, None)):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        def record(*args, **kwargs) -> ValidationPlan:
+            self.steps.append((name, args, kwargs))
+            return self
+
+        return record
+
+
+    def compile(self) -> Callable[[object], object]:
+        """
+        Generates and returns a function which runs every recorded condition against its single `value` argument
+        and returns the value. Failing conditions raise the same errors as the validator. Within a collecting scope,
+        the first failure is recorded and the remaining conditions are skipped, like on a validator chain.
+        """
+        namespace = self._namespace()
+        lines = ['def plan(value):']
+
+        for index, predicate in enumerate(self._predicates(namespace)):
+            if predicate is None:
+                lines.append(f'    if replay({index}, value):')
+                lines.append('        return value')
+                continue
+
+            lines.append(f'    if {predicate}:')
+            lines.append(f'        if replay({index}, value):')
+            lines.append('            return value')
+
+        lines.append('    return value')
+
+        return self._build(namespace, lines, 'plan')
+
+
+    def compile_batch(self) -> Callable[[Sequence], List[bytearray]]:
+        """
+        Generates and returns a function which runs every recorded condition across a sequence of values in one pass,
+        without stopping at invalid values. It returns one bitmap per condition, with a bit set for each failed value.
+        """
+        namespace = self._namespace()
+        predicates = self._predicates(namespace)
+        lines = ['def batch(values):', '    size = (len(values) + 7) >> 3']
+
+        for index in range(len(predicates)):
+            lines.append(f'    bitmap_{index} = bytearray(size)')
+
+        lines.append('    for index, value in enumerate(values):')
+
+        for index, predicate in enumerate(predicates):
+            failure = f'replay_failed({index}, value)' if predicate is None else predicate
+
+            lines.append('        try:')
+            lines.append(f'            if {failure}:')
+            lines.append(f'                bitmap_{index}[index >> 3] |= 1 << (index & 7)')
+            lines.append('        except (TypeError, AttributeError):')
+            lines.append(f'            bitmap_{index}[index >> 3] |= 1 << (index & 7)')
+
+        lines.append(f'    return [{", ".join(f"bitmap_{index}" for index in range(len(predicates)))}]')
+
+        return self._build(namespace, lines, 'batch')
+
+
+    def _namespace(self) -> dict:
+        """
+        Returns the globals of a generated function.
+        """
+        return {
+            'is_match': RegexHelper.is_match,
+            'index_of': SetIndex.of,
+            'replay': self._replay,
+            'replay_failed': self._replay_failed
+        }
+
+
+    def _predicates(self, namespace: dict) -> list:
+        """
+        Returns the failure predicate source of every step, or `None` for steps which have to be replayed on a validator.
+        Steps passing keyword arguments, or optional arguments which the predicate does not use, are replayed too.
+        """
+        predicates = []
+
+        for index, (name, args, kwargs) in enumerate(self.steps):
+            predicate = self.conditions.get(name)
+
+            if predicate is not None and (kwargs or args and f'{{{len(args) - 1}}}' not in predicate):
+                predicate = None
+
+            if predicate is not None:
+                constants = [self._constant(namespace, index, position, arg) for position, arg in enumerate(args)]
+                predicate = predicate.format(*constants)
+
+            predicates.append(predicate)
+
+        return predicates
+
+
+    def _build(self, namespace: dict, lines: list, name: str) -> Callable:
+        """
+        Compiles the generated `lines` and returns the function called `name`, with its source attached.
+        """
+        source = '\n'.join(lines)
+        exec(compile(source, f'<{name} {self.argument_name}>', 'exec'), namespace)
+
+        function = namespace[name]
+        function.source = source
+
+        return function
+
+
+    def _replay(self, index: int, value: object) -> bool:
+        """
+        Runs the step at `index` on a validator, which raises the error of the condition if it fails.
+        Returns whether the failure was recorded by a collecting scope instead.
+        """
+        name, args, kwargs = self.steps[index]
+
+        return type(getattr(self.validator_type(value, self.argument_name), name)(*args, **kwargs)) is NoopValidator
+
+
+    def _replay_failed(self, index: int, value: object) -> bool:
+        """
+        Runs the step at `index` on a validator and returns whether its condition failed.
+        Any collecting scope is suspended, since the batch reports failures through its bitmaps.
+        """
+        if ErrorCollector.active() is not None:
+            with ErrorCollector.suspend():
+                return self._replay_failed(index, value)
+
+        try:
+            self._replay(index, value)
+        except ArgumentError:
+            return True
+
+        return False
+
+
+    def _constant(self, namespace: dict, index: int, position: int, arg: object) -> str:
+        """
+        Returns the source of a condition argument, as a literal where possible or as a name bound in the `namespace`.
+        """
+        if type(arg) in self.LITERAL_TYPES or (type(arg) is float and math.isfinite(arg)):
+            return repr(arg)
+
+        name = f'c{index}_{position}'
+        namespace[name] = arg
+
+        return name
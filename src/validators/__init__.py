@@ -1,5 +1,16 @@
 from .boolean_validator import BooleanValidator
+from .check_result import CheckResult
+from .check_validator import BooleanCheckValidator
+from .check_validator import CheckValidator
+from .check_validator import NumberCheckValidator
+from .check_validator import ObjectCheckValidator
+from .check_validator import StringCheckValidator
+from .error_collector import ErrorCollector
+from .noop_validator import NoopValidator
+from .number_array_validator import NumberArrayValidator
 from .number_validator import NumberValidator
 from .object_validator import ObjectValidator
+from .string_batch_validator import StringBatchValidator
 from .string_validator import StringValidator
-from .validator import Validator
\ No newline at end of file
+from .validator import Validator
+from .validator_pool import ValidatorPool
\ No newline at end of file
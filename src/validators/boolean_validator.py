@@ -10,6 +10,9 @@ class BooleanValidator(Validator):
     """
 
 
+    __slots__ = ()
+
+
     def __init__(self, value: str, argument_name: str):
         """
         Initializes the validator base class with the `value` and `argument_name`.
@@ -29,10 +32,9 @@ class BooleanValidator(Validator):
         Checks whether the given value is `True`. An exception is thrown otherwise.
         """
         if not self.value == True:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should be True but was `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should be True but was `{value}`'
             )
 
         return self
@@ -43,10 +45,9 @@ class BooleanValidator(Validator):
         Checks whether the given value is `True`. An exception is thrown otherwise.
         """
         if not self.value == False:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should be False but was `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should be False but was `{value}`'
             )
 
         return self
\ No newline at end of file
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Type
+from ..errors.argument_error import ArgumentError
+
+
+class CheckResult:
+    """
+    Outcome of a condition chain evaluated in check mode. A failed result stands in for the validator
+    in the rest of the chain, skipping every following condition.
+    """
+
+
+    __slots__ = (
+        'ok',
+        'error_type',
+        'condition',
+        'value',
+        'argument_name',
+        'message',
+        'message_args',
+        'error_args',
+        'validator_type'
+    )
+
+
+    OK = None
+
+
+    def __init__(
+        self,
+        ok: bool,
+        error_type: Type[ArgumentError] = None,
+        condition: str = None,
+        value: object = None,
+        argument_name: str = None,
+        message: str = None,
+        message_args: dict = None,
+        error_args: dict = None,
+        validator_type: type = None
+    ):
+        """
+        Initializes the result. Only failed results carry the details of the offending condition.
+        """
+        self.ok = ok
+        self.error_type = error_type
+        self.condition = condition
+        self.value = value
+        self.argument_name = argument_name
+        self.message = message
+        self.message_args = message_args
+        self.error_args = error_args
+        self.validator_type = validator_type
+
+
+    @property
+    def error_code(self) -> str:
+        """
+        Returns the name of the error type the condition would have raised, or `None` if the chain passed.
+        """
+        return self.error_type.__name__ if self.error_type is not None else None
+
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return 'CheckResult(ok=True)'
+
+        return f'CheckResult(ok=False, error_code={self.error_code!r}, condition={self.condition!r})'
+
+
+    def __getattr__(self, name: str):
+        """
+        Resolves the conditions of the failed validator to a no-op, so the rest of the chain is skipped.
+        """
+        validator_type = object.__getattribute__(self, 'validator_type')
+
+        if validator_type is not None and callable(getattr(validator_type, name, None)):
+            return self._skip
+
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+
+    def _skip(self, *args, **kwargs) -> CheckResult:
+        return self
+
+
+    def get_value(self) -> object:
+        """
+        Returns the value which failed the condition, like `get_value()` on the validator the result stands in for.
+        """
+        return self.value
+
+
+    def result(self) -> CheckResult:
+        """
+        Returns the result itself, so `result()` can end a chain whether it failed or not.
+        """
+        return self
+
+
+    def to_error(self) -> ArgumentError:
+        """
+        Returns the error the failed condition would have raised, or `None` if the chain passed.
+        """
+        if self.ok:
+            return None
+
+        return self.error_type(
+            self.message,
+            self.value,
+            self.argument_name,
+            message_args=self.message_args,
+            **self.error_args
+        )
+
+
+    def raise_if_failed(self):
+        """
+        Raises the error the failed condition would have raised. Does nothing if the chain passed.
+        """
+        if not self.ok:
+            raise self.to_error()
+
+
+CheckResult.OK = CheckResult(True)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import sys
+from .check_result import CheckResult
+from .boolean_validator import BooleanValidator
+from .number_validator import NumberValidator
+from .object_validator import ObjectValidator
+from .string_validator import StringValidator
+
+
+class CheckValidator:
+    """
+    Mixin which turns a validator into its non-raising check mode. The first failing condition returns
+    a failed `CheckResult` instead of raising, and `result()` ends the chain.
+    """
+
+
+    __slots__ = ()
+
+
+    def result(self) -> CheckResult:
+        """
+        Returns the shared successful result, as every condition in the chain passed.
+        """
+        return CheckResult.OK
+
+
+    def _fail(self, error_type, message, message_args=None, **error_args) -> CheckResult:
+        """
+        Records the failed condition in a `CheckResult` without building or raising the error.
+        """
+        return CheckResult(
+            False,
+            error_type,
+            sys._getframe(1).f_code.co_name,
+            self.value,
+            self.argument_name,
+            message,
+            message_args if message_args is not None else {},
+            error_args,
+            self.__class__
+        )
+
+
+class BooleanCheckValidator(CheckValidator, BooleanValidator):
+    """
+    Contains all the boolean validation conditions in check mode.
+    """
+
+
+    __slots__ = ()
+
+
+class NumberCheckValidator(CheckValidator, NumberValidator):
+    """
+    Contains all the number (int and float) validation conditions in check mode.
+    """
+
+
+    __slots__ = ()
+
+
+class ObjectCheckValidator(CheckValidator, ObjectValidator):
+    """
+    Contains all the object validation conditions in check mode.
+    """
+
+
+    __slots__ = ()
+
+
+class StringCheckValidator(CheckValidator, StringValidator):
+    """
+    Contains all the string validation conditions in check mode.
+    """
+
+
+    __slots__ = ()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from ..errors.argument_error import ArgumentError
+from ..errors.argument_error_group import ArgumentErrorGroup
+
+
+_active = ContextVar('conditions_py_error_collector', default=None)
+
+
+class ErrorCollector:
+    """
+    Validation scope in which failed conditions are recorded instead of raised. Each failing chain records its first
+    failure and skips its remaining conditions, and the scope raises a single `ArgumentErrorGroup` on exit.
+    The recorded errors are never raised, so no traceback is captured for them.
+    """
+
+
+    __slots__ = (
+        'errors',
+        '_token'
+    )
+
+
+    MESSAGE = 'One or more arguments failed validation'
+
+
+    def __init__(self):
+        """
+        Initializes an empty scope.
+        """
+        self.errors = []
+        self._token = None
+
+
+    def __enter__(self) -> ErrorCollector:
+        self._token = _active.set(self)
+        return self
+
+
+    def __exit__(self, error_type: type, error: BaseException, traceback: object) -> bool:
+        _active.reset(self._token)
+        self._token = None
+
+        if error_type is None and self.errors:
+            raise ArgumentErrorGroup(ErrorCollector.MESSAGE, self.errors)
+
+        return False
+
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+
+    def __iter__(self) -> Iterator[ArgumentError]:
+        return iter(self.errors)
+
+
+    @staticmethod
+    def active() -> Optional[ErrorCollector]:
+        """
+        Returns the innermost scope of the current context, or `None` if conditions raise as usual.
+        """
+        return _active.get()
+
+
+    @staticmethod
+    @contextmanager
+    def suspend() -> Iterator[None]:
+        """
+        Lets conditions raise as usual within the `with` block, even inside a collecting scope.
+        """
+        token = _active.set(None)
+
+        try:
+            yield
+        finally:
+            _active.reset(token)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from .boolean_validator import BooleanValidator
+from .number_validator import NumberValidator
+from .object_validator import ObjectValidator
+from .string_validator import StringValidator
+from .validator import Validator
+
+
+class NoopValidator:
+    """
+    Validator which skips every condition, standing in for the real validators while validation is switched off
+    and for chains whose failure was recorded by a collecting scope. It keeps the value so `get_value()` still
+    returns it, and holds nothing else.
+    """
+
+
+    __slots__ = (
+        'value',
+    )
+
+
+    def __init__(self, value: object = None):
+        """
+        Initializes the validator with the `value` returned by `get_value()`.
+        """
+        self.value = value
+
+
+    def get_value(self) -> object:
+        """
+        Returns the value the validator stands in for.
+        """
+        return self.value
+
+
+    def rebind(self, value: object, argument_name: str = None) -> NoopValidator:
+        """
+        Points the validator at another `value`, skipping it like every condition.
+        """
+        self.value = value
+
+        return self
+
+
+    def _skip(self, *args, **kwargs) -> NoopValidator:
+        return self
+
+
+for validator_type in (Validator, BooleanValidator, NumberValidator, ObjectValidator, StringValidator):
+    for name, attribute in vars(validator_type).items():
+        if callable(attribute) and not name.startswith('_') and name not in ('get_value', 'rebind'):
+            setattr(NoopValidator, name, NoopValidator._skip)
+
+del validator_type, name, attribute
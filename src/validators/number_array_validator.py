@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+from typing import TypeVar
+from .validator import Validator
+from ..errors.argument_out_of_range_error import ArgumentOutOfRangeError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+number = TypeVar('number', int, float)
+
+
+class NumberArrayValidator(Validator):
+    """
+    Contains the number validation conditions for NumPy arrays, evaluated as boolean reductions over every element.
+    Range conditions are first proven from the range of the dtype or the minimum and maximum of the array,
+    so the per-element mask is only built when a bound is actually violated.
+    NumPy is an optional dependency, which is only required once an array validator is created.
+    """
+
+
+    __slots__ = (
+        '_extrema',
+    )
+
+
+    MAX_REPORTED_INDICES = 10
+
+
+    def __init__(self, value: object, argument_name: str):
+        """
+        Initializes the validator base class with the `value` converted to an array and the `argument_name`.
+        """
+        if numpy is None:
+            raise ImportError('NumPy is required to validate arrays, install it using `pip install numpy`.')
+
+        super().__init__(numpy.asarray(value), argument_name)
+
+        self._extrema = None
+
+
+    def rebind(self, value: object, argument_name: str = None) -> NumberArrayValidator:
+        """
+        Points the validator at another `value`, converted to an array, and `argument_name` if given.
+        """
+        super().rebind(numpy.asarray(value), argument_name)
+
+        self._extrema = None
+
+        return self
+
+
+    def get_value(self) -> numpy.ndarray:
+        """
+        Returns the validator value.
+        """
+        return super().get_value()
+
+
+    def is_in_range(self, min_value: number, max_value: number) -> NumberArrayValidator:
+        """
+        Checks whether every element is between `min_value` and `max_value` (including those values).
+        An exception is thrown otherwise.
+        """
+        if self._is_within(min_value, max_value):
+            return self
+
+        return self._fail_where(
+            (self.value < min_value) | (self.value > max_value),
+            'The argument `{argument_name}` has `{failure_count}` element(s) out of the range `{min_value}-{max_value}`, at indices `{failure_indices}`',
+            min_value=min_value,
+            max_value=max_value
+        )
+
+
+    def is_not_in_range(self, min_value: number, max_value: number) -> NumberArrayValidator:
+        """
+        Checks whether every element is not between `min_value` and `max_value` (including those values).
+        An exception is thrown otherwise.
+        """
+        return self._fail_where(
+            (self.value >= min_value) & (self.value <= max_value),
+            'The argument `{argument_name}` has `{failure_count}` element(s) in the range `{min_value}-{max_value}`, at indices `{failure_indices}`',
+            min_value=min_value,
+            max_value=max_value
+        )
+
+
+    def is_greater_than(self, min_value: number) -> NumberArrayValidator:
+        """
+        Checks whether every element is greater than the specified `min_value`.
+        An exception is thrown otherwise.
+        """
+        if self._is_within(min_value=min_value, min_inclusive=False):
+            return self
+
+        return self._fail_where(
+            self.value <= min_value,
+            'The argument `{argument_name}` has `{failure_count}` element(s) not greater than `{min_value}`, at indices `{failure_indices}`',
+            min_value=min_value
+        )
+
+
+    def is_greater_or_equal(self, min_value: number) -> NumberArrayValidator:
+        """
+        Checks whether every element is greater or equal to the specified `min_value`.
+        An exception is thrown otherwise.
+        """
+        if self._is_within(min_value=min_value):
+            return self
+
+        return self._fail_where(
+            self.value < min_value,
+            'The argument `{argument_name}` has `{failure_count}` element(s) less than `{min_value}`, at indices `{failure_indices}`',
+            min_value=min_value
+        )
+
+
+    def is_less_than(self, max_value: number) -> NumberArrayValidator:
+        """
+        Checks whether every element is less than the specified `max_value`.
+        An exception is thrown otherwise.
+        """
+        if self._is_within(max_value=max_value, max_inclusive=False):
+            return self
+
+        return self._fail_where(
+            self.value >= max_value,
+            'The argument `{argument_name}` has `{failure_count}` element(s) not less than `{max_value}`, at indices `{failure_indices}`',
+            max_value=max_value
+        )
+
+
+    def is_less_or_equal(self, max_value: number) -> NumberArrayValidator:
+        """
+        Checks whether every element is less or equal to the specified `max_value`.
+        An exception is thrown otherwise.
+        """
+        if self._is_within(max_value=max_value):
+            return self
+
+        return self._fail_where(
+            self.value > max_value,
+            'The argument `{argument_name}` has `{failure_count}` element(s) greater than `{max_value}`, at indices `{failure_indices}`',
+            max_value=max_value
+        )
+
+
+    def is_equal_to(self, value: number) -> NumberArrayValidator:
+        """
+        Checks whether every element is equal to the specified `value`.
+        An exception is thrown otherwise.
+        """
+        return self._fail_where(
+            self.value != value,
+            'The argument `{argument_name}` has `{failure_count}` element(s) not equal to `{equal_to}`, at indices `{failure_indices}`',
+            equal_to=value
+        )
+
+
+    def is_not_equal_to(self, value: number) -> NumberArrayValidator:
+        """
+        Checks whether no element is equal to the specified `value`.
+        An exception is thrown otherwise.
+        """
+        return self._fail_where(
+            self.value == value,
+            'The argument `{argument_name}` has `{failure_count}` element(s) equal to `{equal_to}`, at indices `{failure_indices}`',
+            equal_to=value
+        )
+
+
+    def is_positive(self) -> NumberArrayValidator:
+        """
+        Checks whether every element is positive (or 0).
+        An exception is thrown otherwise.
+        """
+        if self._is_within(min_value=0):
+            return self
+
+        return self._fail_where(
+            self.value < 0,
+            'The argument `{argument_name}` has `{failure_count}` negative element(s), at indices `{failure_indices}`'
+        )
+
+
+    def is_negative(self) -> NumberArrayValidator:
+        """
+        Checks whether every element is negative.
+        An exception is thrown otherwise.
+        """
+        if self._is_within(max_value=0, max_inclusive=False):
+            return self
+
+        return self._fail_where(
+            self.value >= 0,
+            'The argument `{argument_name}` has `{failure_count}` element(s) which are not negative, at indices `{failure_indices}`'
+        )
+
+
+    def _is_within(
+        self,
+        min_value: number = None,
+        max_value: number = None,
+        min_inclusive: bool = True,
+        max_inclusive: bool = True
+    ) -> bool:
+        """
+        Returns whether every element provably lies within the bounds, first from the range of the dtype
+        and then from the minimum and maximum of the array, without building a per-element mask.
+        """
+        for extrema in (self._dtype_extrema, self._value_extrema):
+            low, high = extrema()
+
+            if low is None:
+                continue
+
+            if min_value is not None and not (low >= min_value if min_inclusive else low > min_value):
+                continue
+
+            if max_value is not None and not (high <= max_value if max_inclusive else high < max_value):
+                continue
+
+            return True
+
+        return False
+
+
+    def _dtype_extrema(self) -> tuple:
+        """
+        Returns the smallest and largest values representable by an integer or boolean dtype, or `None` otherwise.
+        """
+        kind = self.value.dtype.kind
+
+        if kind == 'b':
+            return (0, 1)
+
+        if kind in 'iu':
+            info = numpy.iinfo(self.value.dtype)
+            return (info.min, info.max)
+
+        return (None, None)
+
+
+    def _value_extrema(self) -> tuple:
+        """
+        Returns the minimum and maximum of the array, ignoring NaN elements, or `None` for empty and non-numeric arrays.
+        The extrema are computed once and shared by the conditions of the chain.
+        """
+        if self._extrema is None:
+            kind = self.value.dtype.kind
+
+            if self.value.size == 0 or kind not in 'biuf':
+                self._extrema = (None, None)
+            elif kind == 'f':
+                self._extrema = (numpy.fmin.reduce(self.value, axis=None), numpy.fmax.reduce(self.value, axis=None))
+            else:
+                self._extrema = (self.value.min(), self.value.max())
+
+        return self._extrema
+
+
+    def _fail_where(self, failures: numpy.ndarray, message: str, **error_args) -> NumberArrayValidator:
+        """
+        Fails the condition if any element of the `failures` mask is set, reporting the number of offending elements
+        and the indices of the first `MAX_REPORTED_INDICES` of them.
+        """
+        if not failures.any():
+            return self
+
+        flat_indices = numpy.flatnonzero(failures)
+
+        if failures.ndim > 1:
+            indices = numpy.unravel_index(flat_indices[:self.MAX_REPORTED_INDICES], failures.shape)
+            failure_indices = [tuple(int(axis[position]) for axis in indices) for position in range(len(indices[0]))]
+        else:
+            failure_indices = [int(index) for index in flat_indices[:self.MAX_REPORTED_INDICES]]
+
+        return self._fail(
+            ArgumentOutOfRangeError,
+            message,
+            message_args={
+                'failure_count': len(flat_indices),
+                'failure_indices': failure_indices
+            },
+            **error_args
+        )
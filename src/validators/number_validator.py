@@ -16,6 +16,9 @@ class NumberValidator(Validator):
     """
 
 
+    __slots__ = ()
+
+
     def __init__(self, value: str, argument_name: str):
         """
         Initializes the validator base class with the `value` and `argument_name`.
@@ -36,12 +39,11 @@ class NumberValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value < min_value or self.value > max_value:
-            raise ArgumentOutOfRangeError(
-                f'The argument `{self.argument_name}` is out of the range `{min_value}-{max_value}`, was `{self.value}`',
-                self.value,
-                self.argument_name,
-                min_value,
-                max_value
+            return self._fail(
+                ArgumentOutOfRangeError,
+                'The argument `{argument_name}` is out of the range `{min_value}-{max_value}`, was `{value}`',
+                min_value=min_value,
+                max_value=max_value
             )
 
         return self
@@ -53,12 +55,11 @@ class NumberValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value >= min_value and self.value <= max_value:
-            raise ArgumentOutOfRangeError(
-                f'The argument `{self.argument_name}` is not out of the range `{min_value}-{max_value}`, was `{self.value}`',
-                self.value,
-                self.argument_name,
-                min_value,
-                max_value
+            return self._fail(
+                ArgumentOutOfRangeError,
+                'The argument `{argument_name}` is not out of the range `{min_value}-{max_value}`, was `{value}`',
+                min_value=min_value,
+                max_value=max_value
             )
 
         return self
@@ -70,10 +71,9 @@ class NumberValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value <= min_value:
-            raise ArgumentOutOfRangeError(
-                f'The argument `{self.argument_name}` should be greater than `{min_value}`, but was `{self.value}`',
-                self.value,
-                self.argument_name,
+            return self._fail(
+                ArgumentOutOfRangeError,
+                'The argument `{argument_name}` should be greater than `{min_value}`, but was `{value}`',
                 min_value=min_value
             )
 
@@ -86,10 +86,9 @@ class NumberValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value < min_value:
-            raise ArgumentOutOfRangeError(
-                f'The argument `{self.argument_name}` should be greater or equal to `{min_value}`, but was `{self.value}`',
-                self.value,
-                self.argument_name,
+            return self._fail(
+                ArgumentOutOfRangeError,
+                'The argument `{argument_name}` should be greater or equal to `{min_value}`, but was `{value}`',
                 min_value=min_value
             )
 
@@ -102,10 +101,9 @@ class NumberValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value >= max_value:
-            raise ArgumentOutOfRangeError(
-                f'The argument `{self.argument_name}` should be less than `{max_value}`, but was `{self.value}`',
-                self.value,
-                self.argument_name,
+            return self._fail(
+                ArgumentOutOfRangeError,
+                'The argument `{argument_name}` should be less than `{max_value}`, but was `{value}`',
                 max_value=max_value
             )
 
@@ -118,10 +116,9 @@ class NumberValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value > max_value:
-            raise ArgumentOutOfRangeError(
-                f'The argument `{self.argument_name}` should be less or equal to `{max_value}`, but was `{self.value}`',
-                self.value,
-                self.argument_name,
+            return self._fail(
+                ArgumentOutOfRangeError,
+                'The argument `{argument_name}` should be less or equal to `{max_value}`, but was `{value}`',
                 max_value=max_value
             )
 
@@ -134,10 +131,9 @@ class NumberValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value != value:
-            raise ArgumentOutOfRangeError(
-                f'The argument `{self.argument_name}` should be equal to `{value}`, but was `{self.value}`',
-                self.value,
-                self.argument_name,
+            return self._fail(
+                ArgumentOutOfRangeError,
+                'The argument `{argument_name}` should be equal to `{equal_to}`, but was `{value}`',
                 equal_to=value
             )
 
@@ -150,10 +146,9 @@ class NumberValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value == value:
-            raise ArgumentOutOfRangeError(
-                f'The argument `{self.argument_name}` should not be equal to `{value}`, but was `{self.value}`',
-                self.value,
-                self.argument_name,
+            return self._fail(
+                ArgumentOutOfRangeError,
+                'The argument `{argument_name}` should not be equal to `{equal_to}`, but was `{value}`',
                 equal_to=value
             )
 
@@ -166,10 +161,9 @@ class NumberValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value < 0:
-            raise ArgumentOutOfRangeError(
-                f'The argument `{self.argument_name}` should be positive (or 0), but was `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentOutOfRangeError,
+                'The argument `{argument_name}` should be positive (or 0), but was `{value}`'
             )
 
         return self
@@ -181,10 +175,9 @@ class NumberValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value >= 0:
-            raise ArgumentOutOfRangeError(
-                f'The argument `{self.argument_name}` should be negative, but was `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentOutOfRangeError,
+                'The argument `{argument_name}` should be negative, but was `{value}`'
             )
 
         return self
\ No newline at end of file
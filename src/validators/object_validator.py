@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from inspect import isclass
-from typing import Type, Union
+from typing import Optional, Type, Union
 from .validator import Validator
+from ..helpers.deep_equality import DeepEquality
+from ..helpers.fingerprint import Fingerprint
+from ..helpers.type_helper import TypeHelper
 from ..errors.argument_error import ArgumentError
 from ..errors.argument_null_error import ArgumentNullError
 
@@ -13,6 +16,9 @@ class ObjectValidator(Validator):
     """
 
 
+    __slots__ = ()
+
+
     def __init__(self, value: object, argument_name: str):
         """
         Initializes the validator base class with the `value` and `argument_name`.
@@ -27,57 +33,59 @@ class ObjectValidator(Validator):
         return super().get_value()
 
 
-    def is_of_type_name(self, *types: list) -> ObjectValidator:
+    def is_of_type_name(self, *types: list, qualified: bool = False) -> ObjectValidator:
         """
-        Checks whether the Type of the given value is of `type` by comparing the `__name__` attribute.
-        An exception is thrown otherwise. Note: This condition is skipped if the given value is `None`.
+        Checks whether the Type of the given value is of `type` by comparing the `__name__` attribute,
+        or `__module__.__qualname__` if `qualified` is set. An exception is thrown otherwise.
+        Note: This condition is skipped if the given value is `None`.
         """
         if self.value is not None:
+            names = TypeHelper.name_set(tuple(type.__class__ for type in types), qualified)
 
-            of_type = False
-
-            for type in types:
-                if isclass(type):
-                    raise TypeError(
-                        f'The argument `{self.argument_name}` should be an initialized object rather than a type, did you mean to use `is_of_type()`?.'
-                    )
+            if names is None:
+                raise TypeError(
+                    f'The argument `{self.argument_name}` should be an initialized object rather than a type, did you mean to use `is_of_type()`?.'
+                )
 
-                if self.value.__class__.__name__ == type.__class__.__name__:
-                    of_type = True
+            actual_type = TypeHelper.type_name(self.value.__class__, qualified)
 
-            if not of_type:
-                raise ArgumentError(
-                    f'The argument `{self.argument_name}` should be of type `{type.__class__.__name__}` but was `{self.value.__class__.__name__}`',
-                    self.value,
-                    self.argument_name
+            if actual_type not in names:
+                return self._fail(
+                    ArgumentError,
+                    'The argument `{argument_name}` should be of type `{expected_type}` but was `{actual_type}`',
+                    message_args={
+                        'expected_type': TypeHelper.type_name(types[-1].__class__, qualified) if types else None,
+                        'actual_type': actual_type
+                    }
                 )
 
         return self
 
 
-    def is_not_of_type_name(self, *types: list) -> ObjectValidator:
+    def is_not_of_type_name(self, *types: list, qualified: bool = False) -> ObjectValidator:
         """
-        Checks whether the Type of the given value is not of `type` by comparing the `__name__` attribute.
-        An exception is thrown otherwise. Note: This condition is skipped if the given value is `None`.
+        Checks whether the Type of the given value is not of `type` by comparing the `__name__` attribute,
+        or `__module__.__qualname__` if `qualified` is set. An exception is thrown otherwise.
+        Note: This condition is skipped if the given value is `None`.
         """
         if self.value is not None:
+            names = TypeHelper.name_set(tuple(type.__class__ for type in types), qualified)
 
-            of_type = False
-
-            for type in types:
-                if isclass(type):
-                    raise TypeError(
-                        f'The argument `{self.argument_name}` should be an initialized object rather than a type, did you mean to use `is_not_of_type()`?.'
-                    )
+            if names is None:
+                raise TypeError(
+                    f'The argument `{self.argument_name}` should be an initialized object rather than a type, did you mean to use `is_not_of_type()`?.'
+                )
 
-                if self.value.__class__.__name__ == type.__class__.__name__:
-                    of_type = True
+            actual_type = TypeHelper.type_name(self.value.__class__, qualified)
 
-            if of_type:
-                raise ArgumentError(
-                    f'The argument `{self.argument_name}` should not be of type `{type.__class__.__name__}` but was `{self.value.__class__.__name__}`',
-                    self.value,
-                    self.argument_name
+            if actual_type in names:
+                return self._fail(
+                    ArgumentError,
+                    'The argument `{argument_name}` should not be of type `{expected_type}` but was `{actual_type}`',
+                    message_args={
+                        'expected_type': TypeHelper.type_name(types[-1].__class__, qualified),
+                        'actual_type': actual_type
+                    }
                 )
 
         return self
@@ -89,26 +97,19 @@ class ObjectValidator(Validator):
         An exception is thrown otherwise. Note: This condition is skipped if the given value is `None`.
         """
         if self.value is not None:
-
-            of_type = False
-
-            for type in types:
-                if self.value is not None:
-                    if not isclass(type):
-                        raise TypeError(
-                            f'The argument `{self.argument_name}` should be an type rather than an initialized object, did you mean to use `is_of_type_name()`?.'
-                        )
-
-                    if isinstance(self.value, type):
-                        of_type = True
-                else:
-                    of_type = True
-
-            if not of_type:
-                raise ArgumentError(
-                    f'The argument `{self.argument_name}` should be of type `{type.__name__}` but was `{self.value.__class__.__name__}`',
-                    self.value,
-                    self.argument_name
+            index = TypeHelper.first_instance_of(self.value, types)
+
+            if index is None:
+                index = self._first_instance_of(types, 'is_of_type_name', False)
+
+            if index < 0:
+                return self._fail(
+                    ArgumentError,
+                    'The argument `{argument_name}` should be of type `{expected_type}` but was `{actual_type}`',
+                    message_args={
+                        'expected_type': types[-1].__name__ if types else None,
+                        'actual_type': self.value.__class__.__name__
+                    }
                 )
 
         return self
@@ -120,27 +121,20 @@ class ObjectValidator(Validator):
         An exception is thrown otherwise. Note: This condition is skipped if the given value is `None`.
         """
         if self.value is not None:
-
-            of_type = False
-
-            for type in types:
-                if self.value is not None:
-                    if not isclass(type):
-                        raise TypeError(
-                            f'The argument `{self.argument_name}` should be an type rather than an initialized object, did you mean to use `is_not_of_type_name()`?.'
-                        )
-
-                    if isinstance(self.value, type):
-                        of_type = True
-                else:
-                    of_type = True
-
-                if of_type:
-                    raise ArgumentError(
-                        f'The argument `{self.argument_name}` should not be of type `{type.__name__}` but was `{self.value.__class__.__name__}`',
-                        self.value,
-                        self.argument_name
-                    )
+            index = TypeHelper.first_instance_of(self.value, types)
+
+            if index is None:
+                index = self._first_instance_of(types, 'is_not_of_type_name', True)
+
+            if index >= 0:
+                return self._fail(
+                    ArgumentError,
+                    'The argument `{argument_name}` should not be of type `{expected_type}` but was `{actual_type}`',
+                    message_args={
+                        'expected_type': types[index].__name__,
+                        'actual_type': self.value.__class__.__name__
+                    }
+                )
 
         return self
 
@@ -150,10 +144,9 @@ class ObjectValidator(Validator):
         Checks whether the given value is None (Null). An exception is thrown otherwise.
         """
         if not self.value is None:
-            raise ArgumentNullError(
-                f'The argument `{self.argument_name}` should be NONE (NULL)',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentNullError,
+                'The argument `{argument_name}` should be NONE (NULL)'
             )
 
         return self
@@ -164,25 +157,41 @@ class ObjectValidator(Validator):
         Checks whether the given value is None (Null). An exception is thrown otherwise.
         """
         if self.value is None:
-            raise ArgumentNullError(
-                f'The argument `{self.argument_name}` should not be NONE (NULL)',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentNullError,
+                'The argument `{argument_name}` should not be NONE (NULL)'
             )
 
         return self
 
 
-    def is_equal_to(self, value: object) -> ObjectValidator:
+    def is_equal_to(self, value: object, fingerprint: bool = False, verify: bool = True) -> ObjectValidator:
         """
-        Checks whether the given value is equal to the object specified in `value` by comparing the internal dictionaries.
-        An exception is thrown otherwise.
+        Checks whether the given value is structurally equal to the object specified in `value`, comparing their
+        attributes, items and elements all the way down. An exception is thrown otherwise, reporting the path to the
+        first difference. If `fingerprint` is set, `value` is treated as a snapshot whose fingerprint is cached, and
+        the given value is fingerprinted on every check, so a difference fails without comparing the two graphs.
+        Equal fingerprints are confirmed with a full comparison, as fingerprints built from `hash()` collide easily,
+        unless `verify` is cleared. Equal values are therefore checked faster without `fingerprint`.
         """
-        if self.value.__dict__ != value.__dict__:
-            raise ArgumentError(
-                f'The argument `{self.value.__class__.__name__}` should be equal to `{value.__class__.__name__}`',
-                self.value,
-                self.argument_name
+        matched = self._fingerprints_match(value, verify) if fingerprint else None
+
+        if matched is None:
+            difference = DeepEquality.find_difference(self.value, value, self.argument_name)
+            matched = difference is None
+            path = None if matched else difference.path
+        else:
+            path = self.argument_name
+
+        if not matched:
+            return self._fail(
+                ArgumentError,
+                'The argument `{actual_type}` should be equal to `{expected_type}` but differs at `{path}`',
+                message_args={
+                    'expected_type': value.__class__.__name__,
+                    'actual_type': self.value.__class__.__name__,
+                    'path': path
+                }
             )
 
         return self
@@ -190,29 +199,43 @@ class ObjectValidator(Validator):
 
     def is_not_equal_to(self, value: object) -> ObjectValidator:
         """
-        Checks whether the given value is not equal to the object specified in `value` by comparing the internal dictionaries.
-        An exception is thrown otherwise.
+        Checks whether the given value is not structurally equal to the object specified in `value`, comparing their
+        attributes, items and elements all the way down. An exception is thrown otherwise.
         """
-        if self.value.__dict__ == value.__dict__:
-            raise ArgumentError(
-                f'The argument `{self.value.__class__.__name__}` should be equal to `{value.__class__.__name__}`',
-                self.value,
-                self.argument_name
+        if DeepEquality.find_difference(self.value, value, self.argument_name) is None:
+            return self._fail(
+                ArgumentError,
+                'The argument `{actual_type}` should be equal to `{expected_type}`',
+                message_args={
+                    'expected_type': value.__class__.__name__,
+                    'actual_type': self.value.__class__.__name__
+                }
             )
 
         return self
 
 
-    def is_equal_to_using_eq(self, value: object) -> ObjectValidator:
+    def is_equal_to_using_eq(self, value: object, fingerprint: bool = False, verify: bool = True) -> ObjectValidator:
         """
         Checks whether the given value is equal to the object specified in `value` by using the `__eq__()` function in object.
-        An exception is thrown otherwise.
+        An exception is thrown otherwise. If `fingerprint` is set, both values are treated as snapshots whose
+        fingerprints are cached, so differing fingerprints fail without calling `__eq__()`. Equal fingerprints are
+        confirmed with `__eq__()` unless `verify` is cleared. Fingerprints are structural, so they should only be used
+        for objects whose `__eq__()` is structural too.
         """
-        if self.value != value:
-            raise ArgumentError(
-                f'The argument `{self.value.__class__.__name__}` should be equal to `{value.__class__.__name__}`',
-                self.value,
-                self.argument_name
+        matched = self._fingerprints_match(value, verify) if fingerprint else None
+
+        if matched is None:
+            matched = not self.value != value
+
+        if not matched:
+            return self._fail(
+                ArgumentError,
+                'The argument `{actual_type}` should be equal to `{expected_type}`',
+                message_args={
+                    'expected_type': value.__class__.__name__,
+                    'actual_type': self.value.__class__.__name__
+                }
             )
 
         return self
@@ -224,10 +247,55 @@ class ObjectValidator(Validator):
         An exception is thrown otherwise.
         """
         if self.value == value:
-            raise ArgumentError(
-                f'The argument `{self.value.__class__.__name__}` should be equal to `{value.__class__.__name__}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{actual_type}` should be equal to `{expected_type}`',
+                message_args={
+                    'expected_type': value.__class__.__name__,
+                    'actual_type': self.value.__class__.__name__
+                }
             )
 
-        return self
\ No newline at end of file
+        return self
+
+
+    def _fingerprints_match(self, value: object, verify: bool) -> Optional[bool]:
+        """
+        Compares the fingerprint of the given value with the cached fingerprint of the snapshot `value`.
+        The given value may have changed since an earlier check, so its fingerprint is computed every time.
+        Returns `None` if a full comparison is still required, because either graph cannot be fingerprinted or
+        `verify` is set and the fingerprints are equal.
+        """
+        expected = Fingerprint.of(value)
+        actual = Fingerprint.compute(self.value)
+
+        if expected is None or actual is None:
+            return None
+
+        if expected != actual:
+            return False
+
+        return None if verify else True
+
+
+    def _first_instance_of(self, types: tuple, alternative: str, stop_at_match: bool) -> int:
+        """
+        Returns the index of the first of the `types` which the value is an instance of, or -1 if it is none of them.
+        Throws a `TypeError` suggesting the `alternative` condition for anything other than a class, up to the first
+        match if `stop_at_match` is set.
+        """
+        index = -1
+
+        for position, type in enumerate(types):
+            if not isclass(type):
+                raise TypeError(
+                    f'The argument `{self.argument_name}` should be an type rather than an initialized object, did you mean to use `{alternative}()`?.'
+                )
+
+            if index < 0 and isinstance(self.value, type):
+                index = position
+
+                if stop_at_match:
+                    break
+
+        return index
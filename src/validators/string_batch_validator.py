@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Callable, List, Sequence, Tuple
+from .validator import Validator
+from .string_validator import StringValidator
+from ..errors.argument_error import ArgumentError
+from ..helpers.failure_bitmap import FailureBitmap
+from ..plans.plan_conditions import STRING_CONDITIONS
+from ..plans.validation_plan import ValidationPlan
+
+
+class StringBatchValidator(Validator):
+    """
+    Contains all the string validation conditions, run across a sequence of values. The conditions of the chain
+    are evaluated together in one pass once the failures are requested, and invalid values do not stop the pass.
+    """
+
+
+    __slots__ = (
+        '_plan',
+        '_failures'
+    )
+
+
+    MAX_REPORTED_INDICES = 10
+
+
+    def __init__(self, values: Sequence[str], argument_name: str):
+        """
+        Initializes the validator base class with the `values` and `argument_name`.
+        """
+        super().__init__(values if isinstance(values, (list, tuple)) else list(values), argument_name)
+
+        self._plan = ValidationPlan(StringValidator, argument_name, STRING_CONDITIONS)
+        self._failures = None
+
+
+    def __getattr__(self, name: str) -> Callable[..., StringBatchValidator]:
+        """
+        Resolves the conditions of the string validator to functions which add the condition to the batch.
+        """
+        if name.startswith('_'):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        record = getattr(self._plan, name)
+
+        def add_condition(*args, **kwargs) -> StringBatchValidator:
+            record(*args, **kwargs)
+            self._failures = None
+
+            return self
+
+        return add_condition
+
+
+    def rebind(self, values: Sequence[str], argument_name: str = None) -> StringBatchValidator:
+        """
+        Points the validator at other `values`, and `argument_name` if given, keeping the conditions of the chain.
+        """
+        super().rebind(values if isinstance(values, (list, tuple)) else list(values), argument_name)
+
+        if argument_name is not None:
+            self._plan.argument_name = argument_name
+
+        self._failures = None
+
+        return self
+
+
+    def get_value(self) -> Sequence[str]:
+        """
+        Returns the validator values.
+        """
+        return super().get_value()
+
+
+    @property
+    def failures(self) -> List[Tuple[str, FailureBitmap]]:
+        """
+        Returns the name and failure bitmap of every condition in the chain, evaluating the batch if required.
+        """
+        if self._failures is None:
+            bitmaps = self._plan.compile_batch()(self.value)
+            length = len(self.value)
+
+            self._failures = [
+                (name, FailureBitmap(length, bitmap))
+                for (name, args, kwargs), bitmap in zip(self._plan.steps, bitmaps)
+            ]
+
+        return self._failures
+
+
+    def failed(self) -> FailureBitmap:
+        """
+        Returns a bitmap of the values which failed any of the conditions.
+        """
+        combined = FailureBitmap(len(self.value))
+
+        for name, bitmap in self.failures:
+            combined = combined | bitmap
+
+        return combined
+
+
+    def is_valid(self) -> bool:
+        """
+        Returns whether every value passed every condition.
+        """
+        return not any(bitmap.any() for name, bitmap in self.failures)
+
+
+    def raise_if_failed(self) -> StringBatchValidator:
+        """
+        Throws an ArgumentError reporting the number of invalid values and the indices of the first of them,
+        if any value failed a condition.
+        """
+        failed = self.failed()
+
+        if failed.any():
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` has `{failure_count}` invalid value(s), at indices `{failure_indices}`',
+                message_args={
+                    'failure_count': failed.count(),
+                    'failure_indices': list(islice(failed.indices(), self.MAX_REPORTED_INDICES))
+                }
+            )
+
+        return self
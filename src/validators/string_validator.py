@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+from typing import Iterable, Pattern, Union
 from .validator import Validator
+from ..helpers.affix_trie import AffixTrie
+from ..helpers.aho_corasick import AhoCorasick
 from ..helpers.regex_helper import RegexHelper
+from ..helpers.regex_set import RegexSet
+from ..helpers.set_index import SetIndex
 from ..errors.argument_error import ArgumentError
 from ..errors.argument_null_error import ArgumentNullError
 from ..errors.argument_pattern_error import ArgumentPatternError
+from ..errors.argument_pattern_timeout_error import ArgumentPatternTimeoutError
 
 
 class StringValidator(Validator):
@@ -13,6 +19,9 @@ class StringValidator(Validator):
     """
 
 
+    __slots__ = ()
+
+
     EMPTY_STRING = ''
 
 
@@ -35,10 +44,9 @@ class StringValidator(Validator):
         Checks whether the given value is none (null). An exception is thrown otherwise.
         """
         if self.value is not None:
-            raise ArgumentNullError(
-                f'The argument `{self.argument_name}` should be NULL',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentNullError,
+                'The argument `{argument_name}` should be NULL'
             )
 
         return self
@@ -49,10 +57,9 @@ class StringValidator(Validator):
         Checks whether the given value is NOT none (null). An exception is thrown otherwise.
         """
         if self.value is None:
-            raise ArgumentNullError(
-                f'The argument `{self.argument_name}` should not be NONE (NULL)',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentNullError,
+                'The argument `{argument_name}` should not be NONE (NULL)'
             )
 
         return self
@@ -64,10 +71,9 @@ class StringValidator(Validator):
         """
         if self.value is not None\
         and self.value != self.EMPTY_STRING:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should be either EMPTY or NULL but was `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should be either EMPTY or NULL but was `{value}`'
             )
 
         return self
@@ -79,10 +85,9 @@ class StringValidator(Validator):
         """
         if self.value is None\
         or self.value == self.EMPTY_STRING:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should not be EMPTY',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not be EMPTY'
             )
 
         return self
@@ -96,10 +101,9 @@ class StringValidator(Validator):
         if self.value is not None\
         and self.value != self.EMPTY_STRING\
         and not str(self.value).isspace():
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should be NULL or WHITESPACE but was `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should be NULL or WHITESPACE but was `{value}`'
             )
 
         return self
@@ -113,10 +117,9 @@ class StringValidator(Validator):
         if self.value is None\
         or self.value == self.EMPTY_STRING\
         or str(self.value).isspace():
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should not have WHITESPACE',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not have WHITESPACE'
             )
 
         return self
@@ -128,10 +131,13 @@ class StringValidator(Validator):
         An exception is thrown otherwise.
         """
         if len(self.value) >= max_length:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should be shorter than `{max_length}` but is `{len(self.value)}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should be shorter than `{max_length}` but is `{actual_length}`',
+                message_args={
+                    'max_length': max_length,
+                    'actual_length': len(self.value)
+                }
             )
 
         return self
@@ -143,10 +149,13 @@ class StringValidator(Validator):
         An exception is thrown otherwise.
         """
         if len(self.value) > max_length:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should be shorter than or equal to `{max_length}` but is `{len(self.value)}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should be shorter than or equal to `{max_length}` but is `{actual_length}`',
+                message_args={
+                    'max_length': max_length,
+                    'actual_length': len(self.value)
+                }
             )
 
         return self
@@ -158,10 +167,13 @@ class StringValidator(Validator):
         An exception is thrown otherwise.
         """
         if len(self.value) <= min_length:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should be longer than `{min_length}` but is `{len(self.value)}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should be longer than `{min_length}` but is `{actual_length}`',
+                message_args={
+                    'min_length': min_length,
+                    'actual_length': len(self.value)
+                }
             )
 
         return self
@@ -173,10 +185,13 @@ class StringValidator(Validator):
         An exception is thrown otherwise.
         """
         if len(self.value) < min_length:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should be longer than or equal to `{min_length}` but is `{len(self.value)}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should be longer than or equal to `{min_length}` but is `{actual_length}`',
+                message_args={
+                    'min_length': min_length,
+                    'actual_length': len(self.value)
+                }
             )
 
         return self
@@ -187,10 +202,13 @@ class StringValidator(Validator):
         Checks whether the given value is equal in length to the specified `length`. An exception is thrown otherwise.
         """
         if len(self.value) != length:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should have a length of `{length}` but is `{len(self.value)}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should have a length of `{length}` but is `{actual_length}`',
+                message_args={
+                    'length': length,
+                    'actual_length': len(self.value)
+                }
             )
 
         return self
@@ -201,10 +219,13 @@ class StringValidator(Validator):
         Checks whether the given value is unequal in length to the specified `length`. An exception is thrown otherwise.
         """
         if len(self.value) == length:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should not have a length of `{length}` but is `{len(self.value)}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not have a length of `{length}` but is `{actual_length}`',
+                message_args={
+                    'length': length,
+                    'actual_length': len(self.value)
+                }
             )
 
         return self
@@ -215,10 +236,12 @@ class StringValidator(Validator):
         Checks whether the given value equals the specified `value`. An exception is thrown otherwise.
         """
         if self.value != value:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should equal `{value}` but was actually `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should equal `{expected}` but was actually `{value}`',
+                message_args={
+                    'expected': value
+                }
             )
 
         return self
@@ -229,10 +252,12 @@ class StringValidator(Validator):
         Checks whether the given value equals the specified `value`. An exception is thrown otherwise.
         """
         if self.value == value:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should equal `{value}` but was actually `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should equal `{expected}` but was actually `{value}`',
+                message_args={
+                    'expected': value
+                }
             )
 
         return self
@@ -243,10 +268,12 @@ class StringValidator(Validator):
         Checks whether the given value starts with the specified `value`. An exception is thrown otherwise.
         """
         if not str(self.value).startswith(value):
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should start with `{value}` but was actually `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should start with `{expected}` but was actually `{value}`',
+                message_args={
+                    'expected': value
+                }
             )
 
         return self
@@ -257,10 +284,12 @@ class StringValidator(Validator):
         Checks whether the given value does not start with the specified `value`. An exception is thrown otherwise.
         """
         if str(self.value).startswith(value):
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should not start with `{value}` but was actually `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not start with `{expected}` but was actually `{value}`',
+                message_args={
+                    'expected': value
+                }
             )
 
         return self
@@ -271,10 +300,12 @@ class StringValidator(Validator):
         Checks whether the given value ends with the specified `value`. An exception is thrown otherwise.
         """
         if not str(self.value).endswith(value):
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should end with `{value}` but was actually `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should end with `{expected}` but was actually `{value}`',
+                message_args={
+                    'expected': value
+                }
             )
 
         return self
@@ -285,10 +316,92 @@ class StringValidator(Validator):
         Checks whether the given value does not end with the specified `value`. An exception is thrown otherwise.
         """
         if str(self.value).endswith(value):
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should not end with `{value}` but was actually `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not end with `{expected}` but was actually `{value}`',
+                message_args={
+                    'expected': value
+                }
+            )
+
+        return self
+
+
+    def starts_with_any(self, prefixes: Union[Iterable[str], AffixTrie]) -> StringValidator:
+        """
+        Checks whether the given value starts with any of the specified `prefixes`, in O(len(value)).
+        The prefixes can be a trie built by `Condition.prefix_trie()`, other collections are built and cached by identity until they change.
+        An exception is thrown otherwise.
+        """
+        trie = AffixTrie.of(prefixes)
+
+        if trie.find(str(self.value)) is None:
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should start with any of the `{affix_count}` specified values but was actually `{value}`',
+                message_args={
+                    'affix_count': len(trie)
+                }
+            )
+
+        return self
+
+
+    def does_not_start_with_any(self, prefixes: Union[Iterable[str], AffixTrie]) -> StringValidator:
+        """
+        Checks whether the given value does not start with any of the specified `prefixes`, in O(len(value)).
+        The prefixes can be a trie built by `Condition.prefix_trie()`, other collections are built and cached by identity until they change.
+        An exception is thrown otherwise.
+        """
+        match = AffixTrie.of(prefixes).find(str(self.value))
+
+        if match is not None:
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not start with `{expected}` but was actually `{value}`',
+                message_args={
+                    'expected': match
+                }
+            )
+
+        return self
+
+
+    def ends_with_any(self, suffixes: Union[Iterable[str], AffixTrie]) -> StringValidator:
+        """
+        Checks whether the given value ends with any of the specified `suffixes`, in O(len(value)).
+        The suffixes can be a trie built by `Condition.suffix_trie()`, other collections are built and cached by identity until they change.
+        An exception is thrown otherwise.
+        """
+        trie = AffixTrie.of(suffixes, suffix=True)
+
+        if trie.find(str(self.value)) is None:
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should end with any of the `{affix_count}` specified values but was actually `{value}`',
+                message_args={
+                    'affix_count': len(trie)
+                }
+            )
+
+        return self
+
+
+    def does_not_end_with_any(self, suffixes: Union[Iterable[str], AffixTrie]) -> StringValidator:
+        """
+        Checks whether the given value does not end with any of the specified `suffixes`, in O(len(value)).
+        The suffixes can be a trie built by `Condition.suffix_trie()`, other collections are built and cached by identity until they change.
+        An exception is thrown otherwise.
+        """
+        match = AffixTrie.of(suffixes, suffix=True).find(str(self.value))
+
+        if match is not None:
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not end with `{expected}` but was actually `{value}`',
+                message_args={
+                    'expected': match
+                }
             )
 
         return self
@@ -299,10 +412,12 @@ class StringValidator(Validator):
         Checks whether the given value contains the specified `value`. An exception is thrown otherwise.
         """
         if value not in self.value:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should contain `{value}` but was actually `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should contain `{expected}` but was actually `{value}`',
+                message_args={
+                    'expected': value
+                }
             )
 
         return self
@@ -313,40 +428,142 @@ class StringValidator(Validator):
         Checks whether the given value does not contain the specified `value`. An exception is thrown otherwise.
         """
         if value in self.value:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should not contain `{value}` but was actually `{self.value}`',
-                self.value,
-                self.argument_name
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not contain `{expected}` but was actually `{value}`',
+                message_args={
+                    'expected': value
+                }
             )
 
         return self
 
 
-    def is_regex_match(self, pattern: str) -> StringValidator:
+    def contains_any(self, needles: Union[Iterable[str], AhoCorasick]) -> StringValidator:
         """
-        Checks wether the given value matches the supplied `pattern`. An exception is thrown otherwise.
+        Checks whether the given value contains any of the specified `needles`, scanning the value once.
+        The needles can be an automaton built by `Condition.automaton()`, other collections are built and cached by identity until they change.
+        An exception is thrown otherwise.
         """
-        if not RegexHelper.is_match(pattern, self.value):
-            raise ArgumentPatternError(
-                f'The argument `{self.argument_name}` should match the pattern `{pattern}`',
-                self.value,
-                self.argument_name,
-                pattern
+        automaton = AhoCorasick.of(needles)
+
+        if automaton.find(self.value) is None:
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should contain any of the `{needle_count}` specified values but was actually `{value}`',
+                message_args={
+                    'needle_count': len(automaton)
+                }
             )
 
         return self
 
 
-    def is_not_regex_match(self, pattern: str) -> StringValidator:
+    def does_not_contain_any(self, needles: Union[Iterable[str], AhoCorasick]) -> StringValidator:
+        """
+        Checks whether the given value does not contain any of the specified `needles`, scanning the value once.
+        The needles can be an automaton built by `Condition.automaton()`, other collections are built and cached by identity until they change.
+        An exception is thrown otherwise.
+        """
+        match = AhoCorasick.of(needles).find(self.value)
+
+        if match is not None:
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not contain `{needle}` but it was found at offset `{offset}`',
+                message_args={
+                    'needle': match[0],
+                    'offset': match[1]
+                }
+            )
+
+        return self
+
+
+    def is_regex_match(self, pattern: Union[str, Pattern], guarded: bool = False) -> StringValidator:
+        """
+        Checks wether the given value matches the supplied `pattern`. An exception is thrown otherwise.
+        If `guarded` is set, vulnerable patterns and long values are matched under the time budget of `RegexHelper`.
+        """
+        try:
+            matched = RegexHelper.is_match_guarded(pattern, self.value) if guarded else RegexHelper.is_match(pattern, self.value)
+        except TimeoutError:
+            return self._fail(
+                ArgumentPatternTimeoutError,
+                'The argument `{argument_name}` could not be matched against the pattern `{pattern}` within `{timeout}` seconds',
+                pattern=pattern,
+                timeout=RegexHelper.GUARDED_TIMEOUT
+            )
+
+        if not matched:
+            return self._fail(
+                ArgumentPatternError,
+                'The argument `{argument_name}` should match the pattern `{pattern}`',
+                pattern=pattern
+            )
+
+        return self
+
+
+    def is_not_regex_match(self, pattern: Union[str, Pattern], guarded: bool = False) -> StringValidator:
         """
         Checks whether the given value does not match the supplied `pattern`. An exception is thrown otherwise.
+        If `guarded` is set, vulnerable patterns and long values are matched under the time budget of `RegexHelper`.
+        """
+        try:
+            matched = RegexHelper.is_match_guarded(pattern, self.value) if guarded else RegexHelper.is_match(pattern, self.value)
+        except TimeoutError:
+            return self._fail(
+                ArgumentPatternTimeoutError,
+                'The argument `{argument_name}` could not be matched against the pattern `{pattern}` within `{timeout}` seconds',
+                pattern=pattern,
+                timeout=RegexHelper.GUARDED_TIMEOUT
+            )
+
+        if matched:
+            return self._fail(
+                ArgumentPatternError,
+                'The argument `{argument_name}` should match the pattern `{pattern}`',
+                pattern=pattern
+            )
+
+        return self
+
+
+    def matches_any_regex(self, patterns: Union[Iterable[Union[str, Pattern]], RegexSet]) -> StringValidator:
         """
-        if RegexHelper.is_match(pattern, self.value):
-            raise ArgumentPatternError(
-                f'The argument `{self.argument_name}` should match the pattern `{pattern}`',
-                self.value,
-                self.argument_name,
-                pattern
+        Checks whether the given value matches any of the supplied `patterns`, without running each pattern in turn.
+        The patterns can be a set built by `Condition.regex_set()`, other collections are built and cached by identity until they change.
+        An exception is thrown otherwise.
+        """
+        regex_set = RegexSet.of(patterns)
+
+        if regex_set.find(self.value) is None:
+            return self._fail(
+                ArgumentPatternError,
+                'The argument `{argument_name}` should match any of the `{pattern_count}` specified patterns',
+                message_args={
+                    'pattern_count': len(regex_set)
+                },
+                pattern=regex_set
+            )
+
+        return self
+
+
+    def matches_none_regex(self, patterns: Union[Iterable[Union[str, Pattern]], RegexSet]) -> StringValidator:
+        """
+        Checks whether the given value does not match any of the supplied `patterns`, without running each pattern in turn.
+        The patterns can be a set built by `Condition.regex_set()`, other collections are built and cached by identity until they change.
+        An exception is thrown otherwise.
+        """
+        pattern = RegexSet.of(patterns).find(self.value)
+
+        if pattern is not None:
+            return self._fail(
+                ArgumentPatternError,
+                'The argument `{argument_name}` should not match the pattern `{pattern}`',
+                pattern=pattern
             )
 
         return self
@@ -355,12 +572,12 @@ class StringValidator(Validator):
     def is_in_set(self, set: list) -> StringValidator:
         """
         Checks to see if the given value matches any of the values in the supplied set. An exception is thrown otherwise.
+        The set can be a `SetIndex` built by `Condition.index()`, tuples and frozensets are indexed and cached by identity.
         """
-        if not self.value in set:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should match a value specified in the set.',
-                self.value,
-                self.argument_name
+        if not self.value in SetIndex.of(set):
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should match a value specified in the set.'
             )
 
         return self
@@ -369,14 +586,14 @@ class StringValidator(Validator):
     def is_in_set_case_insensitive(self, set: list) -> StringValidator:
         """
         Checks to see if the given value matches any of the values in the supplied set.
-        Case insensitive.
+        Case insensitive, using `str.casefold()` semantics. The set can be a `SetIndex` built by `Condition.index()`,
+        tuples and frozensets are indexed and cached by identity, and lists and sets are indexed until they change.
         An exception is thrown otherwise.
         """
-        if not self.value.lower() in (item.lower() for item in set):
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should match a value specified in the set.',
-                self.value,
-                self.argument_name
+        if not self._in_set_case_insensitive(set):
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should match a value specified in the set.'
             )
 
         return self
@@ -385,12 +602,12 @@ class StringValidator(Validator):
     def is_not_in_set(self, set: list) -> StringValidator:
         """
         Checks to see if the given value matches any of the values is not in the supplied set. An exception is thrown otherwise.
+        The set can be a `SetIndex` built by `Condition.index()`, tuples and frozensets are indexed and cached by identity.
         """
-        if self.value in set:
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should not match a value specified in the set.',
-                self.value,
-                self.argument_name
+        if self.value in SetIndex.of(set):
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not match a value specified in the set.'
             )
 
         return self
@@ -399,14 +616,36 @@ class StringValidator(Validator):
     def is_not_in_set_case_insensitive(self, set: list) -> StringValidator:
         """
         Checks to see if the given value matches any of the values is not in the supplied set.
-        Case insensitive.
+        Case insensitive, using `str.casefold()` semantics. The set can be a `SetIndex` built by `Condition.index()`,
+        tuples and frozensets are indexed and cached by identity, and lists and sets are indexed until they change.
         An exception is thrown otherwise.
         """
-        if self.value.lower() in (item.lower() for item in set):
-            raise ArgumentError(
-                f'The argument `{self.argument_name}` should not match a value specified in the set.',
-                self.value,
-                self.argument_name
+        if self._in_set_case_insensitive(set):
+            return self._fail(
+                ArgumentError,
+                'The argument `{argument_name}` should not match a value specified in the set.'
             )
 
-        return self
\ No newline at end of file
+        return self
+
+
+    def _in_set_case_insensitive(self, set: list) -> bool:
+        """
+        Returns whether the given value matches any of the values in the supplied set, ignoring case.
+        The casefolded values are built once per index. Lists and sets are indexed too, and their index is reused
+        for as long as their contents do not change.
+        """
+        index = SetIndex.of(set, min_size=0)
+
+        if not isinstance(index, SetIndex):
+            try:
+                index = SetIndex.of_mutable(set)
+            except TypeError:
+                pass
+
+        if isinstance(index, SetIndex):
+            return index.contains_case_insensitive(self.value)
+
+        value = SetIndex.casefold(self.value)
+
+        return any(SetIndex.casefold(item) == value for item in set)
@@ -1,8 +1,22 @@
+from ..helpers.value_capture import ValueCapture
+from .error_collector import ErrorCollector
+
+
 class Validator:
     """
     Base validation class.
     """
 
+
+    __slots__ = (
+        'value',
+        'argument_name'
+    )
+
+
+    lightweight_errors = False
+
+
     def __init__(self, value, argument_name):
         """
         Constructor which initializes the validator with a `value` and `argument_name`
@@ -15,4 +29,59 @@ class Validator:
         """
         Returns the validator value.
         """
-        return self.value
\ No newline at end of file
+        return self.value
+
+
+    def rebind(self, value, argument_name=None):
+        """
+        Points the validator at another `value`, and `argument_name` if given, so a single validator can check
+        many values without being created again. Returns the validator itself to start a new chain.
+        """
+        self.value = value
+
+        if argument_name is not None:
+            self.argument_name = argument_name
+
+        return self
+
+
+    def _fail(self, error_type, message, message_args=None, **error_args):
+        """
+        Signals that a condition failed by raising an `error_type` built from the message template,
+        `message_args` and any additional `error_args` of the error type. Within an `ErrorCollector` scope the error
+        is recorded instead, and a validator which skips the remaining conditions of the chain, but still returns
+        the value, is returned.
+
+        The error never references the frame of this method once raised, so it does not form a reference cycle.
+        With `lightweight_errors` set, the context of any exception being handled is dropped, and so is the frame of
+        this method on Python 3.11 and later, where the traceback then ends at the failed condition. The frames left
+        on the traceback still reference the validator, so with `lightweight_errors` set, or a value capture policy
+        other than `full`, it lets go of its value and `get_value()` returns `None` afterwards. The error then keeps
+        only what the capture policy allows.
+        """
+        error = error_type(
+            message,
+            self.value,
+            self.argument_name,
+            message_args=message_args if message_args is not None else {},
+            **error_args
+        )
+        collector = ErrorCollector.active()
+
+        if collector is None:
+            try:
+                raise error
+            finally:
+                if Validator.lightweight_errors:
+                    error.__traceback__ = None
+                    error.__context__ = None
+
+                if Validator.lightweight_errors or ValueCapture.policy != 'full':
+                    self.value = None
+
+                error = None
+
+        collector.errors.append(error)
+
+        from .noop_validator import NoopValidator
+        return NoopValidator(self.value)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import threading
+from .validator import Validator
+
+
+class ValidatorPool:
+    """
+    Keeps one validator of each type per thread, which is rebound to every value it validates, so validating
+    in a loop creates no validators. A pooled validator is only valid until the next value is validated with the
+    same type on the same thread, so it must not be kept or shared.
+    """
+
+
+    _local = threading.local()
+
+
+    @staticmethod
+    def get(validator_type: type, value: object, argument_name: str) -> Validator:
+        """
+        Returns the validator of `validator_type` pooled by the current thread, rebound to the `value` and
+        `argument_name`. The validator is created on the first request of each thread.
+        """
+        try:
+            validator = ValidatorPool._local.validators[validator_type]
+        except AttributeError:
+            ValidatorPool._local.validators = {}
+        except KeyError:
+            pass
+        else:
+            return validator.rebind(value, argument_name)
+
+        validator = ValidatorPool._local.validators[validator_type] = validator_type(value, argument_name)
+
+        return validator
+
+
+    @staticmethod
+    def clear():
+        """
+        Removes the validators pooled by the current thread.
+        """
+        ValidatorPool._local.validators = {}
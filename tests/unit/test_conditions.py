@@ -1,8 +1,19 @@
+import traceback
 import pytest
 from typing import TypeVar
 from .type_example import TypeExample
 from src.condition import Condition
+from src.helpers.aho_corasick import AhoCorasick
+from src.helpers.regex_set import RegexSet
+from src.helpers.set_index import SetIndex
+from src.errors.argument_error import ArgumentError
+from src.errors.argument_out_of_range_error import ArgumentOutOfRangeError
 from src.validators.boolean_validator import BooleanValidator
+from src.validators.noop_validator import NoopValidator
+from src.validators.check_validator import BooleanCheckValidator
+from src.validators.check_validator import NumberCheckValidator
+from src.validators.check_validator import ObjectCheckValidator
+from src.validators.check_validator import StringCheckValidator
 from src.validators.number_validator import NumberValidator
 from src.validators.object_validator import ObjectValidator
 from src.validators.string_validator import StringValidator
@@ -156,4 +167,242 @@ def test_ensures_returns_string_validator(value: str):
     validator = Condition.ensures_str(value, 'value')
 
     # Assert
-    assert isinstance(validator, StringValidator)
\ No newline at end of file
+    assert isinstance(validator, StringValidator)
+
+
+def test_check_returns_check_validators():
+    """
+    Tests if the `Condition.check_*()` methods return the check mode validator appropriate to each datatype.
+    """
+    # Act / Assert
+    assert isinstance(Condition.check_bool(True, 'value'), BooleanCheckValidator)
+    assert isinstance(Condition.check_num(1234, 'value'), NumberCheckValidator)
+    assert isinstance(Condition.check_obj(TypeExample(), 'value'), ObjectCheckValidator)
+    assert isinstance(Condition.check_str('test', 'value'), StringCheckValidator)
+
+
+def test_plan_returns_validation_plans():
+    """
+    Tests if the `Condition.plan_*()` methods return a validation plan for the validator of each datatype.
+    """
+    # Act / Assert
+    assert Condition.plan_bool('value').validator_type is BooleanValidator
+    assert Condition.plan_num('value').validator_type is NumberValidator
+    assert Condition.plan_obj('value').validator_type is ObjectValidator
+    assert Condition.plan_str('value').validator_type is StringValidator
+
+
+def test_disable_returns_noop_validator_from_ensures():
+    """
+    Tests that switched off `ensures_*()` entry points return a no-op validator,
+    while the `requires_*()` entry points keep validating.
+    """
+    # Arrange
+    Condition.disable('ensures')
+
+    try:
+        # Act
+        validator = Condition.ensures_num(-1, 'value').is_positive().is_greater_than(5)
+
+        # Assert
+        assert isinstance(validator, NoopValidator)
+        assert validator.get_value() == -1
+        assert isinstance(Condition.ensures_str(None, 'value').is_not_null(), NoopValidator)
+        assert isinstance(Condition.requires_num(-1, 'value'), NumberValidator)
+    finally:
+        Condition.reset_switches()
+
+
+def test_disable_all_returns_noop_validator_from_requires():
+    """
+    Tests that switching off `all` entry points also switches off the `requires_*()` entry points.
+    """
+    # Arrange
+    Condition.disable('all')
+
+    try:
+        # Act / Assert
+        assert isinstance(Condition.requires_obj(None, 'value').is_not_null(), NoopValidator)
+        assert Condition.ensures_bool(False, 'value').is_true().get_value() is False
+    finally:
+        Condition.reset_switches()
+
+    assert isinstance(Condition.requires_obj(None, 'value'), ObjectValidator)
+
+
+def test_disable_module_only_affects_calling_module():
+    """
+    Tests that a module switch only applies to the entry points called from that module.
+    """
+    # Arrange
+    Condition.disable('requires', module='some.other.module')
+
+    try:
+        # Act / Assert
+        assert isinstance(Condition.requires_num(1, 'value'), NumberValidator)
+
+        Condition.disable('requires', module=__name__)
+
+        assert Condition.requires_num(1, 'value').get_value() == 1
+        assert Condition.is_disabled('requires', __name__)
+        assert not Condition.is_disabled('requires')
+    finally:
+        Condition.reset_switches()
+
+
+def test_enable_module_overrides_global_switch():
+    """
+    Tests that a module can keep validating while the entry points are switched off globally.
+    """
+    # Arrange
+    Condition.disable('ensures')
+    Condition.enable('ensures', module=__name__)
+
+    try:
+        # Act / Assert
+        assert isinstance(Condition.ensures_num(1, 'value'), NumberValidator)
+    finally:
+        Condition.reset_switches()
+
+
+@pytest.mark.parametrize(
+    'setting,requires_disabled,ensures_disabled',
+    [
+        ('ensures', False, True),
+        ('requires', True, False),
+        ('all', True, True),
+        ('none', False, False)
+    ]
+)
+def test_reset_switches_reads_environment_variable(monkeypatch, setting: str, requires_disabled: bool, ensures_disabled: bool):
+    """
+    Tests that the default switches are read from the `CONDITIONS_PY_DISABLE` environment variable.
+    """
+    # Arrange
+    monkeypatch.setenv(Condition.DISABLE_ENVIRONMENT_VARIABLE, setting)
+
+    try:
+        # Act
+        Condition.reset_switches()
+
+        # Assert
+        assert Condition.is_disabled('requires') == requires_disabled
+        assert Condition.is_disabled('ensures') == ensures_disabled
+    finally:
+        monkeypatch.delenv(Condition.DISABLE_ENVIRONMENT_VARIABLE)
+        Condition.reset_switches()
+
+
+def test_disable_throws_error_on_unknown_kind():
+    """
+    Tests that switching an unknown kind of entry points throws a ValueError.
+    """
+    # Assert
+    with pytest.raises(ValueError):
+        # Act
+        Condition.disable('validates')
+
+
+def test_index_returns_set_index():
+    """
+    Tests if the `Condition.index()` method builds a reusable membership index.
+    """
+    # Act
+    index = Condition.index(['a', 'b', 'c'])
+
+    # Assert
+    assert isinstance(index, SetIndex)
+    assert 'b' in index
+
+
+def test_automaton_returns_aho_corasick_automaton():
+    """
+    Tests if the `Condition.automaton()` method builds a reusable multi-substring automaton.
+    """
+    # Act
+    automaton = Condition.automaton(['foo', 'bar'])
+
+    # Assert
+    assert isinstance(automaton, AhoCorasick)
+    assert automaton.find('a bar') == ('bar', 2)
+
+
+def test_regex_set_returns_reusable_pattern_set():
+    """
+    Tests if the `Condition.regex_set()` method builds a reusable multi-pattern matcher.
+    """
+    # Act
+    regex_set = Condition.regex_set([r'foo\d', r'bar'])
+
+    # Assert
+    assert isinstance(regex_set, RegexSet)
+    assert regex_set.find('bar!') == r'bar'
+
+
+def test_capture_values_applies_policy_to_raised_errors():
+    """
+    Tests that the `capture_values()` method sets how much of the value the raised errors keep.
+    """
+    # Arrange
+    Condition.capture_values('type')
+
+    try:
+        # Act
+        with pytest.raises(ArgumentOutOfRangeError) as excinfo:
+            Condition.requires_num(150, 'value').is_in_range(0, 100)
+    finally:
+        Condition.capture_values()
+
+    # Assert
+    assert excinfo.value.value == '<int>'
+    assert str(excinfo.value) == 'The argument `value` is out of the range `0-100`, was `<int>`'
+
+
+@pytest.mark.parametrize('policy', ['full', 'truncated', 'type', 'weakref'])
+def test_capture_values_releases_value_from_traceback(policy: str):
+    """
+    Tests that under every capture policy but `full` the traceback of a raised error does not reference the value,
+    neither directly nor through the validator.
+    """
+    # Arrange
+    value = 'x' * 1000
+    validator = Condition.requires_str(value, 'value')
+    Condition.capture_values(policy)
+
+    try:
+        # Act
+        with pytest.raises(ArgumentError) as excinfo:
+            validator.is_shorter_than(10)
+    finally:
+        Condition.capture_values()
+
+    # Assert
+    frames = [frame for frame, _ in traceback.walk_tb(excinfo.value.__traceback__)][1:]
+    references = [local for frame in frames for local in frame.f_locals.values()]
+    pinned = any(local is value or getattr(local, 'value', None) is value for local in references)
+    assert pinned == (policy == 'full')
+    assert (validator.get_value() is value) == (policy == 'full')
+
+
+@pytest.mark.parametrize(
+    'method,value,validator_type',
+    [
+        ('pooled_obj', object(), ObjectValidator),
+        ('pooled_num', 1, NumberValidator),
+        ('pooled_bool', True, BooleanValidator),
+        ('pooled_str', 'a', StringValidator)
+    ]
+)
+def test_pooled_methods_reuse_validator(method: str, value: object, validator_type: type):
+    """
+    Tests that the `pooled_*()` methods return the same validator of the type on every call, rebound to the value.
+    """
+    # Act
+    first = getattr(Condition, method)(value, 'first')
+    second = getattr(Condition, method)(value, 'second')
+
+    # Assert
+    assert type(second) is validator_type
+    assert second is first
+    assert second.value is value
+    assert second.argument_name == 'second'
@@ -1,5 +1,11 @@
+import gc
+import pytest
 from pytest import raises
 from src.errors.argument_error import ArgumentError
+from src.errors.argument_null_error import ArgumentNullError
+from src.errors.argument_out_of_range_error import ArgumentOutOfRangeError
+from src.errors.argument_pattern_error import ArgumentPatternError
+from src.helpers.value_capture import ValueCapture
 
 
 def test_constructor_assigns_values():
@@ -22,4 +28,98 @@ def test_constructor_assigns_values():
     # Assert
     assert excinfo.value.args[0] == message
     assert excinfo.value.value == value
-    assert excinfo.value.argument_name == argument_name
\ No newline at end of file
+    assert excinfo.value.argument_name == argument_name
+
+def test_constructor_defers_message_rendering():
+    """
+    Tests that the message template is only rendered once the message is accessed.
+    """
+    # Arrange
+    message = 'The argument `{argument_name}` was `{value}` and not `{expected}`'
+
+    # Act
+    error = ArgumentError(message, 'test_value', 'value', message_args={'expected': 'other'})
+
+    # Assert
+    assert error._message is None
+    assert str(error) == 'The argument `value` was `test_value` and not `other`'
+    assert error.args == ('The argument `value` was `test_value` and not `other`',)
+
+
+def test_constructor_uses_message_verbatim_without_message_args():
+    """
+    Tests that the message is not treated as a template when no `message_args` are supplied.
+    """
+    # Arrange
+    message = 'The argument `{argument_name}` is invalid'
+
+    # Act
+    error = ArgumentError(message, 'test_value', 'value')
+
+    # Assert
+    assert str(error) == message
+    assert error.message == message
+
+
+@pytest.mark.parametrize(
+    'error_type,error_args',
+    [
+        (ArgumentError, {}),
+        (ArgumentNullError, {}),
+        (ArgumentOutOfRangeError, {'min_value': 0, 'max_value': 100}),
+        (ArgumentPatternError, {'pattern': 'a+'})
+    ]
+)
+@pytest.mark.parametrize(
+    'policy,expected',
+    [
+        ('full', 'x' * 200),
+        ('truncated', "'xxxxxxxxxxxxxxx...xxxxxxxxxxxxxxxx'"),
+        ('type', '<str of length 200>')
+    ]
+)
+def test_constructor_captures_value_according_to_policy(error_type: type, error_args: dict, policy: str, expected: str):
+    """
+    Tests that every error keeps its value, and renders it in its message, according to the capture policy.
+    """
+    # Arrange
+    ValueCapture.configure(policy, 36)
+
+    try:
+        # Act
+        error = error_type('Was `{value}`', 'x' * 200, 'value', message_args={}, **error_args)
+    finally:
+        ValueCapture.configure()
+
+    # Assert
+    assert error.value == expected
+    assert error.message == f'Was `{expected}`'
+
+
+def test_constructor_references_value_weakly_with_weakref_policy():
+    """
+    Tests that the error keeps a weak reference with the `weakref` policy, while its message keeps a truncated
+    representation of the value.
+    """
+    # Arrange
+    class Payload:
+        def __repr__(self) -> str:
+            return 'Payload()'
+
+    value = Payload()
+    ValueCapture.configure('weakref')
+
+    try:
+        # Act
+        error = ArgumentError('Was `{value}`', value, 'value', message_args={})
+    finally:
+        ValueCapture.configure()
+
+    # Assert
+    assert error.value is value
+
+    del value
+    gc.collect()
+
+    assert error.value is None
+    assert error.message == 'Was `Payload()`'
@@ -0,0 +1,41 @@
+from pytest import raises
+from src.errors.argument_error import ArgumentError
+from src.errors.argument_error_group import ArgumentErrorGroup
+from src.errors.argument_null_error import ArgumentNullError
+
+
+def test_constructor_assigns_values():
+    """
+    Tests that the constructor assigns the message and the errors.
+    """
+    # Arrange
+    message = 'This is my error message'
+    errors = [
+        ArgumentNullError('{argument_name}', None, 'first', message_args={}),
+        ArgumentError('{argument_name}', 1, 'second', message_args={})
+    ]
+
+    # Act
+    with raises(ArgumentErrorGroup) as excinfo:
+        raise ArgumentErrorGroup(message, errors)
+
+    # Assert
+    assert excinfo.value.message == message
+    assert list(excinfo.value.exceptions) == errors
+
+
+def test_group_can_be_split_by_error_type():
+    """
+    Tests that the group can be split by error type, keeping the group type.
+    """
+    # Arrange
+    null_error = ArgumentNullError('{argument_name}', None, 'first', message_args={})
+    group = ArgumentErrorGroup('message', [null_error, ArgumentError('{argument_name}', 1, 'second', message_args={})])
+
+    # Act
+    matched, rest = group.split(ArgumentNullError)
+
+    # Assert
+    assert isinstance(matched, ArgumentErrorGroup)
+    assert list(matched.exceptions) == [null_error]
+    assert len(rest.exceptions) == 1
@@ -31,4 +31,21 @@ def test_constructor_assigns_values():
     assert excinfo.value.argument_name == argument_name
     assert excinfo.value.equal_to == equal_to
     assert excinfo.value.min_value == min_value
-    assert excinfo.value.max_value == max_value
\ No newline at end of file
+    assert excinfo.value.max_value == max_value
+
+def test_message_template_renders_bounds():
+    """
+    Tests that the message template can refer to the violated bounds of the error.
+    """
+    # Act
+    error = ArgumentOutOfRangeError(
+        'The argument `{argument_name}` is out of the range `{min_value}-{max_value}`, was `{value}`',
+        11,
+        'value',
+        min_value=1,
+        max_value=10,
+        message_args={}
+    )
+
+    # Assert
+    assert str(error) == 'The argument `value` is out of the range `1-10`, was `11`'
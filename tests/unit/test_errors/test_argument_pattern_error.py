@@ -1,3 +1,4 @@
+import re
 from pytest import raises
 from src.errors.argument_pattern_error import ArgumentPatternError
 
@@ -25,4 +26,20 @@ def test_constructor_assigns_values():
     assert excinfo.value.args[0] == message
     assert excinfo.value.value == value
     assert excinfo.value.argument_name == argument_name
-    assert excinfo.value.pattern == pattern
\ No newline at end of file
+    assert excinfo.value.pattern == pattern
+
+def test_message_template_renders_compiled_pattern_source():
+    """
+    Tests that the message template renders the source of a compiled pattern.
+    """
+    # Act
+    error = ArgumentPatternError(
+        'The argument `{argument_name}` should match the pattern `{pattern}`',
+        'test_value',
+        'value',
+        re.compile(r'^\d+$'),
+        message_args={}
+    )
+
+    # Assert
+    assert str(error) == r'The argument `value` should match the pattern `^\d+$`'
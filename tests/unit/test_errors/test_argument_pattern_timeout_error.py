@@ -0,0 +1,50 @@
+from pytest import raises
+from src.errors.argument_pattern_error import ArgumentPatternError
+from src.errors.argument_pattern_timeout_error import ArgumentPatternTimeoutError
+
+
+def test_constructor_assigns_values():
+    """
+    Tests that the constructor assigns the pattern and the timeout, and that the error is an ArgumentPatternError.
+    """
+    # Arrange
+    message = 'This is my error message'
+    value = 'test_value'
+    argument_name = 'value'
+    pattern = r'(a+)+$'
+    timeout = 0.5
+
+    # Act
+    with raises(ArgumentPatternError) as excinfo:
+        raise ArgumentPatternTimeoutError(
+            message,
+            value,
+            argument_name,
+            pattern,
+            timeout
+        )
+
+    # Assert
+    assert excinfo.value.args[0] == message
+    assert excinfo.value.value == value
+    assert excinfo.value.argument_name == argument_name
+    assert excinfo.value.pattern == pattern
+    assert excinfo.value.timeout == timeout
+
+
+def test_message_template_renders_timeout():
+    """
+    Tests that the message template renders the timeout.
+    """
+    # Act
+    error = ArgumentPatternTimeoutError(
+        'The argument `{argument_name}` could not be matched against the pattern `{pattern}` within `{timeout}` seconds',
+        'test_value',
+        'value',
+        r'(a+)+$',
+        0.5,
+        message_args={}
+    )
+
+    # Assert
+    assert str(error) == 'The argument `value` could not be matched against the pattern `(a+)+$` within `0.5` seconds'
@@ -0,0 +1,101 @@
+import pytest
+from pytest import raises
+from src import fast
+from src.condition import Condition
+from src.errors.argument_error import ArgumentError
+from src.errors.argument_error_group import ArgumentErrorGroup
+
+
+NUMBER_CASES = [
+    ('require_in_range', 'is_in_range', (0, 100), 50, 150),
+    ('require_not_in_range', 'is_not_in_range', (0, 100), 150, 50),
+    ('require_greater_than', 'is_greater_than', (10,), 11, 10),
+    ('require_greater_or_equal', 'is_greater_or_equal', (10,), 10, 9),
+    ('require_less_than', 'is_less_than', (10,), 9, 10),
+    ('require_less_or_equal', 'is_less_or_equal', (10,), 10, 11),
+    ('require_equal_to', 'is_equal_to', (10,), 10, 11),
+    ('require_not_equal_to', 'is_not_equal_to', (10,), 11, 10),
+    ('require_positive', 'is_positive', (), 0, -1),
+    ('require_negative', 'is_negative', (), -1, 0)
+]
+
+
+STRING_CASES = [
+    ('require_not_null', 'is_not_null', (), '', None),
+    ('require_not_null_or_empty', 'is_not_null_or_empty', (), ' ', ''),
+    ('require_not_null_or_whitespace', 'is_not_null_or_whitespace', (), ' a ', ' \t'),
+    ('require_shorter_than', 'is_shorter_than', (3,), 'ab', 'abc'),
+    ('require_shorter_or_equal', 'is_shorter_or_equal', (3,), 'abc', 'abcd'),
+    ('require_longer_than', 'is_longer_than', (3,), 'abcd', 'abc'),
+    ('require_longer_or_equal', 'is_longer_or_equal', (3,), 'abc', 'ab'),
+    ('require_length', 'has_length', (3,), 'abc', 'ab'),
+    ('require_starts_with', 'starts_with', ('ab',), 'abc', 'bca'),
+    ('require_ends_with', 'ends_with', ('bc',), 'abc', 'cab'),
+    ('require_contains', 'contains', ('b',), 'abc', 'acd'),
+    ('require_regex_match', 'is_regex_match', (r'[a-z]+\d',), 'abc1', '1abc')
+]
+
+
+def _fluent_error(entry_point, condition: str, args: tuple, value: object) -> ArgumentError:
+    with raises(ArgumentError) as excinfo:
+        getattr(entry_point(value, 'value'), condition)(*args)
+
+    return excinfo.value
+
+
+@pytest.mark.parametrize('function,condition,args,valid,invalid', NUMBER_CASES)
+def test_number_functions_match_number_validator(function: str, condition: str, args: tuple, valid: int, invalid: int):
+    """
+    Tests that the number functions return valid values, and raise the same error as the validator otherwise.
+    """
+    # Arrange
+    require = getattr(fast, function)
+    expected = _fluent_error(Condition.requires_num, condition, args, invalid)
+
+    # Act
+    actual = require(valid, *args, 'value')
+
+    with raises(ArgumentError) as excinfo:
+        require(invalid, *args, 'value')
+
+    # Assert
+    assert actual == valid
+    assert type(excinfo.value) is type(expected)
+    assert str(excinfo.value) == str(expected)
+    assert excinfo.value.argument_name == 'value'
+
+
+@pytest.mark.parametrize('function,condition,args,valid,invalid', STRING_CASES)
+def test_string_functions_match_string_validator(function: str, condition: str, args: tuple, valid: str, invalid: str):
+    """
+    Tests that the string functions return valid values, and raise the same error as the validator otherwise.
+    """
+    # Arrange
+    require = getattr(fast, function)
+    expected = _fluent_error(Condition.requires_str, condition, args, invalid)
+
+    # Act
+    actual = require(valid, *args, 'value')
+
+    with raises(ArgumentError) as excinfo:
+        require(invalid, *args, 'value')
+
+    # Assert
+    assert actual is valid
+    assert type(excinfo.value) is type(expected)
+    assert str(excinfo.value) == str(expected)
+
+
+def test_functions_record_failures_within_collecting_scope():
+    """
+    Tests that failing functions record their error within a collecting scope and return the value.
+    """
+    # Act
+    with raises(ArgumentErrorGroup) as excinfo:
+        with Condition.collect():
+            actual = fast.require_in_range(150, 0, 100, 'age')
+            fast.require_not_null_or_whitespace('', 'name')
+
+    # Assert
+    assert actual == 150
+    assert [error.argument_name for error in excinfo.value.exceptions] == ['age', 'name']
@@ -0,0 +1,102 @@
+import pytest
+from src.helpers.affix_trie import AffixTrie
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('https://example.com', 'https://'),
+        ('http://example.com', 'http://'),
+        ('https-like', None),
+        ('ftp://example.com', None),
+        ('', None)
+    ]
+)
+def test_find_returns_matching_prefix(value: str, expected: str):
+    """
+    Tests that the `find()` method returns the prefix the value starts with.
+    """
+    # Arrange
+    trie = AffixTrie(['https://', 'http://', 'https://www.'])
+
+    # Act
+    actual = trie.find(value)
+
+    # Assert
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('report.tar.gz', '.gz'),
+        ('photo.jpeg', '.jpeg'),
+        ('notes.txt', None),
+        ('gz', None)
+    ]
+)
+def test_find_returns_matching_suffix(value: str, expected: str):
+    """
+    Tests that the `find()` method of a suffix trie returns the suffix the value ends with.
+    """
+    # Arrange
+    trie = AffixTrie(['.gz', '.jpeg', '.tar.gz'], suffix=True)
+
+    # Act
+    actual = trie.find(value)
+
+    # Assert
+    assert actual == expected
+
+
+def test_find_matches_empty_affix():
+    """
+    Tests that an empty affix matches every value, like `str.startswith('')`.
+    """
+    # Act / Assert
+    assert AffixTrie(['', 'abc']).find('xyz') == ''
+
+
+def test_of_returns_cached_trie_per_direction():
+    """
+    Tests that the `of()` method builds one trie per collection object and direction.
+    """
+    # Arrange
+    affixes = ['ab', 'cd']
+
+    # Act
+    prefixes = AffixTrie.of(affixes)
+    suffixes = AffixTrie.of(affixes, suffix=True)
+
+    # Assert
+    assert AffixTrie.of(affixes) is prefixes
+    assert AffixTrie.of(affixes, suffix=True) is suffixes
+    assert prefixes is not suffixes
+
+
+@pytest.mark.parametrize('suffix', [False, True])
+def test_of_sees_collections_modified_in_place(suffix: bool):
+    """
+    Tests that the `of()` method builds the trie again once the collection was modified in place.
+    """
+    # Arrange
+    affixes = ['ab', 'cd']
+    AffixTrie.of(affixes, suffix)
+
+    # Act
+    affixes[0] = 'x'
+    trie = AffixTrie.of(affixes, suffix)
+
+    # Assert
+    assert trie.find('x') == 'x'
+    assert trie.find('ab') is None
+
+
+def test_of_throws_error_on_trie_with_other_direction():
+    """
+    Tests that the `of()` method rejects a prefix trie where a suffix trie is expected.
+    """
+    # Assert
+    with pytest.raises(ValueError):
+        # Act
+        AffixTrie.of(AffixTrie(['ab']), suffix=True)
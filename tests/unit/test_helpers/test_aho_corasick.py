@@ -0,0 +1,89 @@
+import pytest
+from src.helpers.aho_corasick import AhoCorasick
+
+
+@pytest.mark.parametrize(
+    'haystack,expected',
+    [
+        ('ushers', ('she', 1)),
+        ('ahishers', ('his', 1)),
+        ('hershey', ('he', 0)),
+        ('nothing here', ('he', 8)),
+        ('xyz', None),
+        ('', None)
+    ]
+)
+def test_find_returns_first_needle_and_offset(haystack: str, expected: tuple):
+    """
+    Tests that the `find()` method returns the needle which ends first in the haystack, and its offset.
+    """
+    # Arrange
+    automaton = AhoCorasick(['he', 'she', 'his', 'hers'])
+
+    # Act
+    actual = automaton.find(haystack)
+
+    # Assert
+    assert actual == expected
+
+
+def test_find_prefers_longest_needle_ending_at_same_position():
+    """
+    Tests that the `find()` method reports the longest needle when several needles end at the same position.
+    """
+    # Arrange
+    automaton = AhoCorasick(['b', 'abc', 'bc'])
+
+    # Act
+    actual = automaton.find('xabcx')
+
+    # Assert
+    assert actual == ('b', 2)
+    assert AhoCorasick(['c', 'abc', 'bc']).find('xabcx') == ('abc', 1)
+
+
+def test_find_matches_empty_needle():
+    """
+    Tests that an empty needle matches every haystack at offset 0, like the `in` operator.
+    """
+    # Act / Assert
+    assert AhoCorasick(['', 'abc']).find('xyz') == ('', 0)
+
+
+def test_of_returns_cached_automaton_for_same_collection():
+    """
+    Tests that the `of()` method builds an automaton once per collection object, until it is modified.
+    """
+    # Arrange
+    needles = ['secret', 'token', 'password']
+
+    # Act
+    first = AhoCorasick.of(needles)
+    second = AhoCorasick.of(needles)
+
+    # Assert
+    assert first is second
+    assert AhoCorasick.of(first) is first
+
+
+@pytest.mark.parametrize('factory', [list, set])
+def test_of_sees_collections_modified_in_place(factory: type):
+    """
+    Tests that the `of()` method builds the automaton again once the collection was modified in place.
+    """
+    # Arrange
+    needles = factory(['secret', 'token'])
+    AhoCorasick.of(needles)
+
+    # Act
+    if factory is list:
+        needles[0] = 'hello'
+    else:
+        needles.discard('secret')
+        needles.add('hello')
+
+    automaton = AhoCorasick.of(needles)
+
+    # Assert
+    assert automaton.find('say hello') == ('hello', 4)
+    assert automaton.find('my secret') is None
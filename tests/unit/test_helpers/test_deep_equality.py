@@ -0,0 +1,224 @@
+import pytest
+import uuid
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from src.helpers.deep_equality import DeepEquality, MISSING
+
+try:
+    from functools import cached_property
+except ImportError:
+    cached_property = None
+
+
+requires_cached_property = pytest.mark.skipif(cached_property is None, reason='cached_property needs Python 3.8')
+
+
+@dataclass
+class Line:
+    qty: int
+    sku: str
+    note: str = field(default='', compare=False)
+
+
+class Order:
+    def __init__(self, lines: list, meta: dict = None):
+        self.lines = lines
+        self.meta = meta or {}
+
+
+class Holder:
+    def __init__(self, value: object):
+        self.value = value
+
+
+class Circle:
+    def __init__(self, radius: int):
+        self.radius = radius
+
+    if cached_property is not None:
+        @cached_property
+        def area(self) -> float:
+            return 3.14 * self.radius ** 2
+
+
+class Slotted:
+    __slots__ = ('x', '__y')
+
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.__y = y
+
+
+def make_order(qty: int = 4, note: str = '') -> Order:
+    return Order([Line(1, 'a'), Line(2, 'b'), Line(3, 'c'), Line(qty, 'd', note)], {'tags': ['x', 'y']})
+
+
+@pytest.mark.parametrize(
+    'actual,expected',
+    [
+        (make_order(), make_order()),
+        (make_order(note='first'), make_order(note='second')),
+        (Slotted(1, 2), Slotted(1, 2)),
+        ({'a': [1, {2, 3}]}, {'a': [1, {3, 2}]}),
+        (1, 1.0),
+        (None, None)
+    ]
+)
+def test_find_difference_returns_none_on_equal_graphs(actual: object, expected: object):
+    """
+    Tests that the `find_difference()` method returns `None` when the graphs are structurally equal.
+    """
+    # Act
+    difference = DeepEquality.find_difference(actual, expected)
+
+    # Assert
+    assert difference is None
+
+
+@pytest.mark.parametrize(
+    'actual,expected,path,reason',
+    [
+        (make_order(4), make_order(5), 'order.lines[3].qty', 'value'),
+        (Order([Line(1, 'a')]), Order([]), 'order.lines', 'length'),
+        (Order([], {'a': 1}), Order([], {'a': 1, 'b': 2}), "order.meta['b']", 'missing'),
+        (Order([], {'a': 1, 'b': 2}), Order([], {'a': 1}), "order.meta['b']", 'unexpected'),
+        (Slotted(1, 2), Slotted(1, 3), 'order._Slotted__y', 'value'),
+        (Order('abc'), Order(['a', 'b', 'c']), 'order.lines', 'kind')
+    ]
+)
+def test_find_difference_reports_path_of_first_difference(actual: object, expected: object, path: str, reason: str):
+    """
+    Tests that the `find_difference()` method reports the path and reason of the first difference.
+    """
+    # Act
+    difference = DeepEquality.find_difference(actual, expected, 'order')
+
+    # Assert
+    assert difference.path == path
+    assert difference.reason == reason
+
+
+def test_find_difference_reports_missing_attribute():
+    """
+    Tests that the `find_difference()` method reports an attribute only the expected object has.
+    """
+    # Arrange
+    actual = Order([])
+    expected = Order([])
+    expected.extra = 1
+
+    # Act
+    difference = DeepEquality.find_difference(actual, expected)
+
+    # Assert
+    assert difference == ('value.extra', 'missing', MISSING, 1)
+
+
+def test_find_difference_terminates_on_cycles():
+    """
+    Tests that the `find_difference()` method terminates on cyclic graphs.
+    """
+    # Arrange
+    actual = Order([])
+    actual.lines.append(actual)
+    expected = Order([])
+    expected.lines.append(expected)
+
+    # Act
+    difference = DeepEquality.find_difference(actual, expected)
+
+    # Assert
+    assert difference is None
+
+
+def test_find_difference_handles_deep_graphs_without_recursion():
+    """
+    Tests that the `find_difference()` method compares graphs nested deeper than the recursion limit.
+    """
+    # Arrange
+    actual = expected = 0
+
+    for _ in range(5000):
+        actual = [actual]
+        expected = [expected]
+
+    # Act
+    difference = DeepEquality.find_difference(actual, expected)
+
+    # Assert
+    assert difference is None
+
+
+def test_find_difference_compares_objects_with_own_eq_using_eq():
+    """
+    Tests that the `find_difference()` method compares objects whose class defines `__eq__()` with it, ignoring the
+    caches in their state.
+    """
+    # Arrange
+    path = PurePosixPath('/etc/app.conf')
+    str(path)
+    identifier = uuid.UUID('12345678123456781234567812345678')
+    other_identifier = uuid.UUID('12345678123456781234567812345678', is_safe=uuid.SafeUUID.safe)
+
+    # Act
+    path_difference = DeepEquality.find_difference(Holder(path), Holder(PurePosixPath('/etc/app.conf')))
+    identifier_difference = DeepEquality.find_difference(Holder(identifier), Holder(other_identifier))
+
+    # Assert
+    assert path_difference is None
+    assert identifier_difference is None
+
+
+@requires_cached_property
+def test_find_difference_ignores_cached_properties():
+    """
+    Tests that the `find_difference()` method ignores values cached by a `cached_property`.
+    """
+    # Arrange
+    actual = Circle(2)
+    actual.area
+
+    # Act
+    difference = DeepEquality.find_difference(actual, Circle(2))
+
+    # Assert
+    assert difference is None
+
+
+@pytest.mark.parametrize(
+    'actual,expected,path',
+    [
+        ([1, 2], (1, 2), 'value'),
+        (Holder((1, 2)), Holder([1, 2]), 'value.value'),
+        (OrderedDict(a=1, b=2), OrderedDict(b=2, a=1), 'value')
+    ]
+)
+def test_find_difference_reports_containers_which_eq_tells_apart(actual: object, expected: object, path: str):
+    """
+    Tests that the `find_difference()` method reports containers which differ with `==`, such as a list and a tuple
+    or ordered dicts in a different order.
+    """
+    # Act
+    difference = DeepEquality.find_difference(actual, expected)
+
+    # Assert
+    assert difference.path == path
+
+
+@pytest.mark.parametrize(
+    'actual,expected',
+    [
+        (OrderedDict(a=1, b=2), {'b': 2, 'a': 1}),
+        (defaultdict(int, a=1), {'a': 1})
+    ]
+)
+def test_find_difference_accepts_mappings_which_eq_considers_equal(actual: object, expected: object):
+    """
+    Tests that the `find_difference()` method accepts mappings of different types which are equal with `==`.
+    """
+    # Act
+    difference = DeepEquality.find_difference(actual, expected)
+
+    # Assert
+    assert difference is None
@@ -0,0 +1,63 @@
+import pytest
+from src.helpers.failure_bitmap import FailureBitmap
+
+
+def test_set_marks_value_as_failed():
+    """
+    Tests that the `set()` method only marks the value at the specified index as failed.
+    """
+    # Arrange
+    bitmap = FailureBitmap(20)
+
+    # Act
+    bitmap.set(3)
+    bitmap.set(17)
+
+    # Assert
+    assert bitmap[3] == True
+    assert bitmap[17] == True
+    assert bitmap[4] == False
+    assert bitmap.count() == 2
+    assert list(bitmap.indices()) == [3, 17]
+
+
+def test_any_returns_false_on_empty_bitmap():
+    """
+    Tests that the `any()` method returns `False` when no value failed.
+    """
+    # Arrange
+    bitmap = FailureBitmap(9)
+
+    # Act / Assert
+    assert bitmap.any() == False
+    assert len(bitmap.bits) == 2
+
+
+def test_or_combines_failures():
+    """
+    Tests that combining two bitmaps marks the values which failed in either of them.
+    """
+    # Arrange
+    left = FailureBitmap(10)
+    right = FailureBitmap(10)
+    left.set(1)
+    right.set(9)
+
+    # Act
+    combined = left | right
+
+    # Assert
+    assert list(combined.indices()) == [1, 9]
+
+
+def test_getitem_throws_error_on_out_of_range_index():
+    """
+    Tests that reading an index outside of the bitmap throws an IndexError.
+    """
+    # Arrange
+    bitmap = FailureBitmap(8)
+
+    # Assert
+    with pytest.raises(IndexError):
+        # Act
+        bitmap[8]
@@ -0,0 +1,75 @@
+import pytest
+from decimal import Decimal
+from src.helpers.fingerprint import Fingerprint
+
+
+class Service:
+    def __init__(self, port: int, hosts: list):
+        self.port = port
+        self.hosts = hosts
+
+
+@pytest.mark.parametrize(
+    'actual,expected',
+    [
+        ({'a': [1, 2], 'b': {1, 2}}, {'b': {2, 1}, 'a': [1, 2]}),
+        (Service(80, ['a']), Service(80, ['a'])),
+        ([1, True, Decimal('2.5')], [1.0, 1, 2.5]),
+        ({1: 'a'}, {1.0: 'a'})
+    ]
+)
+def test_compute_returns_equal_fingerprints_for_equal_graphs(actual: object, expected: object):
+    """
+    Tests that the `compute()` method returns equal fingerprints for structurally equal graphs.
+    """
+    # Act / Assert
+    assert Fingerprint.compute(actual) == Fingerprint.compute(expected)
+
+
+@pytest.mark.parametrize(
+    'actual,expected',
+    [
+        (Service(80, ['a']), Service(81, ['a'])),
+        ([[1], [2]], [[2], [1]]),
+        ({'a': 1, 'b': 2}, {'a': 2, 'b': 1}),
+        ([], {}),
+        ([1, 2], (1, 2)),
+        ('a', b'a')
+    ]
+)
+def test_compute_returns_different_fingerprints_for_different_graphs(actual: object, expected: object):
+    """
+    Tests that the `compute()` method returns different fingerprints for graphs which differ.
+    """
+    # Act / Assert
+    assert Fingerprint.compute(actual) != Fingerprint.compute(expected)
+
+
+def test_compute_returns_none_on_cycles():
+    """
+    Tests that the `compute()` method gives up on cyclic graphs rather than looping.
+    """
+    # Arrange
+    value = [1]
+    value.append(value)
+
+    # Act / Assert
+    assert Fingerprint.compute(value) is None
+
+
+def test_of_caches_fingerprint_of_reference():
+    """
+    Tests that the `of()` method computes the fingerprint of a reference once and caches it by identity.
+    """
+    # Arrange
+    Fingerprint.clear_cache()
+    reference = {'a': [1, 2]}
+
+    # Act
+    first = Fingerprint.of(reference)
+    reference['a'].append(3)
+    second = Fingerprint.of(reference)
+
+    # Assert
+    assert first == second
+    assert first != Fingerprint.compute(reference)
@@ -0,0 +1,88 @@
+import pytest
+from src.helpers.lru_cache import LruCache
+
+
+def test_get_returns_default_on_missing_key():
+    """
+    Tests that the `get()` method returns the default value and counts a miss when the key is missing.
+    """
+    # Arrange
+    cache = LruCache(2)
+
+    # Act
+    actual = cache.get('missing', 'default')
+
+    # Assert
+    assert actual == 'default'
+    assert cache.misses == 1
+
+
+def test_put_evicts_least_recently_used_entry():
+    """
+    Tests that the `put()` method evicts the least recently used entry once the cache is full.
+    """
+    # Arrange
+    cache = LruCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+
+    # Act
+    cache.put('c', 3)
+
+    # Assert
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.evictions == 1
+
+
+def test_get_or_create_only_calls_factory_on_miss():
+    """
+    Tests that the `get_or_create()` method only invokes the factory when the key is missing.
+    """
+    # Arrange
+    cache = LruCache(2)
+    calls = []
+
+    def factory(key):
+        calls.append(key)
+        return key.upper()
+
+    # Act
+    first = cache.get_or_create('a', factory)
+    second = cache.get_or_create('a', factory)
+
+    # Assert
+    assert first == second == 'A'
+    assert calls == ['a']
+    assert cache.info() == (1, 1, 0, 2, 1)
+
+
+def test_resize_evicts_entries_above_new_size():
+    """
+    Tests that the `resize()` method evicts entries which no longer fit in the cache.
+    """
+    # Arrange
+    cache = LruCache(3)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3)
+
+    # Act
+    cache.resize(1)
+
+    # Assert
+    assert len(cache) == 1
+    assert 'c' in cache
+    assert cache.evictions == 2
+
+
+def test_constructor_throws_error_on_negative_size():
+    """
+    Tests that the constructor throws a ValueError when the size is negative.
+    """
+    # Assert
+    with pytest.raises(ValueError):
+        # Act
+        LruCache(-1)
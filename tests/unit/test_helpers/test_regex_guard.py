@@ -0,0 +1,170 @@
+import multiprocessing
+import re
+import threading
+import time
+import pytest
+from src.helpers.regex_guard import RegexGuard
+
+
+CATASTROPHIC = re.compile(r'(a+)+$')
+CATASTROPHIC_STRING = 'a' * 64 + '!'
+SLOW_STRING = 'a' * 22 + '!'
+
+
+def test_shared_returns_one_guard_per_thread():
+    """
+    Tests that the `shared()` method returns the same guard on a thread, and a different one on every other thread.
+    """
+    # Arrange
+    guards = []
+    threads = [threading.Thread(target=lambda: guards.append(RegexGuard.shared())) for _ in range(4)]
+
+    # Act
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert RegexGuard.shared() is RegexGuard.shared()
+    assert len({id(guard) for guard in guards + [RegexGuard.shared()]}) == 5
+
+
+def test_is_match_on_other_thread_is_not_blocked_by_slow_match():
+    """
+    Tests that a slow match on one thread does not delay the matches of the other threads.
+    """
+    # Arrange
+    RegexGuard.shared().is_match(re.compile('a'), 'a', 5)
+    started = threading.Event()
+
+    def slow_match():
+        guard = RegexGuard.shared()
+        guard.is_match(re.compile('a'), 'a', 5)
+        started.set()
+
+        with pytest.raises(TimeoutError):
+            guard.is_match(CATASTROPHIC, CATASTROPHIC_STRING, 1.5)
+
+    thread = threading.Thread(target=slow_match)
+    thread.start()
+    started.wait()
+
+    # Act
+    start = time.monotonic()
+    result = RegexGuard.shared().is_match(re.compile(r'\d+'), '123', 5)
+    elapsed = time.monotonic() - start
+    thread.join()
+
+    # Assert
+    assert result == True
+    assert elapsed < 1
+
+
+def test_is_match_counts_waiting_for_guard_towards_timeout():
+    """
+    Tests that the time a match waits for another thread using the same guard counts towards its timeout.
+    """
+    # Arrange
+    guard = RegexGuard()
+    guard.is_match(re.compile('a'), 'a', 5)
+    thread = threading.Thread(target=lambda: pytest.raises(TimeoutError, guard.is_match, CATASTROPHIC, CATASTROPHIC_STRING, 1.5))
+    thread.start()
+    time.sleep(0.1)
+
+    try:
+        # Act
+        start = time.monotonic()
+
+        with pytest.raises(TimeoutError):
+            guard.is_match(re.compile('a'), 'a', 0.3)
+
+        elapsed = time.monotonic() - start
+    finally:
+        thread.join()
+        guard.close()
+
+    # Assert
+    assert elapsed < 1
+
+
+def test_guard_does_not_fork_workers():
+    """
+    Tests that the worker processes are not forked from the possibly multi-threaded process using the guard.
+    """
+    # Act / Assert
+    assert RegexGuard._context.get_start_method() in ('forkserver', 'spawn')
+
+
+@pytest.mark.parametrize('method', ['spawn', 'forkserver'])
+def test_is_match_does_not_count_starting_worker(monkeypatch, method: str):
+    """
+    Tests that starting the worker does not count towards the timeout, however slow the start method is.
+    """
+    # Arrange
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f'The `{method}` start method is not available')
+
+    monkeypatch.setattr(RegexGuard, '_context', multiprocessing.get_context(method))
+    guard = RegexGuard()
+
+    try:
+        # Act
+        results = [guard.is_match(re.compile(r'^a+$'), 'a' * 5000, 0.05) for _ in range(3)]
+    finally:
+        guard.close()
+
+    # Assert
+    assert results == [True, True, True]
+
+
+def test_is_match_keeps_worker_which_finished_after_timeout():
+    """
+    Tests that a worker whose match timed out, but finished before the next match, is kept.
+    """
+    # Arrange
+    guard = RegexGuard()
+    guard.is_match(re.compile('a'), 'a', 5)
+    process = guard._process
+
+    try:
+        with pytest.raises(TimeoutError):
+            guard.is_match(CATASTROPHIC, SLOW_STRING, 0.01)
+
+        time.sleep(2)
+
+        # Act
+        result = guard.is_match(re.compile('b'), 'b', 5)
+    finally:
+        worker = guard._process
+        guard.close()
+
+    # Assert
+    assert result == True
+    assert worker is process
+
+
+def test_is_match_replaces_worker_which_is_still_matching():
+    """
+    Tests that a worker still running a match which timed out is replaced for the next match.
+    """
+    # Arrange
+    guard = RegexGuard()
+    guard.is_match(re.compile('a'), 'a', 5)
+    process = guard._process
+
+    try:
+        with pytest.raises(TimeoutError):
+            guard.is_match(CATASTROPHIC, CATASTROPHIC_STRING, 0.1)
+
+        # Act
+        result = guard.is_match(re.compile('b'), 'b', 5)
+    finally:
+        worker = guard._process
+        guard.close()
+
+    # Assert
+    assert result == True
+    assert worker is not process
+    assert not process.is_alive()
@@ -1,3 +1,5 @@
+import re
+import sys
 import pytest
 from src.helpers.regex_helper import RegexHelper
 
@@ -35,4 +37,204 @@ def test_is_match_returns_false_on_non_matching_pattern(value: str, pattern: str
     result = RegexHelper.is_match(pattern, value)
 
     # Assert
-    assert result == False
\ No newline at end of file
+    assert result == False
+
+def test_is_match_accepts_compiled_pattern():
+    """
+    Tests that the `is_match()` method accepts a pre-compiled pattern without caching it.
+    """
+    # Arrange
+    RegexHelper.clear_cache()
+    pattern = re.compile(r'^\d+$')
+
+    # Act
+    result = RegexHelper.is_match(pattern, '1234')
+
+    # Assert
+    assert result == True
+    assert RegexHelper.cache_info().current_size == 0
+
+
+def test_compile_returns_cached_pattern():
+    """
+    Tests that the `compile()` method returns the same compiled pattern on subsequent calls.
+    """
+    # Arrange
+    RegexHelper.clear_cache()
+
+    # Act
+    first = RegexHelper.compile(r'^[a-z]+$')
+    second = RegexHelper.compile(r'^[a-z]+$')
+
+    # Assert
+    assert first is second
+    assert RegexHelper.cache_info().hits == 1
+    assert RegexHelper.cache_info().misses == 1
+
+
+def test_set_cache_size_evicts_least_recently_used_patterns():
+    """
+    Tests that the compiled pattern cache evicts the least recently used pattern once it is full.
+    """
+    # Arrange
+    RegexHelper.clear_cache()
+    RegexHelper.set_cache_size(2)
+
+    try:
+        # Act
+        RegexHelper.is_match(r'a', 'a')
+        RegexHelper.is_match(r'b', 'b')
+        RegexHelper.is_match(r'a', 'a')
+        RegexHelper.is_match(r'c', 'c')
+        info = RegexHelper.cache_info()
+
+        # Assert
+        assert info.evictions == 1
+        assert info.current_size == 2
+        assert r'a' in RegexHelper._cache
+        assert r'b' not in RegexHelper._cache
+    finally:
+        RegexHelper.set_cache_size(RegexHelper.DEFAULT_CACHE_SIZE)
+
+
+@pytest.mark.parametrize(
+    'pattern,expected',
+    [
+        (r'^INV-\d{8}$', 'INV-'),
+        (r'https://', 'https://'),
+        (r'\Aab(cd)e+', 'abcd'),
+        (r'ab*', 'a'),
+        (r'ab(?i:c)d', 'ab'),
+        (r'(?i)abc', ''),
+        (r'a|b', ''),
+        (r'\bfoo', ''),
+        (re.compile(r'abc', re.IGNORECASE), '')
+    ]
+)
+def test_literal_prefix_returns_required_leading_text(pattern, expected: str):
+    """
+    Tests that the `literal_prefix()` method returns the literal text every match starts with.
+    """
+    # Act
+    actual = RegexHelper.literal_prefix(pattern)
+
+    # Assert
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    'pattern,expected',
+    [
+        (r'^INV-\d{8}$', ('INV-', '')),
+        (r'.*@example\.com$', ('', '@example.com')),
+        (r'\w+(?:-invoice)+', ('', '-invoice')),
+        (r'ab\d+cdef', ('ab', 'cdef')),
+        (r'(?i).*@example\.com$', ('', ''))
+    ]
+)
+def test_required_literals_returns_prefix_and_substring(pattern: str, expected: tuple):
+    """
+    Tests that the `required_literals()` method returns the literal prefix and the longest other required literal.
+    """
+    # Act
+    actual = RegexHelper.required_literals(pattern)
+
+    # Assert
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    'pattern,value,expected',
+    [
+        (r'^INV-\d{8}$', 'ORD-12345678', False),
+        (r'^INV-\d{8}$', 'INV-12345678', True),
+        (r'.*@example\.com$', 'someone@example.org', False),
+        (r'.*@example\.com$', 'someone@example.com', True),
+        (r'ab\d+cdef', 'ab12cde', False),
+        (r'ab\d+cdef', 'ab12cdef', True)
+    ]
+)
+def test_is_match_prefilter_agrees_with_pattern(pattern: str, value: str, expected: bool):
+    """
+    Tests that the `is_match()` method returns the same result as the pattern when the prefilter applies.
+    """
+    # Act
+    result = RegexHelper.is_match(pattern, value)
+
+    # Assert
+    assert result == expected
+    assert result == (re.match(pattern, value) is not None)
+
+
+def test_prefilter_info_counts_checks_and_rejections():
+    """
+    Tests that the `prefilter_info()` method counts the prefiltered matches and the values they rejected.
+    """
+    # Arrange
+    RegexHelper.clear_cache()
+
+    # Act
+    RegexHelper.is_match(r'^INV-\d+$', 'ORD-1')
+    RegexHelper.is_match(r'^INV-\d+$', 'INV-1')
+    RegexHelper.is_match(r'\d+', '1')
+    info = RegexHelper.prefilter_info()
+
+    # Assert
+    assert info.checks == 2
+    assert info.rejections == 1
+
+
+@pytest.mark.parametrize(
+    'pattern,expected',
+    [
+        (r'(a+)+$', True),
+        (r'(\w+\s?)*$', True),
+        (r'(?:x(?:ab|c+))*', True),
+        (r'^INV-\d{8}$', False),
+        (r'(?:ab)*', False),
+        (r'(a|b)*c', False),
+        pytest.param(r'(?>a+)+', False, marks=pytest.mark.skipif(sys.version_info < (3, 11), reason='Atomic groups need Python 3.11'))
+    ]
+)
+def test_is_vulnerable_flags_nested_repeats(pattern: str, expected: bool):
+    """
+    Tests that the `is_vulnerable()` method flags patterns which repeat a repeated expression.
+    """
+    # Act
+    actual = RegexHelper.is_vulnerable(pattern)
+
+    # Assert
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    'pattern,value,expected',
+    [
+        (r'(a+)+$', 'aaaa', True),
+        (r'(a+)+$', 'aa!', False),
+        (r'^x+$', 'x' * (RegexHelper.GUARDED_INPUT_LENGTH + 1), True),
+        (r'^\d+$', 'abc', False)
+    ]
+)
+def test_is_match_guarded_returns_match_result(pattern: str, value: str, expected: bool):
+    """
+    Tests that the `is_match_guarded()` method returns the same result as the pattern, in or out of the worker process.
+    """
+    # Act
+    result = RegexHelper.is_match_guarded(pattern, value)
+
+    # Assert
+    assert result == expected
+
+
+def test_is_match_guarded_throws_timeout_error_on_catastrophic_backtracking():
+    """
+    Tests that the `is_match_guarded()` method gives up on a match which exceeds its time budget,
+    and that the worker process is restarted for the next match.
+    """
+    # Assert
+    with pytest.raises(TimeoutError):
+        # Act
+        RegexHelper.is_match_guarded(r'(a+)+$', 'a' * 64 + '!', timeout=0.2)
+
+    assert RegexHelper.is_match_guarded(r'(a+)+$', 'aaaa') == True
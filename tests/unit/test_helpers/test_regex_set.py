@@ -0,0 +1,102 @@
+import re
+import pytest
+from src.helpers.regex_set import RegexSet
+
+
+PATTERNS = [r'^INV-\d{8}$', r'https://', r'(?i)abc', r'x(y|z)+', r'\d+', re.compile(r'^foo$', re.MULTILINE)]
+
+
+@pytest.mark.parametrize(
+    'patterns',
+    [
+        PATTERNS,
+        PATTERNS + [r'(a)\1', r'(?P<name>q)'],
+        [f'ID{index}-\\d+' for index in range(RegexSet.MAX_COMBINED_SIZE * 2)] + PATTERNS
+    ]
+)
+@pytest.mark.parametrize(
+    'value',
+    ['INV-12345678', 'https://example.com', 'ABCd', 'xyzy', '1234', 'foo\nbar', 'aa', 'q', 'ID17-5', 'ID170-5', 'none', '']
+)
+def test_find_and_matches_agree_with_individual_patterns(patterns: list, value: str):
+    """
+    Tests that the `find()` and `matches()` methods return the same patterns as matching them one by one.
+    """
+    # Arrange
+    regex_set = RegexSet(patterns)
+    expected = [pattern for pattern in patterns if re.match(pattern, value)]
+
+    # Act
+    first = regex_set.find(value)
+    every = regex_set.matches(value)
+
+    # Assert
+    assert first == (expected[0] if expected else None)
+    assert every == expected
+
+
+@pytest.mark.parametrize(
+    'patterns,expected',
+    [
+        (PATTERNS, True),
+        ([r'(a)\1', r'b'], False),
+        ([r'(?P<name>a)', r'b'], False),
+        ([r'(?x) a b', r'c'], False),
+        ([f'ID{index}' for index in range(RegexSet.MAX_COMBINED_SIZE + 1)], False)
+    ]
+)
+def test_is_combined_only_when_patterns_allow_it(patterns: list, expected: bool):
+    """
+    Tests that the patterns are combined into one alternation only when each keeps its meaning inside it.
+    """
+    # Act
+    regex_set = RegexSet(patterns)
+
+    # Assert
+    assert regex_set.is_combined == expected
+
+
+def test_of_returns_cached_set():
+    """
+    Tests that the `of()` method builds one set per collection object and returns sets as they are.
+    """
+    # Arrange
+    patterns = [r'a+', r'b+']
+
+    # Act
+    regex_set = RegexSet.of(patterns)
+
+    # Assert
+    assert RegexSet.of(patterns) is regex_set
+    assert RegexSet.of(regex_set) is regex_set
+    assert len(regex_set) == 2
+
+
+def test_of_sees_collections_modified_in_place():
+    """
+    Tests that the `of()` method builds the set again once the collection was modified in place.
+    """
+    # Arrange
+    patterns = [r'a+', r'b+']
+    RegexSet.of(patterns)
+
+    # Act
+    patterns[0] = r'c+'
+    regex_set = RegexSet.of(patterns)
+
+    # Assert
+    assert regex_set.find('ccc') == r'c+'
+    assert regex_set.find('aaa') is None
+
+
+def test_empty_set_matches_nothing():
+    """
+    Tests that an empty set matches no string at all.
+    """
+    # Act
+    regex_set = RegexSet([])
+
+    # Assert
+    assert regex_set.find('abc') is None
+    assert regex_set.find('') is None
+    assert regex_set.matches('abc') == []
@@ -0,0 +1,154 @@
+import pytest
+from src.helpers.set_index import SetIndex
+
+
+ALLOWED = [f'value_{number}' for number in range(50)]
+
+
+def test_contains_uses_indexed_values():
+    """
+    Tests that the index reports the membership of the values it was built from.
+    """
+    # Arrange
+    index = SetIndex(ALLOWED)
+
+    # Act / Assert
+    assert 'value_7' in index
+    assert 'value_50' not in index
+    assert len(index) == 50
+
+
+def test_contains_returns_false_on_unhashable_value():
+    """
+    Tests that an unhashable value is reported as not being a member instead of throwing a TypeError.
+    """
+    # Arrange
+    index = SetIndex(ALLOWED)
+
+    # Act / Assert
+    assert ['value_7'] not in index
+
+
+def test_of_returns_cached_index_for_same_tuple():
+    """
+    Tests that the `of()` method indexes a tuple once and returns the cached index for the same tuple object.
+    """
+    # Arrange
+    values = tuple(ALLOWED)
+
+    # Act
+    first = SetIndex.of(values)
+    second = SetIndex.of(values)
+
+    # Assert
+    assert isinstance(first, SetIndex)
+    assert first is second
+
+
+def test_of_returns_mutable_collections_as_they_are():
+    """
+    Tests that the `of()` method does not cache an index for lists and sets, which could be modified in place.
+    """
+    # Arrange
+    values = list(ALLOWED)
+    unique_values = set(ALLOWED)
+
+    # Act / Assert
+    assert SetIndex.of(values) is values
+    assert SetIndex.of(unique_values) is unique_values
+
+
+def test_of_returns_small_unhashable_and_indexed_collections_as_they_are():
+    """
+    Tests that the `of()` method does not index collections which are small, unhashable or already indexed.
+    """
+    # Arrange
+    small = ('a', 'b')
+    unhashable = tuple([number] for number in range(20))
+    index = SetIndex(ALLOWED)
+
+    # Act / Assert
+    assert SetIndex.of(small) is small
+    assert SetIndex.of(unhashable) is unhashable
+    assert SetIndex.of(index) is index
+
+
+def test_contains_case_insensitive_uses_casefold_semantics():
+    """
+    Tests that case-insensitive lookups use `str.casefold()` rather than `str.lower()`.
+    """
+    # Arrange
+    index = SetIndex(['Straße', 'HELLO'])
+
+    # Act / Assert
+    assert index.contains_case_insensitive('STRASSE')
+    assert index.contains_case_insensitive('hello')
+    assert not index.contains_case_insensitive('world')
+
+
+def test_casefolded_is_built_once():
+    """
+    Tests that the casefolded values are built on first use and reused afterwards.
+    """
+    # Arrange
+    index = SetIndex(['A', 'b', None])
+
+    # Act
+    first = index.casefolded
+    second = index.casefolded
+
+    # Assert
+    assert first is second
+    assert first == frozenset(['a', 'b'])
+
+
+def test_of_indexes_small_list_when_min_size_is_lowered():
+    """
+    Tests that the `of()` method indexes collections smaller than `MIN_INDEXED_SIZE` when asked to.
+    """
+    # Arrange
+    values = ('a', 'b')
+
+    # Act
+    index = SetIndex.of(values, min_size=0)
+
+    # Assert
+    assert isinstance(index, SetIndex)
+    assert SetIndex.of(values, min_size=0) is index
+
+
+def test_of_returns_cached_index_for_same_frozenset():
+    """
+    Tests that the `of()` method indexes a frozenset once and returns the cached index for the same frozenset.
+    """
+    # Arrange
+    values = frozenset(ALLOWED)
+
+    # Act
+    first = SetIndex.of(values)
+
+    # Assert
+    assert isinstance(first, SetIndex)
+    assert SetIndex.of(values) is first
+
+
+@pytest.mark.parametrize('factory', [(list), (set)])
+def test_of_mutable_reuses_index_until_contents_change(factory: type):
+    """
+    Tests that the `of_mutable()` method reuses the index of a list or set until its contents change.
+    """
+    # Arrange
+    values = factory(ALLOWED)
+    first = SetIndex.of_mutable(values)
+
+    # Act
+    second = SetIndex.of_mutable(values)
+    values.remove('value_1')
+    values.add('revoked') if factory is set else values.append('revoked')
+    third = SetIndex.of_mutable(values)
+
+    # Assert
+    assert second is first
+    assert third is not first
+    assert 'revoked' in third
+    assert 'value_1' not in third
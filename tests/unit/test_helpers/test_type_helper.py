@@ -0,0 +1,167 @@
+import abc
+import pytest
+from src.helpers.type_helper import TypeHelper
+
+try:
+    from typing import Protocol, runtime_checkable
+except ImportError:
+    Protocol = None
+
+
+requires_protocol = pytest.mark.skipif(Protocol is None, reason='Protocols need Python 3.8')
+
+
+if Protocol is not None:
+    @runtime_checkable
+    class Closable(Protocol):
+        def close(self):
+            ...
+else:
+    Closable = None
+
+
+class Resource:
+    def close(self):
+        pass
+
+
+class Plain:
+    pass
+
+
+class Disguised:
+    @property
+    def __class__(self):
+        return int
+
+
+@pytest.mark.parametrize(
+    'value,types,expected',
+    [
+        (1, (str, int), 1),
+        (True, (int, bool), 0),
+        ('a', (int, float), -1),
+        pytest.param(Resource(), (Closable,), 0, marks=requires_protocol),
+        (1, (int, 2), None),
+        (1, (), None)
+    ]
+)
+def test_first_instance_of_returns_index_of_first_matching_type(value: object, types: tuple, expected: int):
+    """
+    Tests that the `first_instance_of()` method returns the index of the first type the value is an instance of.
+    """
+    # Arrange
+    TypeHelper.clear_cache()
+
+    # Act
+    first = TypeHelper.first_instance_of(value, types)
+    second = TypeHelper.first_instance_of(value, types)
+
+    # Assert
+    assert first == expected
+    assert second == expected
+
+
+def test_first_instance_of_caches_verdict_per_class():
+    """
+    Tests that the `first_instance_of()` method caches the verdict for the class of the value.
+    """
+    # Arrange
+    TypeHelper.clear_cache()
+
+    # Act
+    TypeHelper.first_instance_of(1, (str, int))
+
+    # Assert
+    assert TypeHelper._verdicts == {(int, (str, int)): 1}
+
+
+def test_first_instance_of_is_invalidated_by_abc_registration():
+    """
+    Tests that the `first_instance_of()` method does not return a stale verdict after an ABC registers a subclass.
+    """
+    # Arrange
+    class Registry(abc.ABC):
+        pass
+
+    class Registered:
+        pass
+
+    TypeHelper.clear_cache()
+    before = TypeHelper.first_instance_of(Registered(), (Registry,))
+
+    # Act
+    Registry.register(Registered)
+    after = TypeHelper.first_instance_of(Registered(), (Registry,))
+
+    # Assert
+    assert before == -1
+    assert after == 0
+
+
+@requires_protocol
+def test_first_instance_of_does_not_cache_negative_protocol_verdicts():
+    """
+    Tests that the `first_instance_of()` method does not cache a negative protocol verdict,
+    since an instance may provide the members its class lacks.
+    """
+    # Arrange
+    TypeHelper.clear_cache()
+    provided = Plain()
+    provided.close = lambda: None
+
+    # Act
+    without = TypeHelper.first_instance_of(Plain(), (Closable,))
+    with_member = TypeHelper.first_instance_of(provided, (Closable,))
+
+    # Assert
+    assert without == -1
+    assert with_member == 0
+    assert TypeHelper._verdicts == {}
+
+
+def test_first_instance_of_does_not_cache_values_with_overridden_class():
+    """
+    Tests that the `first_instance_of()` method does not cache values whose `__class__` differs from their type.
+    """
+    # Arrange
+    TypeHelper.clear_cache()
+
+    # Act
+    index = TypeHelper.first_instance_of(Disguised(), (str, int))
+
+    # Assert
+    assert index == 1
+    assert TypeHelper._verdicts == {}
+
+
+@pytest.mark.parametrize(
+    'classes,qualified,expected',
+    [
+        ((int, str), False, frozenset({'int', 'str'})),
+        ((Plain,), True, frozenset({f'{__name__}.Plain'})),
+        ((), False, frozenset()),
+        ((int, type), False, None)
+    ]
+)
+def test_name_set_returns_class_names(classes: tuple, qualified: bool, expected: frozenset):
+    """
+    Tests that the `name_set()` method returns the names of the classes, or `None` if any of them is a metaclass.
+    """
+    # Act
+    actual = TypeHelper.name_set(classes, qualified)
+
+    # Assert
+    assert actual == expected
+
+
+def test_name_set_returns_cached_set():
+    """
+    Tests that the `name_set()` method builds the set once per tuple of classes.
+    """
+    # Act
+    first = TypeHelper.name_set((int, str))
+    second = TypeHelper.name_set((int, str))
+
+    # Assert
+    assert first is second
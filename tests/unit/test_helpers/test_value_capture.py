@@ -0,0 +1,165 @@
+import gc
+import tracemalloc
+from collections import OrderedDict
+import pytest
+from pytest import raises
+from src.helpers.value_capture import ValueCapture, WeakValue
+
+
+class Payload:
+    pass
+
+
+@pytest.fixture(autouse=True)
+def reset_policy():
+    yield
+    ValueCapture.configure()
+
+
+def test_capture_keeps_value_with_full_policy():
+    """
+    Tests that the `capture()` method keeps the value itself with the `full` policy.
+    """
+    # Arrange
+    value = list(range(1000))
+
+    # Act
+    actual = ValueCapture.capture(value)
+
+    # Assert
+    assert actual is value
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('short', "'short'"),
+        (150, '150'),
+        ('x' * 100, "'xxxxxxx...xxxxxxxx'"),
+        (list(range(100)), '[0, 1, 2, 3, 4, 5...'),
+        (b'x' * 100, "b'xxxxxxxxxxxxxxx..."),
+        (bytearray(b'x' * 100), "bytearray(b'xxxxx..."),
+        (10 ** 1000, '<int>'),
+        (OrderedDict(a=1), '<OrderedDict of l...')
+    ]
+)
+def test_capture_truncates_representation_with_truncated_policy(value: object, expected: str):
+    """
+    Tests that the `capture()` method keeps a representation cut at the maximum length with the `truncated` policy.
+    """
+    # Arrange
+    ValueCapture.configure('truncated', 20)
+
+    # Act
+    actual = ValueCapture.capture(value)
+
+    # Assert
+    assert actual == expected
+    assert len(actual) <= 20
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        b'x' * 20_000_000,
+        bytearray(20_000_000),
+        memoryview(bytes(20_000_000))
+    ],
+    ids=['bytes', 'bytearray', 'memoryview']
+)
+def test_capture_does_not_render_large_values_in_full(value: object):
+    """
+    Tests that the `capture()` method with the `truncated` policy does not build the full representation of
+    large values.
+    """
+    # Arrange
+    ValueCapture.configure('truncated', 80)
+    tracemalloc.start()
+
+    try:
+        # Act
+        actual = ValueCapture.capture(value)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Assert
+    assert len(actual) <= 80
+    assert peak < 100_000
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('secret', '<str of length 6>'),
+        ([1, 2, 3], '<list of length 3>'),
+        (150, '<int>'),
+        (Payload(), '<Payload>')
+    ]
+)
+def test_capture_describes_type_with_type_policy(value: object, expected: str):
+    """
+    Tests that the `capture()` method only keeps the type and length with the `type` policy.
+    """
+    # Arrange
+    ValueCapture.configure('type')
+
+    # Act
+    actual = ValueCapture.capture(value)
+
+    # Assert
+    assert actual == expected
+
+
+def test_capture_references_value_weakly_with_weakref_policy():
+    """
+    Tests that the `capture()` method keeps a weak reference with the `weakref` policy, which resolves to the value
+    while it is alive and to `None` afterwards, while the message value stays available.
+    """
+    # Arrange
+    ValueCapture.configure('weakref')
+    value = Payload()
+
+    # Act
+    captured = ValueCapture.capture(value)
+
+    # Assert
+    assert type(captured) is WeakValue
+    assert ValueCapture.resolve(captured) is value
+
+    del value
+    gc.collect()
+
+    assert ValueCapture.resolve(captured) is None
+    assert ValueCapture.message_value(captured).startswith('<')
+
+
+def test_capture_truncates_values_which_cannot_be_weakly_referenced():
+    """
+    Tests that the `capture()` method falls back to the truncated representation for values which cannot be
+    weakly referenced.
+    """
+    # Arrange
+    ValueCapture.configure('weakref', 10)
+
+    # Act
+    actual = ValueCapture.capture('x' * 50)
+
+    # Assert
+    assert actual == "'xx...xxx'"
+
+
+@pytest.mark.parametrize(
+    'policy,max_length',
+    [
+        ('everything', 80),
+        ('truncated', 3)
+    ]
+)
+def test_configure_rejects_invalid_settings(policy: str, max_length: int):
+    """
+    Tests that the `configure()` method rejects unknown policies and too short maximum lengths.
+    """
+    # Act/Assert
+    with raises(ValueError):
+        ValueCapture.configure(policy, max_length)
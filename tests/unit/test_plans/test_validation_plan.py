@@ -0,0 +1,154 @@
+import pytest
+from src.errors.argument_error import ArgumentError
+from src.errors.argument_out_of_range_error import ArgumentOutOfRangeError
+from src.plans.plan_conditions import NUMBER_CONDITIONS
+from src.plans.plan_conditions import STRING_CONDITIONS
+from src.plans.validation_plan import ValidationPlan
+from src.validators.number_validator import NumberValidator
+from src.validators.string_validator import StringValidator
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        (1),
+        (50),
+        (99.5)
+    ]
+)
+def test_compile_accepts_valid_value(value):
+    """
+    Tests that the compiled plan returns the value when every condition passes.
+    """
+    # Arrange
+    plan = ValidationPlan(NumberValidator, 'value', NUMBER_CONDITIONS)\
+        .is_greater_than(0)\
+        .is_less_than(100)\
+        .compile()
+
+    # Act
+    actual = plan(value)
+
+    # Assert
+    assert actual is value
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        (0),
+        (100),
+        (-5.5)
+    ]
+)
+def test_compile_throws_validator_error_on_invalid_value(value):
+    """
+    Tests that the compiled plan throws the same error as the validator when a condition fails.
+    """
+    # Arrange
+    plan = ValidationPlan(NumberValidator, 'value', NUMBER_CONDITIONS)\
+        .is_greater_than(0)\
+        .is_less_than(100)\
+        .compile()
+
+    # Assert
+    with pytest.raises(ArgumentOutOfRangeError):
+        # Act
+        plan(value)
+
+
+def test_compile_bakes_literal_constants():
+    """
+    Tests that literal condition arguments are baked into the generated function.
+    """
+    # Act
+    plan = ValidationPlan(NumberValidator, 'value', NUMBER_CONDITIONS)\
+        .is_in_range(1, 10.5)\
+        .compile()
+
+    # Assert
+    assert 'value < 1 or value > 10.5' in plan.source
+
+
+def test_compile_replays_conditions_without_predicate():
+    """
+    Tests that conditions without an inlined predicate are still evaluated by the compiled plan.
+    """
+    # Arrange
+    plan = ValidationPlan(StringValidator, 'value', STRING_CONDITIONS)\
+        .is_not_null()\
+        .is_in_set_case_insensitive(['ABC', 'def'])\
+        .compile()
+
+    # Act
+    plan('abc')
+
+    # Assert
+    with pytest.raises(ArgumentError):
+        plan('xyz')
+
+
+def test_compile_replays_conditions_with_unused_optional_arguments():
+    """
+    Tests that a condition passing a keyword argument, or an optional argument the predicate does not use, is replayed on a validator.
+    """
+    # Act
+    plan = ValidationPlan(StringValidator, 'value', STRING_CONDITIONS)\
+        .is_regex_match(r'^\d+$')\
+        .is_regex_match(r'^\d+$', True)\
+        .is_regex_match(r'^\d+$', guarded=True)\
+        .compile()
+
+    # Assert
+    assert "is_match('^\\\\d+$', value)" in plan.source
+    assert 'replay(1, value)' in plan.source.splitlines()[4]
+    assert 'replay(2, value)' in plan.source.splitlines()[6]
+
+
+def test_compile_binds_non_literal_constants():
+    """
+    Tests that non-literal condition arguments are bound by name rather than inlined.
+    """
+    # Arrange
+    allowed = ['a', 'b']
+    plan = ValidationPlan(StringValidator, 'value', STRING_CONDITIONS)\
+        .is_in_set(allowed)\
+        .compile()
+
+    # Act
+    plan('a')
+
+    # Assert
+    assert 'not value in index_of(c0_0)' in plan.source
+    with pytest.raises(ArgumentError):
+        plan('c')
+
+
+def test_plan_rejects_unknown_conditions():
+    """
+    Tests that only conditions which exist on the validator can be recorded.
+    """
+    # Arrange
+    plan = ValidationPlan(NumberValidator, 'value', NUMBER_CONDITIONS)
+
+    # Assert
+    with pytest.raises(AttributeError):
+        # Act
+        plan.is_not_a_condition(1)
+
+
+def test_compile_batch_returns_failure_bitmaps():
+    """
+    Tests that the batch function returns one bitmap per condition, with a bit set for every failed value.
+    """
+    # Arrange
+    batch = ValidationPlan(NumberValidator, 'value', NUMBER_CONDITIONS)\
+        .is_greater_than(0)\
+        .is_less_than(100)\
+        .compile_batch()
+
+    # Act
+    bitmaps = batch([5, 0, 150, None, 50])
+
+    # Assert
+    assert bitmaps == [bytearray([0b01010]), bytearray([0b01100])]
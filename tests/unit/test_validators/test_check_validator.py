@@ -0,0 +1,119 @@
+import pytest
+from src.errors.argument_error import ArgumentError
+from src.errors.argument_out_of_range_error import ArgumentOutOfRangeError
+from src.validators.check_result import CheckResult
+from src.validators.check_validator import NumberCheckValidator
+from src.validators.check_validator import StringCheckValidator
+
+
+def test_result_returns_ok_on_passing_chain():
+    """
+    Tests that the `result()` method returns the shared successful result when every condition passes.
+    """
+    # Arrange
+    validator = NumberCheckValidator(50, 'value')
+
+    # Act
+    result = validator.is_greater_than(0).is_less_than(100).result()
+
+    # Assert
+    assert result is CheckResult.OK
+    assert result.ok == True
+    assert result.error_code is None
+
+
+def test_failing_condition_returns_result_instead_of_raising():
+    """
+    Tests that a failing condition returns a failed `CheckResult` rather than throwing an error.
+    """
+    # Arrange
+    validator = NumberCheckValidator(150, 'value')
+
+    # Act
+    result = validator.is_greater_than(0).is_less_than(100).result()
+
+    # Assert
+    assert not result
+    assert result.error_code == 'ArgumentOutOfRangeError'
+    assert result.condition == 'is_less_than'
+    assert result.argument_name == 'value'
+
+
+def test_failing_condition_skips_remaining_conditions():
+    """
+    Tests that the conditions following a failed condition are skipped.
+    """
+    # Arrange
+    validator = StringCheckValidator(None, 'value')
+
+    # Act
+    result = validator.is_not_null().is_shorter_than(5).result()
+
+    # Assert
+    assert result.condition == 'is_not_null'
+
+
+@pytest.mark.parametrize('value', [5, 50])
+def test_get_value_returns_value_whether_chain_failed_or_not(value: int):
+    """
+    Tests that the `get_value()` method returns the value at the end of a chain, whether a condition failed or not.
+    """
+    # Arrange
+    validator = NumberCheckValidator(value, 'value')
+
+    # Act
+    actual = validator.is_greater_than(10).is_less_than(100).get_value()
+
+    # Assert
+    assert actual == value
+
+
+def test_failed_result_rejects_unknown_conditions():
+    """
+    Tests that a failed result only stands in for conditions which exist on the validator.
+    """
+    # Arrange
+    result = NumberCheckValidator(-1, 'value').is_positive()
+
+    # Assert
+    with pytest.raises(AttributeError):
+        # Act
+        result.is_not_a_condition()
+
+
+def test_to_error_builds_equivalent_error():
+    """
+    Tests that the `to_error()` method builds the error the raising validator would have thrown.
+    """
+    # Arrange
+    result = NumberCheckValidator(11, 'value').is_in_range(1, 10).result()
+
+    # Act
+    error = result.to_error()
+
+    # Assert
+    assert isinstance(error, ArgumentOutOfRangeError)
+    assert str(error) == 'The argument `value` is out of the range `1-10`, was `11`'
+    assert error.min_value == 1
+    assert error.max_value == 10
+
+
+def test_raise_if_failed_throws_error_on_failed_result():
+    """
+    Tests that the `raise_if_failed()` method throws the error of the failed condition.
+    """
+    # Arrange
+    result = StringCheckValidator('abc', 'value').equals('def').result()
+
+    # Assert
+    with pytest.raises(ArgumentError):
+        # Act
+        result.raise_if_failed()
+
+
+def test_raise_if_failed_does_nothing_on_ok_result():
+    """
+    Tests that the `raise_if_failed()` method does not throw when the chain passed.
+    """
+    # Act
+    CheckResult.OK.raise_if_failed()
@@ -0,0 +1,193 @@
+import pytest
+from pytest import raises
+from src.condition import Condition
+from src.errors.argument_error_group import ArgumentErrorGroup
+from src.errors.argument_null_error import ArgumentNullError
+from src.errors.argument_out_of_range_error import ArgumentOutOfRangeError
+from src.validators.error_collector import ErrorCollector
+
+
+def test_collect_raises_every_failure_in_one_group():
+    """
+    Tests that the `collect()` scope records the failure of every chain and raises them together on exit.
+    """
+    # Act
+    with raises(ArgumentErrorGroup) as excinfo:
+        with Condition.collect():
+            Condition.requires_num(150, 'age').is_in_range(0, 100)
+            Condition.requires_str(None, 'name').is_not_null()
+            Condition.requires_num(5, 'count').is_positive()
+
+    # Assert
+    errors = excinfo.value.exceptions
+    assert [type(error) for error in errors] == [ArgumentOutOfRangeError, ArgumentNullError]
+    assert [error.argument_name for error in errors] == ['age', 'name']
+
+
+def test_collect_does_not_raise_when_every_chain_passes():
+    """
+    Tests that the `collect()` scope exits silently when no condition fails.
+    """
+    # Act
+    with Condition.collect() as errors:
+        Condition.requires_num(50, 'age').is_in_range(0, 100)
+
+    # Assert
+    assert len(errors) == 0
+
+
+def test_collect_stops_chain_at_first_failure():
+    """
+    Tests that a failing chain records only its first failure and skips its remaining conditions.
+    """
+    # Act
+    with raises(ArgumentErrorGroup) as excinfo:
+        with Condition.collect():
+            Condition.requires_num(-5, 'age').is_positive().is_greater_than(0).is_in_range(0, 100)
+
+    # Assert
+    assert len(excinfo.value.exceptions) == 1
+
+
+def test_collect_failing_chain_keeps_value():
+    """
+    Tests that a chain which failed inside the `collect()` scope still returns its value from `get_value()`.
+    """
+    # Act
+    with raises(ArgumentErrorGroup):
+        with Condition.collect():
+            value = Condition.requires_num(-5, 'age').is_positive().is_greater_than(0).get_value()
+
+    # Assert
+    assert value == -5
+
+
+def test_collect_records_errors_without_traceback():
+    """
+    Tests that the recorded errors were never raised, so they hold no traceback.
+    """
+    # Act
+    with raises(ArgumentErrorGroup) as excinfo:
+        with Condition.collect() as errors:
+            Condition.requires_str('', 'name').is_not_null_or_empty()
+
+            recorded = list(errors)
+
+    # Assert
+    assert recorded[0].__traceback__ is None
+    assert excinfo.value.exceptions[0] is recorded[0]
+
+
+def test_collect_lets_other_exceptions_propagate():
+    """
+    Tests that an exception raised within the scope propagates instead of the group.
+    """
+    # Act/Assert
+    with raises(KeyError):
+        with Condition.collect():
+            Condition.requires_num(150, 'age').is_in_range(0, 100)
+            raise KeyError('key')
+
+
+def test_collect_restores_raising_on_exit():
+    """
+    Tests that conditions raise as usual once the scope has exited.
+    """
+    # Arrange
+    with raises(ArgumentErrorGroup):
+        with Condition.collect():
+            Condition.requires_num(150, 'age').is_in_range(0, 100)
+
+    # Act/Assert
+    assert ErrorCollector.active() is None
+
+    with raises(ArgumentOutOfRangeError):
+        Condition.requires_num(150, 'age').is_in_range(0, 100)
+
+
+def test_collect_nested_scopes_collect_separately():
+    """
+    Tests that a nested scope collects its own failures, which reach the outer scope as a group.
+    """
+    # Act
+    with raises(ArgumentErrorGroup) as excinfo:
+        with Condition.collect() as outer:
+            Condition.requires_num(150, 'age').is_in_range(0, 100)
+
+            with raises(ArgumentErrorGroup) as inner:
+                with Condition.collect():
+                    Condition.requires_str(None, 'name').is_not_null()
+
+    # Assert
+    assert len(inner.value.exceptions) == 1
+    assert len(outer) == 1
+    assert excinfo.value.exceptions[0].argument_name == 'age'
+
+
+def test_collect_does_not_affect_check_validators():
+    """
+    Tests that check validators still return their result within the scope.
+    """
+    # Act
+    with Condition.collect() as errors:
+        result = Condition.check_num(150, 'age').is_in_range(0, 100)
+
+    # Assert
+    assert not result
+    assert len(errors) == 0
+
+
+@pytest.mark.parametrize('value, expected', [('abc', 0), ('', 1)])
+def test_collect_compiled_plan_records_failures(value, expected):
+    """
+    Tests that a compiled plan records its failures within the scope.
+    """
+    # Arrange
+    plan = Condition.plan_str('name').is_not_null_or_empty().compile()
+
+    # Act
+    try:
+        with Condition.collect() as errors:
+            plan(value)
+    except ArgumentErrorGroup:
+        pass
+
+    # Assert
+    assert len(errors) == expected
+
+
+@pytest.mark.parametrize('replayed_first', [False, True])
+def test_collect_compiled_plan_stops_at_first_failure(replayed_first):
+    """
+    Tests that a compiled plan records only its first failure within the scope and still returns the value,
+    whether that failure is found by an inlined condition or by a condition replayed on a validator.
+    """
+    # Arrange
+    plan = Condition.plan_num('age')
+
+    if replayed_first:
+        plan.is_in_range(min_value=0, max_value=100)
+
+    plan = plan.is_positive().is_greater_than(0).is_in_range(min_value=0, max_value=100).compile()
+
+    # Act
+    with raises(ArgumentErrorGroup):
+        with Condition.collect() as errors:
+            actual = plan(-5)
+
+    # Assert
+    assert len(errors) == 1
+    assert actual == -5
+
+
+def test_collect_batch_failures_are_not_recorded():
+    """
+    Tests that batch validation reports failures through its bitmaps rather than the scope.
+    """
+    # Act
+    with Condition.collect() as errors:
+        failures = Condition.requires_str_batch(['abc', ''], 'names').is_not_null_or_empty().failures
+
+    # Assert
+    assert len(errors) == 0
+    assert failures[0][1].count() == 1
@@ -0,0 +1,62 @@
+import pytest
+from src.validators.noop_validator import NoopValidator
+
+
+@pytest.mark.parametrize(
+    'condition,args',
+    [
+        ('is_true', ()),
+        ('is_in_range', (1, 10)),
+        ('is_of_type', (str,)),
+        ('is_regex_match', (r'^\d+$',)),
+        ('is_shorter_than', (5,)),
+        ('rebind', (5, 'value'))
+    ]
+)
+def test_conditions_return_validator_self(condition: str, args: tuple):
+    """
+    Tests that every condition of the no-op validator passes and returns the validator itself.
+    """
+    # Arrange
+    validator = NoopValidator(5)
+
+    # Act
+    validator_returned = getattr(validator, condition)(*args)
+
+    # Assert
+    assert validator_returned is validator
+
+
+def test_get_value_returns_value():
+    """
+    Tests that the `get_value()` method of the no-op validator returns the value it stands in for.
+    """
+    # Arrange
+    value = ['a', 'b']
+
+    # Act / Assert
+    assert NoopValidator(value).get_value() is value
+
+
+def test_rebind_replaces_value():
+    """
+    Tests that the `rebind()` method of the no-op validator replaces the value it returns.
+    """
+    # Arrange
+    validator = NoopValidator(1)
+
+    # Act
+    validator.rebind(2, 'value')
+
+    # Assert
+    assert validator.get_value() == 2
+
+
+def test_unknown_condition_throws_error():
+    """
+    Tests that the no-op validator only stands in for conditions which exist on the validators.
+    """
+    # Assert
+    with pytest.raises(AttributeError):
+        # Act
+        NoopValidator(1).is_not_a_condition()
@@ -0,0 +1,159 @@
+import pytest
+from src.errors.argument_out_of_range_error import ArgumentOutOfRangeError
+from src.validators import number_array_validator
+from src.validators.number_array_validator import NumberArrayValidator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+requires_numpy = pytest.mark.skipif(numpy is None, reason='NumPy is not installed')
+
+
+def test_constructor_throws_error_without_numpy(monkeypatch):
+    """
+    Tests that creating an array validator throws an ImportError when NumPy is not installed.
+    """
+    # Arrange
+    monkeypatch.setattr(number_array_validator, 'numpy', None)
+
+    # Assert
+    with pytest.raises(ImportError):
+        # Act
+        NumberArrayValidator([1, 2, 3], 'value')
+
+
+@requires_numpy
+@pytest.mark.parametrize(
+    'condition,args',
+    [
+        ('is_in_range', (0, 10)),
+        ('is_not_in_range', (20, 30)),
+        ('is_greater_than', (0,)),
+        ('is_greater_or_equal', (1,)),
+        ('is_less_than', (10,)),
+        ('is_less_or_equal', (9,)),
+        ('is_not_equal_to', (5,)),
+        ('is_positive', ())
+    ]
+)
+def test_conditions_accept_valid_array(condition: str, args: tuple):
+    """
+    Tests that the conditions do not throw an ArgumentOutOfRangeError when every element is valid.
+    """
+    # Arrange
+    validator = NumberArrayValidator(numpy.array([1, 4, 9]), 'value')
+
+    # Act
+    validator_returned = getattr(validator, condition)(*args)
+
+    # Assert
+    assert validator_returned is validator
+
+
+@requires_numpy
+@pytest.mark.parametrize(
+    'condition,args',
+    [
+        ('is_in_range', (0, 5)),
+        ('is_greater_than', (2,)),
+        ('is_less_or_equal', (3,)),
+        ('is_equal_to', (1,)),
+        ('is_negative', ())
+    ]
+)
+def test_conditions_throw_error_on_invalid_array(condition: str, args: tuple):
+    """
+    Tests that the conditions throw an ArgumentOutOfRangeError when any element is invalid.
+    """
+    # Arrange
+    validator = NumberArrayValidator(numpy.array([1, 4, 9]), 'value')
+
+    # Assert
+    with pytest.raises(ArgumentOutOfRangeError):
+        # Act
+        getattr(validator, condition)(*args)
+
+
+@requires_numpy
+def test_error_reports_count_and_first_indices():
+    """
+    Tests that the error reports the number of offending elements and the indices of the first of them.
+    """
+    # Arrange
+    values = numpy.arange(100)
+    validator = NumberArrayValidator(values, 'value')
+
+    # Act
+    with pytest.raises(ArgumentOutOfRangeError) as excinfo:
+        validator.is_less_than(50)
+
+    # Assert
+    assert excinfo.value.message_args['failure_count'] == 50
+    assert excinfo.value.message_args['failure_indices'] == list(range(50, 50 + NumberArrayValidator.MAX_REPORTED_INDICES))
+    assert excinfo.value.max_value == 50
+    assert '`50` element(s)' in str(excinfo.value)
+
+
+@requires_numpy
+def test_error_reports_multi_dimensional_indices():
+    """
+    Tests that the error reports the indices of multi-dimensional arrays as tuples.
+    """
+    # Arrange
+    validator = NumberArrayValidator(numpy.array([[1, 2], [3, -4]]), 'value')
+
+    # Act
+    with pytest.raises(ArgumentOutOfRangeError) as excinfo:
+        validator.is_positive()
+
+    # Assert
+    assert excinfo.value.message_args['failure_indices'] == [(1, 1)]
+
+
+@requires_numpy
+def test_is_in_range_skips_array_pass_for_dtype_within_bounds():
+    """
+    Tests that an integer dtype whose representable range lies within the bounds passes without reading the array.
+    """
+    # Arrange
+    validator = NumberArrayValidator(numpy.array([-128, 0, 127], dtype=numpy.int8), 'value')
+
+    # Act
+    validator.is_in_range(-1000, 1000)
+
+    # Assert
+    assert validator._extrema is None
+
+
+@requires_numpy
+def test_is_in_range_accepts_array_from_extrema():
+    """
+    Tests that the extrema of the array are computed once and shared by the conditions of the chain.
+    """
+    # Arrange
+    validator = NumberArrayValidator(numpy.array([1.5, 2.5, 3.5]), 'value')
+
+    # Act
+    validator.is_in_range(1, 4).is_greater_than(1)
+
+    # Assert
+    assert validator._extrema == (1.5, 3.5)
+
+
+@requires_numpy
+def test_is_in_range_ignores_nan_when_computing_extrema():
+    """
+    Tests that NaN elements do not hide the elements which violate the bounds.
+    """
+    # Arrange
+    validator = NumberArrayValidator(numpy.array([numpy.nan, 2.0, 50.0]), 'value')
+
+    # Act
+    with pytest.raises(ArgumentOutOfRangeError) as excinfo:
+        validator.is_in_range(0, 10)
+
+    # Assert
+    assert excinfo.value.message_args['failure_indices'] == [2]
@@ -1,3 +1,4 @@
+import abc
 import pytest
 from tests.unit.type_example import TypeExample
 from tests.unit.type_example import TypeExample2
@@ -5,6 +6,7 @@ from tests.unit.type_example import TypeExample3
 from tests.unit.type_example import TypeEqualityExample
 from src.errors.argument_error import ArgumentError
 from src.errors.argument_null_error import ArgumentNullError
+from src.helpers.fingerprint import Fingerprint
 from src.validators.object_validator import ObjectValidator
 
 
@@ -751,4 +753,186 @@ def test_is_not_equal_using_ne_returns_validator_self():
     validator_returned = validator.is_not_equal_to_using_ne(expected)
 
     # Assert
-    assert validator_returned is validator
\ No newline at end of file
+    assert validator_returned is validator
+
+def test_is_of_type_sees_abc_registration_after_cached_check():
+    """
+    Tests that the `is_of_type()` method accepts a value once its class has been registered with an ABC,
+    even after a failed check was cached.
+    """
+    # Arrange
+    class Registry(abc.ABC):
+        pass
+
+    class Registered:
+        pass
+
+    with pytest.raises(ArgumentError):
+        ObjectValidator(Registered(), 'value').is_of_type(Registry)
+
+    # Act
+    Registry.register(Registered)
+    validator = ObjectValidator(Registered(), 'value')
+
+    # Assert
+    assert validator.is_of_type(Registry) is validator
+
+
+def test_is_not_of_type_reports_matching_type_before_non_class():
+    """
+    Tests that the `is_not_of_type()` method reports the first matching type before it reaches an argument which is not a class.
+    """
+    # Arrange
+    validator = ObjectValidator(1, 'value')
+
+    # Act
+    with pytest.raises(ArgumentError) as excinfo:
+        validator.is_not_of_type(int, 5)
+
+    # Assert
+    assert excinfo.value.message_args['expected_type'] == 'int'
+
+
+def test_is_of_type_name_distinguishes_name_collisions_when_qualified():
+    """
+    Tests that the `is_of_type_name()` method only tells apart classes sharing a `__name__` when `qualified` is set.
+    """
+    # Arrange
+    actual = type('Collision', (object,), {'__qualname__': 'first.Collision'})()
+    expected = type('Collision', (object,), {'__qualname__': 'second.Collision'})()
+    validator = ObjectValidator(actual, 'actual')
+
+    # Act
+    validator.is_of_type_name(expected)
+    validator.is_not_of_type_name(expected, qualified=True)
+
+    # Assert
+    with pytest.raises(ArgumentError) as excinfo:
+        validator.is_of_type_name(expected, qualified=True)
+
+    assert excinfo.value.message_args['actual_type'].endswith('first.Collision')
+
+
+def test_is_equal_to_reports_path_of_first_difference():
+    """
+    Tests that the `is_equal_to()` method reports where two object graphs differ.
+    """
+    # Arrange
+    actual = TypeExample2()
+    actual.value = {'lines': [1, 2, 3]}
+    expected = TypeExample2()
+    expected.value = {'lines': [1, 2, 4]}
+    validator = ObjectValidator(actual, 'order')
+
+    # Act
+    with pytest.raises(ArgumentError) as excinfo:
+        validator.is_equal_to(expected)
+
+    # Assert
+    assert excinfo.value.message_args['path'] == "order.value['lines'][2]"
+
+
+def test_is_equal_to_compares_slotted_objects():
+    """
+    Tests that the `is_equal_to()` method compares objects which have `__slots__` rather than a `__dict__`.
+    """
+    # Arrange
+    class Slotted:
+        __slots__ = ('value',)
+
+        def __init__(self, value: int):
+            self.value = value
+
+    validator = ObjectValidator(Slotted(1), 'value')
+
+    # Act
+    validator_returned = validator.is_equal_to(Slotted(1)).is_not_equal_to(Slotted(2))
+
+    # Assert
+    assert validator_returned is validator
+
+
+@pytest.mark.parametrize(
+    'condition',
+    [
+        'is_equal_to',
+        'is_equal_to_using_eq'
+    ]
+)
+@pytest.mark.parametrize('verify', [False, True])
+def test_equality_conditions_compare_fingerprints(condition: str, verify: bool):
+    """
+    Tests that the equality conditions accept equal values and reject different values in fingerprint mode.
+    """
+    # Arrange
+    reference = {'services': [{'port': 80, 'hosts': ['a', 'b']}]}
+    equal = {'services': [{'port': 80, 'hosts': ['a', 'b']}]}
+    different = {'services': [{'port': 81, 'hosts': ['a', 'b']}]}
+
+    # Act
+    validator = getattr(ObjectValidator(equal, 'config'), condition)(reference, fingerprint=True, verify=verify)
+
+    # Assert
+    assert validator.get_value() is equal
+
+    with pytest.raises(ArgumentError):
+        getattr(ObjectValidator(different, 'config'), condition)(reference, fingerprint=True, verify=verify)
+
+
+def test_is_equal_to_confirms_equal_fingerprints_by_default(monkeypatch):
+    """
+    Tests that the `is_equal_to()` method confirms equal fingerprints with a full comparison unless `verify` is cleared.
+    """
+    # Arrange
+    monkeypatch.setattr(Fingerprint, 'of', staticmethod(lambda value: 0))
+    monkeypatch.setattr(Fingerprint, 'compute', staticmethod(lambda value: 0))
+    validator = ObjectValidator([1], 'value')
+
+    # Act
+    validator.is_equal_to([2], fingerprint=True, verify=False)
+
+    # Assert
+    with pytest.raises(ArgumentError):
+        validator.is_equal_to([2], fingerprint=True)
+
+
+@pytest.mark.parametrize(
+    'condition',
+    [
+        'is_equal_to',
+        'is_equal_to_using_eq'
+    ]
+)
+def test_equality_conditions_reject_colliding_fingerprints(condition: str):
+    """
+    Tests that the equality conditions reject values whose fingerprints collide, as `hash(-1) == hash(-2)`.
+    """
+    # Arrange
+    validator = ObjectValidator([-2], 'value')
+
+    # Act/Assert
+    with pytest.raises(ArgumentError):
+        getattr(validator, condition)([-1], fingerprint=True)
+
+
+@pytest.mark.parametrize('verify', [True, False])
+def test_equality_conditions_see_value_modified_between_checks(verify: bool):
+    """
+    Tests that the fingerprint of the given value is not cached, so a live value modified between two checks against
+    the same snapshot is compared as it is now.
+    """
+    # Arrange
+    Fingerprint.clear_cache()
+    value = {'port': 81}
+    reference = {'port': 80}
+
+    with pytest.raises(ArgumentError):
+        ObjectValidator(value, 'value').is_equal_to(reference, fingerprint=True, verify=verify)
+
+    value['port'] = 80
+    ObjectValidator(value, 'value').is_equal_to(reference, fingerprint=True, verify=verify)
+    value['port'] = 82
+
+    # Act/Assert
+    with pytest.raises(ArgumentError):
+        ObjectValidator(value, 'value').is_equal_to(reference, fingerprint=True, verify=verify)
@@ -0,0 +1,110 @@
+import pytest
+from src.errors.argument_error import ArgumentError
+from src.validators.string_batch_validator import StringBatchValidator
+
+
+VALUES = ['AB-1', '', None, 'AB-' + '1' * 70, 'AB-22', 'ab-3']
+
+
+def test_failures_records_bitmap_per_condition():
+    """
+    Tests that every condition records the values which failed it, without stopping at the first invalid value.
+    """
+    # Arrange
+    validator = StringBatchValidator(VALUES, 'sku')\
+        .is_not_null_or_whitespace()\
+        .is_shorter_or_equal(64)\
+        .is_regex_match(r'^AB-\d+$')
+
+    # Act
+    failures = validator.failures
+
+    # Assert
+    assert [name for name, bitmap in failures] == ['is_not_null_or_whitespace', 'is_shorter_or_equal', 'is_regex_match']
+    assert list(failures[0][1].indices()) == [1, 2]
+    assert list(failures[1][1].indices()) == [2, 3]
+    assert list(failures[2][1].indices()) == [1, 2, 5]
+
+
+def test_failures_evaluates_conditions_without_predicate():
+    """
+    Tests that conditions which are not inlined are still evaluated for every value.
+    """
+    # Arrange
+    validator = StringBatchValidator(['Red', 'green', 'blue'], 'colour')\
+        .is_in_set_case_insensitive(['RED', 'GREEN'])
+
+    # Act
+    name, bitmap = validator.failures[0]
+
+    # Assert
+    assert list(bitmap.indices()) == [2]
+
+
+def test_is_valid_returns_true_when_every_value_passes():
+    """
+    Tests that the `is_valid()` method returns `True` when no value failed any condition.
+    """
+    # Arrange
+    validator = StringBatchValidator(iter(['a', 'bc']), 'value').is_not_null().is_shorter_than(3)
+
+    # Act / Assert
+    assert validator.is_valid() == True
+    assert validator.raise_if_failed() is validator
+
+
+def test_raise_if_failed_reports_invalid_values():
+    """
+    Tests that the `raise_if_failed()` method throws an ArgumentError reporting every invalid value.
+    """
+    # Arrange
+    validator = StringBatchValidator(VALUES, 'sku').is_not_null_or_whitespace().is_shorter_or_equal(64)
+
+    # Act
+    with pytest.raises(ArgumentError) as excinfo:
+        validator.raise_if_failed()
+
+    # Assert
+    assert excinfo.value.message_args['failure_count'] == 3
+    assert excinfo.value.message_args['failure_indices'] == [1, 2, 3]
+
+
+def test_adding_condition_resets_failures():
+    """
+    Tests that adding a condition after the failures were evaluated evaluates the batch again.
+    """
+    # Arrange
+    validator = StringBatchValidator(['a', 'abc'], 'value').is_not_null()
+    assert validator.is_valid()
+
+    # Act
+    validator.is_shorter_than(2)
+
+    # Assert
+    assert validator.is_valid() == False
+
+
+def test_rebind_keeps_conditions_and_resets_failures():
+    """
+    Tests that the `rebind()` method evaluates the conditions of the chain again against the new values.
+    """
+    # Arrange
+    validator = StringBatchValidator(['a', 'b'], 'value').is_shorter_than(2)
+    assert validator.is_valid()
+
+    # Act
+    validator.rebind(('a', 'abc'), 'other')
+
+    # Assert
+    assert validator.is_valid() == False
+    assert validator.argument_name == 'other'
+
+
+def test_unknown_condition_throws_error():
+    """
+    Tests that only conditions of the string validator can be added to the batch.
+    """
+    # Assert
+    with pytest.raises(AttributeError):
+        # Act
+        StringBatchValidator(['a'], 'value').is_not_a_condition()
@@ -2,6 +2,12 @@ import pytest
 from src.errors.argument_error import ArgumentError
 from src.errors.argument_pattern_error import ArgumentPatternError
 from src.errors.argument_null_error import ArgumentNullError
+from src.errors.argument_pattern_timeout_error import ArgumentPatternTimeoutError
+from src.helpers.affix_trie import AffixTrie
+from src.helpers.aho_corasick import AhoCorasick
+from src.helpers.regex_helper import RegexHelper
+from src.helpers.regex_set import RegexSet
+from src.helpers.set_index import SetIndex
 from src.validators.string_validator import StringValidator
 
 
@@ -1878,4 +1884,343 @@ def test_is_not_in_set_case_insensitive_returns_validator_self():
     validator_returned = validator.is_not_in_set_case_insensitive(set)
 
     # Assert
-    assert validator_returned is validator
\ No newline at end of file
+    assert validator_returned is validator
+
+def test_is_in_set_accepts_set_index():
+    """
+    Tests that the `is_in_set()` and `is_not_in_set()` methods accept a prebuilt `SetIndex`.
+    """
+    # Arrange
+    index = SetIndex([f'value_{number}' for number in range(100)])
+
+    # Act
+    StringValidator('value_42', 'value').is_in_set(index)
+    StringValidator('value_100', 'value').is_not_in_set(index)
+
+    # Assert
+    with pytest.raises(ArgumentError):
+        StringValidator('value_100', 'value').is_in_set(index)
+    with pytest.raises(ArgumentError):
+        StringValidator('value_42', 'value').is_not_in_set(index)
+
+
+@pytest.mark.parametrize('factory', [(list), (set)])
+@pytest.mark.parametrize('case_insensitive', [False, True])
+def test_set_conditions_see_collections_modified_in_place(case_insensitive: bool, factory: type):
+    """
+    Tests that the set conditions answer from the current contents of a list or set which was modified in place.
+    """
+    # Arrange
+    allowed = factory(f'u{number}' for number in range(20))
+    suffix = '_case_insensitive' if case_insensitive else ''
+    getattr(StringValidator('u1', 'value'), 'is_in_set' + suffix)(allowed)
+
+    # Act
+    allowed.remove('u1')
+    allowed.add('revoked') if factory is set else allowed.append('revoked')
+
+    # Assert
+    getattr(StringValidator('revoked', 'value'), 'is_in_set' + suffix)(allowed)
+    getattr(StringValidator('u1', 'value'), 'is_not_in_set' + suffix)(allowed)
+
+    with pytest.raises(ArgumentError):
+        getattr(StringValidator('u1', 'value'), 'is_in_set' + suffix)(allowed)
+
+
+def test_does_not_contain_any_sees_needles_modified_in_place():
+    """
+    Tests that the `does_not_contain_any()` method checks against the current needles of a list modified in place.
+    """
+    # Arrange
+    banned = ['secret', 'token']
+    StringValidator('hello world', 'value').does_not_contain_any(banned)
+
+    # Act
+    banned[0] = 'hello'
+
+    # Assert
+    with pytest.raises(ArgumentError):
+        StringValidator('hello world', 'value').does_not_contain_any(banned)
+
+
+def test_starts_with_any_sees_prefixes_modified_in_place():
+    """
+    Tests that the `starts_with_any()` method checks against the current prefixes of a list modified in place.
+    """
+    # Arrange
+    prefixes = ['sk_live_', 'ghp_']
+    StringValidator('sk_live_123', 'value').starts_with_any(prefixes)
+
+    # Act
+    prefixes[0] = 'pk_test_'
+
+    # Assert
+    with pytest.raises(ArgumentError):
+        StringValidator('sk_live_123', 'value').starts_with_any(prefixes)
+
+
+def test_matches_none_regex_sees_patterns_modified_in_place():
+    """
+    Tests that the `matches_none_regex()` method checks against the current patterns of a list modified in place.
+    """
+    # Arrange
+    patterns = [r'AKIA[0-9A-Z]{16}', r'ghp_\w+']
+    StringValidator('sk_live_123', 'value').matches_none_regex(patterns)
+
+    # Act
+    patterns[0] = r'sk_live_\w+'
+
+    # Assert
+    with pytest.raises(ArgumentPatternError):
+        StringValidator('sk_live_123', 'value').matches_none_regex(patterns)
+
+
+def test_regex_set_conditions_handle_empty_patterns():
+    """
+    Tests that no pattern matches when the set of patterns is empty.
+    """
+    # Act
+    StringValidator('abc', 'value').matches_none_regex([])
+
+    # Assert
+    with pytest.raises(ArgumentPatternError):
+        StringValidator('abc', 'value').matches_any_regex([])
+
+
+def test_is_in_set_case_insensitive_uses_casefold_semantics():
+    """
+    Tests that the case-insensitive set conditions compare values using `str.casefold()` semantics.
+    """
+    # Arrange
+    set = ['Straße', 'Ünïcode']
+
+    # Act
+    StringValidator('STRASSE', 'value').is_in_set_case_insensitive(set)
+    StringValidator('strasse', 'value').is_in_set_case_insensitive(tuple(set))
+    StringValidator('ascii', 'value').is_not_in_set_case_insensitive(set)
+
+    # Assert
+    with pytest.raises(ArgumentError):
+        StringValidator('üNÏCODE', 'value').is_not_in_set_case_insensitive(set)
+
+
+def test_contains_any_accepts_value_containing_a_needle():
+    """
+    Tests that the `contains_any()` method does not throw an ArgumentError when the value contains any of the needles.
+    """
+    # Arrange
+    validator = StringValidator('https://example.com/path', 'value')
+
+    # Act
+    validator_returned = validator.contains_any(['ftp://', 'example.com'])
+
+    # Assert
+    assert validator_returned is validator
+
+
+def test_contains_any_throws_error_on_value_without_needles():
+    """
+    Tests that the `contains_any()` method throws an ArgumentError when the value contains none of the needles.
+    """
+    # Arrange
+    validator = StringValidator('lorem ipsum', 'value')
+
+    # Assert
+    with pytest.raises(ArgumentError):
+        # Act
+        validator.contains_any(['dolor', 'amet'])
+
+
+def test_does_not_contain_any_reports_needle_and_offset():
+    """
+    Tests that the `does_not_contain_any()` method reports the needle which was found and its offset.
+    """
+    # Arrange
+    automaton = AhoCorasick(['password', 'secret'])
+    validator = StringValidator('my secret value', 'value')
+
+    # Act
+    with pytest.raises(ArgumentError) as excinfo:
+        validator.does_not_contain_any(automaton)
+
+    # Assert
+    assert excinfo.value.message_args == {'needle': 'secret', 'offset': 3}
+    assert 'offset `3`' in str(excinfo.value)
+
+
+def test_does_not_contain_any_accepts_clean_value():
+    """
+    Tests that the `does_not_contain_any()` method does not throw an ArgumentError when the value contains no needle.
+    """
+    # Arrange
+    validator = StringValidator('hello world', 'value')
+
+    # Act
+    validator_returned = validator.does_not_contain_any(['password', 'secret'])
+
+    # Assert
+    assert validator_returned is validator
+
+
+@pytest.mark.parametrize(
+    'condition,value,affixes',
+    [
+        ('starts_with_any', 'https://example.com', ['http://', 'https://']),
+        ('does_not_start_with_any', 'ftp://example.com', ['http://', 'https://']),
+        ('ends_with_any', 'archive.tar.gz', ['.zip', '.gz']),
+        ('does_not_end_with_any', 'archive.exe', ['.zip', '.gz'])
+    ]
+)
+def test_affix_any_conditions_accept_valid_value(condition: str, value: str, affixes: list):
+    """
+    Tests that the `*_with_any()` methods do not throw an ArgumentError when the value is valid.
+    """
+    # Arrange
+    validator = StringValidator(value, 'value')
+
+    # Act
+    validator_returned = getattr(validator, condition)(affixes)
+
+    # Assert
+    assert validator_returned is validator
+
+
+@pytest.mark.parametrize(
+    'condition,value,affixes',
+    [
+        ('starts_with_any', 'ftp://example.com', ['http://', 'https://']),
+        ('does_not_start_with_any', 'https://example.com', ['http://', 'https://']),
+        ('ends_with_any', 'archive.exe', ['.zip', '.gz']),
+        ('does_not_end_with_any', 'archive.tar.gz', ['.zip', '.gz'])
+    ]
+)
+def test_affix_any_conditions_throw_error_on_invalid_value(condition: str, value: str, affixes: list):
+    """
+    Tests that the `*_with_any()` methods throw an ArgumentError when the value is invalid.
+    """
+    # Arrange
+    validator = StringValidator(value, 'value')
+
+    # Assert
+    with pytest.raises(ArgumentError):
+        # Act
+        getattr(validator, condition)(affixes)
+
+
+def test_does_not_end_with_any_reports_matching_suffix():
+    """
+    Tests that the `does_not_end_with_any()` method reports the suffix which the value ends with.
+    """
+    # Arrange
+    trie = AffixTrie(['.exe', '.bat'], suffix=True)
+    validator = StringValidator('setup.exe', 'value')
+
+    # Act
+    with pytest.raises(ArgumentError) as excinfo:
+        validator.does_not_end_with_any(trie)
+
+    # Assert
+    assert excinfo.value.message_args == {'expected': '.exe'}
+
+
+@pytest.mark.parametrize(
+    'condition,value',
+    [
+        ('matches_any_regex', 'INV-12345678'),
+        ('matches_any_regex', 'https://example.com'),
+        ('matches_none_regex', 'ftp://example.com')
+    ]
+)
+def test_regex_set_conditions_accept_valid_value(condition: str, value: str):
+    """
+    Tests that the `matches_any_regex()` and `matches_none_regex()` methods do not throw an ArgumentError when the value is valid.
+    """
+    # Arrange
+    validator = StringValidator(value, 'value')
+
+    # Act
+    validator_returned = getattr(validator, condition)([r'^INV-\d{8}$', r'https://'])
+
+    # Assert
+    assert validator_returned is validator
+
+
+@pytest.mark.parametrize(
+    'condition,value',
+    [
+        ('matches_any_regex', 'ftp://example.com'),
+        ('matches_none_regex', 'INV-12345678')
+    ]
+)
+def test_regex_set_conditions_throw_error_on_invalid_value(condition: str, value: str):
+    """
+    Tests that the `matches_any_regex()` and `matches_none_regex()` methods throw an ArgumentPatternError when the value is invalid.
+    """
+    # Arrange
+    validator = StringValidator(value, 'value')
+
+    # Assert
+    with pytest.raises(ArgumentPatternError):
+        # Act
+        getattr(validator, condition)([r'^INV-\d{8}$', r'https://'])
+
+
+def test_matches_none_regex_reports_matching_pattern():
+    """
+    Tests that the `matches_none_regex()` method reports the pattern which the value matched.
+    """
+    # Arrange
+    regex_set = RegexSet([r'^INV-\d{8}$', r'https://'])
+    validator = StringValidator('https://example.com', 'value')
+
+    # Act
+    with pytest.raises(ArgumentPatternError) as excinfo:
+        validator.matches_none_regex(regex_set)
+
+    # Assert
+    assert excinfo.value.pattern == r'https://'
+    assert 'https://' in excinfo.value.message
+
+
+@pytest.mark.parametrize(
+    'condition,value',
+    [
+        ('is_regex_match', 'aaaa'),
+        ('is_not_regex_match', 'aa!')
+    ]
+)
+def test_guarded_regex_conditions_accept_valid_value(condition: str, value: str):
+    """
+    Tests that the guarded `is_regex_match()` and `is_not_regex_match()` methods do not throw an ArgumentError when the value is valid.
+    """
+    # Arrange
+    validator = StringValidator(value, 'value')
+
+    # Act
+    validator_returned = getattr(validator, condition)(r'(a+)+$', guarded=True)
+
+    # Assert
+    assert validator_returned is validator
+
+
+@pytest.mark.parametrize(
+    'condition',
+    [
+        'is_regex_match',
+        'is_not_regex_match'
+    ]
+)
+def test_guarded_regex_conditions_throw_timeout_error_on_catastrophic_backtracking(monkeypatch, condition: str):
+    """
+    Tests that the guarded regex conditions throw an ArgumentPatternTimeoutError when the match exceeds its time budget.
+    """
+    # Arrange
+    monkeypatch.setattr(RegexHelper, 'GUARDED_TIMEOUT', 0.2)
+    validator = StringValidator('a' * 64 + '!', 'value')
+
+    # Act
+    with pytest.raises(ArgumentPatternTimeoutError) as excinfo:
+        getattr(validator, condition)(r'(a+)+$', guarded=True)
+
+    # Assert
+    assert excinfo.value.timeout == 0.2
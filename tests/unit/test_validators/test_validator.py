@@ -1,4 +1,14 @@
+import gc
+import sys
+import traceback
 import pytest
+from src.condition import Condition
+from src.errors.argument_error import ArgumentError
+from src.errors.argument_out_of_range_error import ArgumentOutOfRangeError
+from src.validators.boolean_validator import BooleanValidator
+from src.validators.number_validator import NumberValidator
+from src.validators.object_validator import ObjectValidator
+from src.validators.string_validator import StringValidator
 from src.validators.validator import Validator
 
 
@@ -46,4 +56,152 @@ def test_get_value_returns_value(value, argument_name):
     # Assert
     assert actual == value
     assert actual is value
-    assert type(actual) == type(value)
\ No newline at end of file
+    assert type(actual) == type(value)
+
+@pytest.mark.parametrize(
+    'validator_type',
+    [
+        (Validator),
+        (BooleanValidator),
+        (NumberValidator),
+        (ObjectValidator),
+        (StringValidator)
+    ]
+)
+def test_validators_do_not_have_instance_dict(validator_type: type):
+    """
+    Tests that the validators store their state in `__slots__` rather than a per-instance `__dict__`.
+    """
+    # Arrange / Act
+    validator = validator_type('value', 'argument_name')
+
+    # Assert
+    assert not hasattr(validator, '__dict__')
+
+
+def _fail_after_handled_error() -> ArgumentOutOfRangeError:
+    try:
+        {}['missing']
+    except KeyError:
+        try:
+            NumberValidator(150, 'value').is_in_range(0, 100)
+        except ArgumentOutOfRangeError as error:
+            return error
+
+
+@pytest.mark.parametrize('lightweight', [(False), (True)])
+def test_fail_does_not_create_reference_cycles(lightweight: bool):
+    """
+    Tests that a raised error does not form a reference cycle with the frames of its traceback.
+    """
+    # Arrange
+    Condition.use_lightweight_errors(lightweight)
+    gc.collect()
+    gc.disable()
+
+    try:
+        # Act
+        for _ in range(10):
+            _fail_after_handled_error()
+
+        collected = gc.collect()
+    finally:
+        gc.enable()
+        Condition.use_lightweight_errors(False)
+
+    # Assert
+    assert collected == 0
+
+
+def test_fail_keeps_full_traceback_by_default():
+    """
+    Tests that a raised error keeps every frame in its traceback and its context by default.
+    """
+    # Act
+    error = _fail_after_handled_error()
+
+    # Assert
+    names = [frame.name for frame in traceback.extract_tb(error.__traceback__)]
+    assert names == ['_fail_after_handled_error', 'is_in_range', '_fail']
+    assert isinstance(error.__context__, KeyError)
+
+
+def test_fail_trims_traceback_of_lightweight_errors():
+    """
+    Tests that a lightweight error only keeps the caller and the failed condition in its traceback,
+    without a context.
+    """
+    # Arrange
+    Condition.use_lightweight_errors()
+
+    try:
+        # Act
+        error = _fail_after_handled_error()
+    finally:
+        Condition.use_lightweight_errors(False)
+
+    # Assert
+    names = [frame.name for frame in traceback.extract_tb(error.__traceback__)]
+    assert names == ['_fail_after_handled_error', 'is_in_range'] + (['_fail'] if sys.version_info < (3, 11) else [])
+    assert error.__context__ is None
+    assert error.value == 150
+
+
+def test_fail_does_not_pin_value_in_traceback_of_lightweight_errors():
+    """
+    Tests that the frames on the traceback of a lightweight error do not reference the failing value,
+    neither directly nor through the validator.
+    """
+    # Arrange
+    value = 'x' * 1000
+    validator = StringValidator(value, 'value')
+    Condition.use_lightweight_errors()
+
+    try:
+        # Act
+        with pytest.raises(ArgumentError) as excinfo:
+            validator.is_shorter_than(10)
+    finally:
+        Condition.use_lightweight_errors(False)
+
+    # Assert
+    frames = [entry[0] for entry in traceback.walk_tb(excinfo.value.__traceback__)][1:]
+    references = [
+        local
+        for frame in frames
+        for local in frame.f_locals.values()
+    ]
+    assert all(local is not value and getattr(local, 'value', None) is not value for local in references)
+    assert validator.get_value() is None
+
+
+def test_rebind_points_validator_at_value():
+    """
+    Tests that the `rebind()` method points the validator at the value and keeps the argument name if none is given.
+    """
+    # Arrange
+    validator = NumberValidator(1, 'value')
+
+    # Act
+    actual = validator.rebind(2)
+
+    # Assert
+    assert actual is validator
+    assert validator.value == 2
+    assert validator.argument_name == 'value'
+
+
+def test_rebind_replaces_argument_name():
+    """
+    Tests that the `rebind()` method replaces the argument name reported by errors.
+    """
+    # Arrange
+    validator = NumberValidator(1, 'first')
+
+    # Act
+    with pytest.raises(ArgumentOutOfRangeError) as excinfo:
+        validator.rebind(150, 'second').is_in_range(0, 100)
+
+    # Assert
+    assert excinfo.value.argument_name == 'second'
+    assert excinfo.value.value == 150
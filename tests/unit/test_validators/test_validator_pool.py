@@ -0,0 +1,81 @@
+import threading
+import tracemalloc
+import pytest
+from src.validators.number_validator import NumberValidator
+from src.validators.string_validator import StringValidator
+from src.validators.validator_pool import ValidatorPool
+
+
+@pytest.fixture(autouse=True)
+def clear_pool():
+    ValidatorPool.clear()
+    yield
+    ValidatorPool.clear()
+
+
+def test_get_returns_same_validator_rebound_to_value():
+    """
+    Tests that the `get()` method returns the same validator of each type, rebound to every value.
+    """
+    # Act
+    first = ValidatorPool.get(NumberValidator, 1, 'first')
+    second = ValidatorPool.get(NumberValidator, 2, 'second')
+
+    # Assert
+    assert second is first
+    assert second.value == 2
+    assert second.argument_name == 'second'
+
+
+def test_get_keeps_one_validator_per_type():
+    """
+    Tests that the `get()` method keeps a separate validator for each validator type.
+    """
+    # Act
+    number_validator = ValidatorPool.get(NumberValidator, 1, 'value')
+    string_validator = ValidatorPool.get(StringValidator, 'a', 'value')
+
+    # Assert
+    assert isinstance(number_validator, NumberValidator)
+    assert isinstance(string_validator, StringValidator)
+    assert number_validator.value == 1
+
+
+def test_get_keeps_one_validator_per_thread():
+    """
+    Tests that the `get()` method returns a different validator on every thread.
+    """
+    # Arrange
+    validators = []
+    thread = threading.Thread(target=lambda: validators.append(ValidatorPool.get(NumberValidator, 2, 'value')))
+
+    # Act
+    validator = ValidatorPool.get(NumberValidator, 1, 'value')
+    thread.start()
+    thread.join()
+
+    # Assert
+    assert validators[0] is not validator
+    assert validator.value == 1
+
+
+def test_get_does_not_allocate_on_passing_values():
+    """
+    Tests that validating passing values with a pooled validator allocates no memory.
+    """
+    # Arrange
+    ValidatorPool.get(NumberValidator, 0, 'value').is_in_range(0, 100)
+    values = list(range(64)) * 16
+
+    # Act
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    for value in values:
+        ValidatorPool.get(NumberValidator, value, 'value').is_in_range(0, 100).is_positive()
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Assert
+    assert after - before == 0